@@ -5,13 +5,35 @@ Generates AI prompts for legal/compliance discovery research.
 
 from __future__ import annotations
 
+import functools
+import os
+import time
+from collections import deque
 from datetime import datetime
+from typing import NamedTuple, Optional
 
 import streamlit as st
 
+from components import metrics
+from components.cache import get_cached_prompt, iter_cached_workflow
+from components.dossier import dossier_filename, get_dossier
 from components.email_templates import EmailTemplateGenerator
+from components.options import (
+    GEOGRAPHIC_OPTIONS,
+    INDUSTRY_OPTIONS,
+    LANGUAGE_OPTIONS,
+    LEGAL_ENTITY_OPTIONS,
+    PRODUCT_OPTIONS,
+    REVENUE_SIZE_OPTIONS,
+    TRANSACTION_TYPE_OPTIONS,
+)
+from components.preset_store import PresetStore
+from components.profiling import KEEP_RERUNS, RerunProfile, RerunProfiler
 from components.presets import ProspectPreset, export_preset_bytes, load_preset_into_state
 from components.recipes import PromptRecipeManager, ProspectContext
+from components.resources import ENABLED as WARM_UP_ENABLED, WarmUp
+from components.session_store import SessionOutputStore, StoredOutput
+from components.tokens import DEFAULT_TOKEN_BUDGET, FittedPrompt, fit_prompt, fit_workflow, prompt_tokens
 from components.writing_checker import check_plain_english, get_writing_tips
 
 # ============================================================================
@@ -25,44 +47,261 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# st.fragment (Streamlit 1.37+, experimental_fragment before that) reruns only the
+# decorated function when a widget inside it is used, instead of the whole script.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Streamlit 1.52+ accepts a callable as download data (with on_click="ignore") and
+# calls it only when the button is clicked; older ones need the bytes on every rerun.
+DEFERRED_DOWNLOADS_SINCE = (1, 52)
+DEFERRED_DOWNLOADS = tuple(int(part) for part in st.__version__.split(".")[:2]) >= DEFERRED_DOWNLOADS_SINCE
+
 # ============================================================================
 # SESSION STATE INITIALIZATION
 # ============================================================================
 
+SESSION_DEFAULTS = {
+    "company_name": "",
+    "industry": "",
+    "deal_type": "",
+    "legal_entity_type": "",
+    "revenue_size": "",
+    "geographic_scope": "",
+    "additional_context": "",
+    "product_interest": "",
+    "locale": "en",
+    "token_budget": DEFAULT_TOKEN_BUDGET,
+    "current_phase": "phase1"
+}
+
 def init_session_state():
     """Initialize all session state variables."""
-    defaults = {
-        "company_name": "",
-        "industry": "",
-        "deal_type": "",
-        "legal_entity_type": "",
-        "revenue_size": "",
-        "geographic_scope": "",
-        "additional_context": "",
-        "product_interest": "",
-        "current_phase": "phase1"
-    }
-    
-    for key, value in defaults.items():
+    for key, value in SESSION_DEFAULTS.items():
         if key not in st.session_state:
             st.session_state[key] = value
+    if "output_store" not in st.session_state:
+        st.session_state.output_store = SessionOutputStore()
+    if "rerun_timings" not in st.session_state:
+        st.session_state.rerun_timings = {}
+
+@st.cache_resource(show_spinner=False)
+def get_warm_up() -> Optional[WarmUp]:
+    """
+    Build the shared engines once per server process, in a background thread.
+
+    Started by the first session's first rerun; every later session gets
+    the same (finished) WarmUp.
+    """
+    return WarmUp() if WARM_UP_ENABLED else None
+
+# ============================================================================
+# DEBUG MODE - RERUN TIMING AND METRICS
+# ============================================================================
+
+def query_param(name: str) -> Optional[str]:
+    """A URL query parameter (st.query_params is Streamlit 1.30+; older releases have the experimental getter)."""
+    if hasattr(st, "query_params"):
+        return st.query_params.get(name)
+    values = st.experimental_get_query_params().get(name)
+    return values[0] if values else None
+
+def is_debug_mode() -> bool:
+    """Debug mode is on with APP_DEBUG=1 in the environment or ?debug=1 in the URL."""
+    if os.environ.get("APP_DEBUG", "").lower() in ("1", "true", "yes"):
+        return True
+    return query_param("debug") == "1"
+
+def is_profile_mode() -> bool:
+    """Profiling is on with APP_PROFILE=1, or with ?profile=1 in the URL where APP_PROFILE_ALLOW=1."""
+    if os.environ.get("APP_PROFILE", "").lower() in ("1", "true", "yes"):
+        return True
+    # Profiled reruns trace every allocation in the process and write files: not for any visitor
+    if os.environ.get("APP_PROFILE_ALLOW", "").lower() not in ("1", "true", "yes"):
+        return False
+    return query_param("profile") == "1"
+
+def timed_render(scope: str):
+    """
+    Time each run of a render function and, in debug mode, show it under the output.
+
+    Apply below ``@fragment`` so fragment reruns are timed too. The last
+    full script run is shown alongside for comparison. With metrics
+    enabled every run is also recorded in app_rerun_seconds.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            debug = is_debug_mode()
+            if not (debug or metrics.ENABLED):
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                metrics.observe("app_rerun_seconds", elapsed, RERUN_HELP, scope=scope)
+                if debug:
+                    timings = st.session_state.rerun_timings
+                    timings[scope] = elapsed * 1000
+                    full_run = timings.get("full run")
+                    st.caption(
+                        f"⏱️ {scope}: {elapsed * 1000:.1f} ms"
+                        + (f" · last full run: {full_run:.1f} ms" if full_run is not None else "")
+                    )
+        return wrapper
+    return decorator
+
+RERUN_HELP = "Streamlit script and fragment reruns"
+
+def render_metrics_panel():
+    """Admin view of the process-wide metrics, shown in the sidebar in debug mode."""
+    with st.sidebar.expander("📈 Metrics", expanded=False):
+        if not metrics.ENABLED:
+            st.caption("Timers are off: start the app with PROMPT_METRICS=1. Cache statistics are always collected.")
+        rows = {}
+        for sample in metrics.REGISTRY.collect():
+            labels = ", ".join(f"{key}={value}" for key, value in sample.labels)
+            row = rows.setdefault((sample.name, labels), {"metric": sample.name, "labels": labels})
+            if sample.suffix == "_count":
+                row["count"] = sample.value
+            elif sample.suffix == "_sum":
+                row["mean ms"] = round(sample.value / row["count"] * 1000, 4) if row["count"] else None
+                row["total s"] = round(sample.value, 3)
+            else:
+                row["value"] = sample.value
+        st.dataframe(list(rows.values()), hide_index=True, use_container_width=True)
+        warm_up = get_warm_up()
+        report = warm_up.report if warm_up is not None else None
+        if report is not None:
+            st.caption(
+                f"Warm-up: {report.total_ms:.1f} ms ("
+                + ", ".join(f"{name} {ms:.1f}" for name, ms in report.steps.items()) + ")"
+            )
+        st.download_button(
+            "📥 Prometheus text",
+            data=metrics.render_prometheus(),
+            file_name="metrics.prom",
+            mime="text/plain",
+            key="download_metrics",
+        )
+
+def render_profile_panel(history: deque, skipped: bool = False):
+    """Sidebar view of this session's last profiled reruns, newest first."""
+    profiles: list[RerunProfile] = list(reversed(history))
+    with st.sidebar.expander("🔬 Profiler", expanded=skipped):
+        if skipped:
+            st.info("This rerun was not profiled: another session's rerun was being profiled. Rerun to try again.")
+        if not profiles:
+            return
+        st.dataframe(
+            [
+                {
+                    "rerun": profile.number,
+                    "time": f"{profile.started:%H:%M:%S}",
+                    "ms": round(profile.duration * 1000, 1),
+                    "allocated KiB": round(profile.allocated_bytes / 1024, 1),
+                    "peak KiB": round(profile.peak_bytes / 1024, 1),
+                }
+                for profile in profiles
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+        # Select by rerun number: widget values are copies, not the stored profiles
+        by_number = {profile.number: profile for profile in profiles}
+        label = lambda number: by_number[number].label
+        profile = by_number[st.selectbox("Rerun", list(by_number), format_func=label, key="profile_rerun")]
+        
+        st.markdown("**Top functions by cumulative time**")
+        st.dataframe(
+            [
+                {
+                    "function": stat.function,
+                    "calls": stat.calls,
+                    "own ms": round(stat.total_seconds * 1000, 2),
+                    "cumulative ms": round(stat.cumulative_seconds * 1000, 2),
+                }
+                for stat in profile.functions
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+        
+        st.markdown("**Top allocation sites (still held at the end of the rerun)**")
+        st.dataframe(
+            [
+                {"location": stat.location, "KiB": round(stat.size_bytes / 1024, 1), "blocks": stat.count}
+                for stat in profile.allocations
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+        
+        others = [number for number in by_number if number != profile.number]
+        if others:
+            other = by_number[st.selectbox("Compare with", others, format_func=label, key="profile_compare")]
+            st.dataframe(
+                [
+                    {
+                        "function": function,
+                        f"#{profile.number} ms": round(mine * 1000, 2),
+                        f"#{other.number} ms": round(theirs * 1000, 2),
+                        "change ms": round((mine - theirs) * 1000, 2),
+                    }
+                    for function, mine, theirs in profile.compare(other)
+                ],
+                hide_index=True,
+                use_container_width=True,
+            )
+        
+        if profile.pstats_path is not None and profile.pstats_path.exists():
+            st.caption(f"Saved to {profile.pstats_path}")
+            st.download_button(
+                "📥 Download .pstats",
+                data=profile.pstats_path.read_bytes(),
+                file_name=profile.pstats_path.name,
+                mime="application/octet-stream",
+                key="download_pstats",
+            )
+
+def get_output_store() -> SessionOutputStore:
+    """This session's generated outputs."""
+    return st.session_state.output_store
+
+def lookup_output(output_id: str, context: ProspectContext, locale: str) -> Optional[StoredOutput]:
+    """Read an output from the session store, counting hits, stale hits and misses."""
+    output = get_output_store().get(output_id, context, locale)
+    metrics.inc(
+        "session_output_lookups_total", 1, "Session output store lookups on rerun",
+        result="miss" if output is None else "stale" if output.stale else "hit",
+    )
+    return output
+
+def render_stale_warning(output: StoredOutput):
+    """Warn when an output was generated for different prospect details."""
+    if output.stale:
+        st.warning(
+            f"⚠️ Generated for earlier prospect details ({output.context.company_name or 'no company'}, "
+            f"{LANGUAGE_OPTIONS.get(output.locale, output.locale)}). "
+            "Generate again to update it."
+        )
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def get_prospect_context() -> Dict[str, str]:
-    """Extract all prospect context from session state."""
-    return {
-        "company_name": st.session_state.company_name,
-        "industry": st.session_state.industry,
-        "deal_type": st.session_state.deal_type,
-        "legal_entity_type": st.session_state.legal_entity_type,
-        "revenue_size": st.session_state.revenue_size,
-        "geographic_scope": st.session_state.geographic_scope,
-        "additional_context": st.session_state.additional_context,
-        "product_interest": st.session_state.product_interest
-    }
+def get_prospect_context() -> ProspectContext:
+    """Build a ProspectContext from the sidebar fields in session state."""
+    return ProspectContext(
+        company_name=st.session_state.company_name,
+        industry_sector=st.session_state.industry,
+        transaction_type=st.session_state.deal_type,
+        legal_entity_type=st.session_state.legal_entity_type,
+        transaction_size=st.session_state.revenue_size,
+        geographic_scope=", ".join(st.session_state.geographic_scope or []),
+        additional_notes=st.session_state.additional_context,
+        company_products=", ".join(st.session_state.product_interest or [])
+    )
 
 def render_copy_button(text: str, key: str, button_label: str = "📋 Copy to Clipboard"):
     """Render a copy-to-clipboard button."""
@@ -70,6 +309,55 @@ def render_copy_button(text: str, key: str, button_label: str = "📋 Copy to Cl
     if st.button(button_label, key=key, use_container_width=True):
         st.write("✅ Copied! (Use Ctrl+C or Cmd+C to copy the text above)")
 
+def render_token_count(prompt: str):
+    """Caption with the estimated token count, flagged when over the sidebar budget."""
+    tokens = prompt_tokens(prompt)
+    budget = st.session_state.token_budget
+    if budget and tokens > budget:
+        st.caption(f"⚠️ ~{tokens:,} tokens · over the {budget:,} budget")
+    else:
+        st.caption(f"🧮 ~{tokens:,} tokens" + (f" of {budget:,}" if budget else ""))
+
+def render_fit_report(fitted: list[FittedPrompt], names: dict[str, str]):
+    """Say which header fields were shortened to fit the token budget, and where it still does not fit."""
+    trimmed = {}
+    for prompt in fitted:
+        for field in prompt.trimmed:
+            trimmed.setdefault(field.replace("_", " "), []).append(names.get(prompt.phase_id, prompt.phase_id))
+    for field, phases in trimmed.items():
+        st.info(f"✂️ **{field.capitalize()}** shortened to fit the token budget in: {', '.join(phases)}")
+    too_long = [names.get(prompt.phase_id, prompt.phase_id) for prompt in fitted if not prompt.fits]
+    if too_long:
+        st.warning(
+            f"⚠️ Still over the token budget with the free-text fields removed: {', '.join(too_long)}. "
+            "Raise the budget in the sidebar."
+        )
+
+def render_dossier_download(context: ProspectContext, locale: str, prompts: dict[str, str]):
+    """One download for the whole workflow; the zip is built (or taken from the cache) only on click."""
+    label = "📦 Download Dossier (.zip)"
+    help_text = "Header once, every phase prompt, both email templates and a plain-English report"
+    if DEFERRED_DOWNLOADS:
+        st.download_button(
+            label=label,
+            data=lambda: get_dossier(context, locale, prompts),
+            file_name=dossier_filename(context),
+            mime="application/zip",
+            key="download_dossier",
+            help=help_text,
+            on_click="ignore",
+            use_container_width=True
+        )
+    elif st.button(label, key="prepare_dossier", help=help_text, use_container_width=True):
+        st.download_button(
+            label="⬇️ Save Dossier",
+            data=get_dossier(context, locale, prompts),
+            file_name=dossier_filename(context),
+            mime="application/zip",
+            key="download_dossier",
+            use_container_width=True
+        )
+
 def render_download_button(text: str, filename: str, key: str):
     """Render a download button for prompt text."""
     st.download_button(
@@ -81,13 +369,15 @@ def render_download_button(text: str, filename: str, key: str):
         use_container_width=True
     )
 
+@fragment
 def render_prompt_expander(
     title: str,
     prompt: str,
     filename: str,
     key_suffix: str,
     expanded: bool = False,
-    usage_note: Optional[str] = None
+    usage_note: Optional[str] = None,
+    downloadable: bool = True
 ):
     """Render an expandable section with a prompt."""
     with st.expander(title, expanded=expanded):
@@ -99,12 +389,18 @@ def render_prompt_expander(
             if st.button("📋 Copy", key=f"copy_{key_suffix}", use_container_width=True):
                 st.success("✅ Text ready to copy (use Ctrl+C / Cmd+C on the code block above)")
         with col2:
-            render_download_button(prompt, filename, f"download_{key_suffix}")
+            if downloadable:
+                render_download_button(prompt, filename, f"download_{key_suffix}")
+            render_token_count(prompt)
 
 # ============================================================================
 # SIDEBAR - PROSPECT INPUT FORM
 # ============================================================================
 
+def option_index(options, value) -> int:
+    """Position of ``value`` in a selectbox's options, so the widget shows the session value."""
+    return options.index(value) if value in options else 0
+
 def render_sidebar():
     """Render the sidebar with prospect input fields."""
     with st.sidebar:
@@ -125,35 +421,15 @@ def render_sidebar():
         
         st.session_state.industry = st.selectbox(
             "Industry/Sector*",
-            options=[
-                "",
-                "Financial Services",
-                "Healthcare/Life Sciences",
-                "Technology/Software",
-                "Manufacturing",
-                "Energy/Utilities",
-                "Real Estate",
-                "Professional Services",
-                "Retail/Consumer Goods",
-                "Other"
-            ],
-            index=0 if not st.session_state.industry else None,
+            options=INDUSTRY_OPTIONS,
+            index=option_index(INDUSTRY_OPTIONS, st.session_state.industry),
             help="Primary industry sector"
         )
         
         st.session_state.legal_entity_type = st.selectbox(
             "Legal Entity Type",
-            options=[
-                "",
-                "Public Company (Listed)",
-                "Private Company",
-                "Private Equity Owned",
-                "Family Office/HNW Owned",
-                "Government Entity",
-                "Non-Profit",
-                "Partnership/LLP",
-                "Unknown"
-            ],
+            options=LEGAL_ENTITY_OPTIONS,
+            index=option_index(LEGAL_ENTITY_OPTIONS, st.session_state.legal_entity_type),
             help="Legal structure of the organization"
         )
         
@@ -164,46 +440,21 @@ def render_sidebar():
         
         st.session_state.deal_type = st.selectbox(
             "Transaction Type",
-            options=[
-                "",
-                "M&A (Buyer)",
-                "M&A (Seller)",
-                "M&A (Target)",
-                "Private Equity Deal",
-                "Corporate Restructuring",
-                "IPO Preparation",
-                "Regulatory Compliance Project",
-                "Other/Exploratory"
-            ],
+            options=TRANSACTION_TYPE_OPTIONS,
+            index=option_index(TRANSACTION_TYPE_OPTIONS, st.session_state.deal_type),
             help="Type of transaction or engagement"
         )
         
         st.session_state.revenue_size = st.selectbox(
             "Company Size (Revenue)",
-            options=[
-                "",
-                "< $10M",
-                "$10M - $50M",
-                "$50M - $250M",
-                "$250M - $1B",
-                "$1B - $5B",
-                "$5B+",
-                "Unknown"
-            ],
+            options=REVENUE_SIZE_OPTIONS,
+            index=option_index(REVENUE_SIZE_OPTIONS, st.session_state.revenue_size),
             help="Approximate annual revenue"
         )
         
         st.session_state.geographic_scope = st.multiselect(
             "Geographic Scope",
-            options=[
-                "United Kingdom",
-                "European Union",
-                "United States",
-                "Asia-Pacific",
-                "Middle East",
-                "Latin America",
-                "Global/Multi-Regional"
-            ],
+            options=GEOGRAPHIC_OPTIONS,
             default=st.session_state.geographic_scope if st.session_state.geographic_scope else [],
             help="Primary operating regions"
         )
@@ -215,16 +466,7 @@ def render_sidebar():
         
         st.session_state.product_interest = st.multiselect(
             "LexisNexis Solutions of Interest",
-            options=[
-                "Lexis+ AI",
-                "Practical Guidance",
-                "Halsbury's Laws",
-                "Corporate Law Suite",
-                "Due Diligence Tools",
-                "Compliance & Risk Solutions",
-                "PSL (Practice Area Specific)",
-                "Not Sure/Exploratory"
-            ],
+            options=PRODUCT_OPTIONS,
             default=st.session_state.product_interest if st.session_state.product_interest else [],
             help="Products or solutions relevant to this prospect"
         )
@@ -244,17 +486,222 @@ def render_sidebar():
         
         st.markdown("---")
         
+        # Output Language
+        st.subheader("🌐 Output Language")
+        
+        st.session_state.locale = st.selectbox(
+            "Prompt Language",
+            options=list(LANGUAGE_OPTIONS),
+            index=(
+                list(LANGUAGE_OPTIONS).index(st.session_state.locale)
+                if st.session_state.locale in LANGUAGE_OPTIONS else 0
+            ),
+            format_func=LANGUAGE_OPTIONS.get,
+            help="Language the AI should answer in; header labels are translated too"
+        )
+        
+        st.markdown("---")
+        
+        # Prompt Size
+        st.subheader("🧮 Prompt Size")
+        
+        st.session_state.token_budget = st.number_input(
+            "Token budget per prompt",
+            min_value=0,
+            max_value=200_000,
+            step=500,
+            value=int(st.session_state.token_budget),
+            help="0 = no limit. Over budget, additional notes are shortened first, then deal context, then products."
+        )
+        
+        st.markdown("---")
+        
+        render_preset_picker()
+        
+        st.markdown("---")
+        
         # Reset Button
         if st.button("🔄 Reset All Fields", type="secondary", use_container_width=True):
-            for key in st.session_state.keys():
+            for key, value in SESSION_DEFAULTS.items():
                 if key != "current_phase":
-                    st.session_state[key] = "" if isinstance(st.session_state[key], str) else []
+                    st.session_state[key] = value
+            get_output_store().clear()
+            st.rerun()
+
+@st.cache_resource
+def get_preset_store() -> PresetStore:
+    """Open the local preset library once per server process."""
+    return PresetStore()
+
+def split_choices(text: str, options) -> list[str]:
+    """Multiselect values from a comma-separated preset field, keeping only valid options."""
+    return [choice for choice in text.split(", ") if choice in options]
+
+def render_preset_picker():
+    """Search the local preset library and load or save presets."""
+    st.subheader("💾 Saved Presets")
+    store = get_preset_store()
+    
+    query = st.text_input(
+        "Search saved presets",
+        placeholder="Company name, or words from the notes",
+        help="Matches company names by prefix, then notes by full-text search"
+    )
+    if query:
+        matches = store.search_companies(query, limit=20) or store.search_notes(query, limit=20)
+    else:
+        matches = store.list_presets(limit=20)
+    
+    if matches:
+        presets = {preset.company_name: preset for preset in matches}
+        choice = st.selectbox("Preset", options=list(presets))
+        if st.button("📂 Load Preset", use_container_width=True):
+            preset = presets[choice]
+            preset.load_into_session_state()
+            # Presets keep the transaction type as practice_area and lists comma-separated
+            st.session_state.deal_type = preset.practice_area
+            st.session_state.geographic_scope = split_choices(preset.geographic_scope, GEOGRAPHIC_OPTIONS)
+            st.session_state.product_interest = split_choices(preset.product_interest, PRODUCT_OPTIONS)
+            st.session_state.additional_context = preset.notes
             st.rerun()
+    else:
+        st.caption("No saved presets found.")
+    
+    if st.button("💾 Save Current Prospect", use_container_width=True):
+        if not st.session_state.company_name:
+            st.error("❌ Please enter a company name first.")
+        else:
+            store.upsert(ProspectPreset(
+                company_name=st.session_state.company_name,
+                company_url=st.session_state.get("company_url", ""),
+                practice_area=st.session_state.deal_type or "",
+                buyer_persona=st.session_state.get("buyer_persona", ""),
+                industry=st.session_state.industry or "",
+                notes=st.session_state.additional_context,
+                legal_entity_type=st.session_state.legal_entity_type or "",
+                revenue_size=st.session_state.revenue_size or "",
+                geographic_scope=", ".join(st.session_state.geographic_scope or []),
+                product_interest=", ".join(st.session_state.product_interest or []),
+            ))
+            st.success("✅ Preset saved!")
 
 # ============================================================================
 # MAIN CONTENT - PROMPT GENERATORS
 # ============================================================================
 
+class PhaseTab(NamedTuple):
+    """One tab of the individual prompt generators."""
+    phase_id: str
+    number: str
+    tab_label: str
+    heading: str
+    description: str
+    usage_note: Optional[str] = None
+
+PHASE_TABS = (
+    PhaseTab(
+        "phase1", "1", "Phase 1: Discovery",
+        "#### 📋 Phase 1: Discovery & Risk Research",
+        "**Purpose:** Identify legal triggers and compliance pressure points.\n\n"
+        "**What you'll get:** A comprehensive research prompt that helps you find:\n"
+        "- Recent M&A activity or corporate changes\n"
+        "- Regulatory challenges or legal disputes\n"
+        "- Privacy/cybersecurity incidents\n"
+        "- Industry-specific compliance pressures"
+    ),
+    PhaseTab(
+        "phase2", "2", "Phase 2: Profiling",
+        "#### 👤 Phase 2: Buyer Psychological Profiling",
+        "**Purpose:** Understand the buyer's emotional state and pain points.\n\n"
+        "**What you'll get:** A prompt that analyzes:\n"
+        "- Emotional triggers (anxiety, urgency, fear)\n"
+        "- Decision-making pressures\n"
+        "- Stakeholder concerns\n"
+        "- Psychological buying motivations",
+        "Use this AFTER completing Phase 1. Paste the Phase 1 output along with this prompt."
+    ),
+    PhaseTab(
+        "phase25", "2.5", "Phase 2.5: Solution Map",
+        "#### 🎯 Phase 2.5: Solution Mapping (Product-to-Pain Fit)",
+        "**Purpose:** Map specific LexisNexis products to identified pain points.\n\n"
+        "**What you'll get:** A prompt that creates:\n"
+        "- Product-to-problem alignment\n"
+        "- Specific feature callouts\n"
+        "- Value proposition mapping\n"
+        "- Competitive positioning insights",
+        "Use this AFTER Phases 1 & 2. Paste outputs from both previous phases along with this prompt."
+    ),
+    PhaseTab(
+        "phase3", "3", "Phase 3: Email",
+        "#### ✉️ Phase 3: Credibility-Based Email Drafting",
+        "**Purpose:** Create a personalized cold outreach email.\n\n"
+        "**What you'll get:** A prompt that generates:\n"
+        "- Trigger-based opening hook\n"
+        "- Specific product mentions\n"
+        "- Credibility-building language\n"
+        "- Clear call-to-action",
+        "Use this AFTER Phases 1, 2, and 2.5. Paste all previous outputs along with this prompt."
+    ),
+    PhaseTab(
+        "phase4", "4", "Phase 4: Summary",
+        "#### 📊 Phase 4: Sales Executive Summary",
+        "**Purpose:** Create a 90-second brief for time-strapped sales reps.\n\n"
+        "**What you'll get:** A one-page summary containing:\n"
+        "- Key trigger events\n"
+        "- Primary pain points\n"
+        "- Recommended products\n"
+        "- Call script talking points",
+        "Use this AFTER Phases 1-3. This distills everything into a quick reference guide."
+    ),
+    PhaseTab(
+        "phase5", "5", "Phase 5: OUS",
+        "#### 🔍 Phase 5: OUS Framework Analysis",
+        "**Purpose:** Apply the Outcome → Understanding → Standard lens.\n\n"
+        "**What you'll get:** Strategic analysis covering:\n"
+        "- Desired business outcomes\n"
+        "- Deep understanding of challenges\n"
+        "- Industry best practices and standards",
+        "Use this to refine your positioning and messaging based on all previous research."
+    ),
+)
+
+# "Phase 2.5" etc. for messages; phases without a tab keep the number from their recipe name
+PHASE_LABELS = {
+    **{phase_id: name.split(":")[0] for phase_id, name in PromptRecipeManager.get_phase_names().items()},
+    **{phase.phase_id: f"Phase {phase.number}" for phase in PHASE_TABS},
+}
+
+# Expander title and usage note per phase in the full workflow
+WORKFLOW_STEPS = {
+    "phase1": (
+        "PROMPT 1: Discovery & Risk Research",
+        "Paste this into ChatGPT/Claude. The AI will research the company and identify legal triggers."
+    ),
+    "phase2": (
+        "PROMPT 2: Buyer Psychological Profiling",
+        "After completing Prompt 1, paste this prompt PLUS the output from Prompt 1."
+    ),
+    "phase25": (
+        "PROMPT 2.5: 🆕 Solution Mapping (Product-to-Pain Fit)",
+        "**🎯 NEW STEP: Product-to-Pain Mapping** - "
+        "After completing Prompts 1 & 2, paste this prompt PLUS the outputs from both. "
+        "The AI will map specific LexisNexis products to their pain points."
+    ),
+    "phase3": (
+        "PROMPT 3: Credibility-Based Email Drafting",
+        "After completing Prompts 1, 2, & 2.5, paste this prompt PLUS all outputs."
+    ),
+    "phase4": (
+        "PROMPT 4: Sales Executive Summary (90-Second Brief)",
+        "**🎯 For Time-Strapped Sales Reps** - "
+        "Creates a one-page cheat sheet for quick reference before calls."
+    ),
+    "phase5": (
+        "PROMPT 5: OUS Framework Analysis",
+        "Final strategic analysis to refine your positioning."
+    ),
+}
+
 def render_individual_prompts():
     """Render individual phase prompt generators."""
     st.markdown("### 🎯 Individual Prompt Generators")
@@ -263,186 +710,57 @@ def render_individual_prompts():
         "your workflow or only need specific research stages."
     )
     
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "Phase 1: Discovery",
-        "Phase 2: Profiling",
-        "Phase 2.5: Solution Map",
-        "Phase 3: Email",
-        "Phase 4: Summary",
-        "Phase 5: OUS"
-    ])
+    tabs = st.tabs([phase.tab_label for phase in PHASE_TABS])
+    for tab, phase in zip(tabs, PHASE_TABS):
+        with tab:
+            render_phase_generator(phase)
+
+@fragment
+@timed_render("phase generator rerun")
+def render_phase_generator(phase: PhaseTab):
+    """Render one phase tab; its buttons rerun only this tab."""
+    st.markdown(phase.heading)
+    st.markdown(phase.description)
     
     company_name = st.session_state.get("company_name", "")
     context = get_prospect_context()
+    locale = st.session_state.locale
+    store = get_output_store()
+    key = phase.phase_id.replace("phase", "p")
     
-    # Phase 1
-    with tab1:
-        st.markdown("#### 📋 Phase 1: Discovery & Risk Research")
-        st.markdown(
-            "**Purpose:** Identify legal triggers and compliance pressure points.\n\n"
-            "**What you'll get:** A comprehensive research prompt that helps you find:\n"
-            "- Recent M&A activity or corporate changes\n"
-            "- Regulatory challenges or legal disputes\n"
-            "- Privacy/cybersecurity incidents\n"
-            "- Industry-specific compliance pressures"
-        )
-        
-        if st.button("Generate Phase 1 Prompt", key="gen_p1", type="primary"):
-            if not company_name:
-                st.error("❌ Please enter a company name in the sidebar first.")
-            else:
-                with st.spinner("Generating prompt..."):
-                    prompt = PromptRecipeManager.generate_phase1(context)
-                st.success("✅ Prompt generated!")
-                render_prompt_expander(
-                    title="Your Phase 1 Prompt",
-                    prompt=prompt,
-                    filename=f"phase1_{company_name.replace(' ', '_')}.txt",
-                    key_suffix="p1_main",
-                    expanded=True
-                )
-    
-    # Phase 2
-    with tab2:
-        st.markdown("#### 👤 Phase 2: Buyer Psychological Profiling")
-        st.markdown(
-            "**Purpose:** Understand the buyer's emotional state and pain points.\n\n"
-            "**What you'll get:** A prompt that analyzes:\n"
-            "- Emotional triggers (anxiety, urgency, fear)\n"
-            "- Decision-making pressures\n"
-            "- Stakeholder concerns\n"
-            "- Psychological buying motivations"
-        )
-        
-        if st.button("Generate Phase 2 Prompt", key="gen_p2", type="primary"):
-            if not company_name:
-                st.error("❌ Please enter a company name in the sidebar first.")
-            else:
-                with st.spinner("Generating prompt..."):
-                    prompt = PromptRecipeManager.generate_phase2(context)
-                st.success("✅ Prompt generated!")
-                render_prompt_expander(
-                    title="Your Phase 2 Prompt",
-                    prompt=prompt,
-                    filename=f"phase2_{company_name.replace(' ', '_')}.txt",
-                    key_suffix="p2_main",
-                    expanded=True,
-                    usage_note="Use this AFTER completing Phase 1. Paste the Phase 1 output along with this prompt."
-                )
-    
-    # Phase 2.5
-    with tab3:
-        st.markdown("#### 🎯 Phase 2.5: Solution Mapping (Product-to-Pain Fit)")
-        st.markdown(
-            "**Purpose:** Map specific LexisNexis products to identified pain points.\n\n"
-            "**What you'll get:** A prompt that creates:\n"
-            "- Product-to-problem alignment\n"
-            "- Specific feature callouts\n"
-            "- Value proposition mapping\n"
-            "- Competitive positioning insights"
-        )
-        
-        if st.button("Generate Phase 2.5 Prompt", key="gen_p25", type="primary"):
-            if not company_name:
-                st.error("❌ Please enter a company name in the sidebar first.")
-            else:
-                with st.spinner("Generating prompt..."):
-                    prompt = PromptRecipeManager.generate_phase25(context)
-                st.success("✅ Prompt generated!")
-                render_prompt_expander(
-                    title="Your Phase 2.5 Prompt",
-                    prompt=prompt,
-                    filename=f"phase25_{company_name.replace(' ', '_')}.txt",
-                    key_suffix="p25_main",
-                    expanded=True,
-                    usage_note="Use this AFTER Phases 1 & 2. Paste outputs from both previous phases along with this prompt."
-                )
-    
-    # Phase 3
-    with tab4:
-        st.markdown("#### ✉️ Phase 3: Credibility-Based Email Drafting")
-        st.markdown(
-            "**Purpose:** Create a personalized cold outreach email.\n\n"
-            "**What you'll get:** A prompt that generates:\n"
-            "- Trigger-based opening hook\n"
-            "- Specific product mentions\n"
-            "- Credibility-building language\n"
-            "- Clear call-to-action"
-        )
-        
-        if st.button("Generate Phase 3 Prompt", key="gen_p3", type="primary"):
-            if not company_name:
-                st.error("❌ Please enter a company name in the sidebar first.")
-            else:
-                with st.spinner("Generating prompt..."):
-                    prompt = PromptRecipeManager.generate_phase3(context)
-                st.success("✅ Prompt generated!")
-                render_prompt_expander(
-                    title="Your Phase 3 Prompt",
-                    prompt=prompt,
-                    filename=f"phase3_{company_name.replace(' ', '_')}.txt",
-                    key_suffix="p3_main",
-                    expanded=True,
-                    usage_note="Use this AFTER Phases 1, 2, and 2.5. Paste all previous outputs along with this prompt."
-                )
-    
-    # Phase 4
-    with tab5:
-        st.markdown("#### 📊 Phase 4: Sales Executive Summary")
-        st.markdown(
-            "**Purpose:** Create a 90-second brief for time-strapped sales reps.\n\n"
-            "**What you'll get:** A one-page summary containing:\n"
-            "- Key trigger events\n"
-            "- Primary pain points\n"
-            "- Recommended products\n"
-            "- Call script talking points"
-        )
-        
-        if st.button("Generate Phase 4 Prompt", key="gen_p4", type="primary"):
-            if not company_name:
-                st.error("❌ Please enter a company name in the sidebar first.")
-            else:
-                with st.spinner("Generating prompt..."):
-                    prompt = PromptRecipeManager.generate_phase4(context)
-                st.success("✅ Prompt generated!")
-                render_prompt_expander(
-                    title="Your Phase 4 Prompt",
-                    prompt=prompt,
-                    filename=f"phase4_{company_name.replace(' ', '_')}.txt",
-                    key_suffix="p4_main",
-                    expanded=True,
-                    usage_note="Use this AFTER Phases 1-3. This distills everything into a quick reference guide."
-                )
+    if st.button(f"Generate Phase {phase.number} Prompt", key=f"gen_{key}", type="primary"):
+        if not company_name:
+            st.error("❌ Please enter a company name in the sidebar first.")
+        else:
+            budget = st.session_state.token_budget
+            with st.spinner("Generating prompt..."):
+                if budget > 0:
+                    fitted = fit_prompt(phase.phase_id, context, budget, locale)
+                    prompt = fitted.prompt
+                else:
+                    prompt = get_cached_prompt(phase.phase_id, context, locale)
+                store.put(phase.phase_id, context, prompt, locale)
+            st.success("✅ Prompt generated!")
+            if budget > 0:
+                render_fit_report([fitted], PHASE_LABELS)
     
-    # Phase 5
-    with tab6:
-        st.markdown("#### 🔍 Phase 5: OUS Framework Analysis")
-        st.markdown(
-            "**Purpose:** Apply the Outcome → Understanding → Standard lens.\n\n"
-            "**What you'll get:** Strategic analysis covering:\n"
-            "- Desired business outcomes\n"
-            "- Deep understanding of challenges\n"
-            "- Industry best practices and standards"
+    # Rendered from the session store on later reruns; stale once the sidebar changes
+    output = lookup_output(phase.phase_id, context, locale)
+    if output is not None:
+        render_stale_warning(output)
+        render_prompt_expander(
+            title=f"Your Phase {phase.number} Prompt",
+            prompt=output.value,
+            filename=f"{phase.phase_id}_{output.context.company_name.replace(' ', '_')}.txt",
+            key_suffix=f"{key}_main",
+            expanded=True,
+            usage_note=phase.usage_note
         )
-        
-        if st.button("Generate Phase 5 Prompt", key="gen_p5", type="primary"):
-            if not company_name:
-                st.error("❌ Please enter a company name in the sidebar first.")
-            else:
-                with st.spinner("Generating prompt..."):
-                    prompt = PromptRecipeManager.generate_phase5(context)
-                st.success("✅ Prompt generated!")
-                render_prompt_expander(
-                    title="Your Phase 5 Prompt",
-                    prompt=prompt,
-                    filename=f"phase5_{company_name.replace(' ', '_')}.txt",
-                    key_suffix="p5_main",
-                    expanded=True,
-                    usage_note="Use this to refine your positioning and messaging based on all previous research."
-                )
 
+@fragment
+@timed_render("workflow rerun")
 def render_full_workflow():
-    """Render the full 6-prompt workflow generator."""
+    """Render the full 6-prompt workflow generator; its buttons rerun only this section."""
     
     st.markdown("### 🎯 Complete Sales Prospecting Sequence")
     
@@ -457,105 +775,63 @@ def render_full_workflow():
     "Use these prompts sequentially in ChatGPT/Claude to build a complete prospect dossier."
     """)
     
-    company_name = st.session_state.get("company_name", "")
+    context = get_prospect_context()
+    locale = st.session_state.locale
+    store = get_output_store()
     
+    output = None
+    fitted = None
     if st.button("✨ Generate Full Workflow", type="primary", use_container_width=True):
-        if not company_name:
+        if not context.company_name:
             st.error("❌ Please enter a company name to generate prompts.")
             return
-        
-        with st.spinner("Generating 6-phase workflow..."):
-            context = ProspectContext(
-                company_name=st.session_state.get('company_name', ''),
-                industry_sector=st.session_state.get('industry_sector', ''),
-                transaction_type=st.session_state.get('transaction_type', ''),
-                legal_entity_type=st.session_state.get('legal_entity_type', ''),
-                transaction_size=st.session_state.get('transaction_size', ''),
-                geographic_scope=st.session_state.get('geographic_scope', ''),
-                deal_context=st.session_state.get('deal_context', ''),
-                additional_notes=st.session_state.get('additional_notes', '')
-            )
-            prompts = PromptRecipeManager.generate_full_workflow(context)
-        
-        st.success("✅ Workflow generated! Copy each prompt below and paste into your AI tool sequentially.")
-        
-        # Display prompts
-        for i, (phase_name, prompt) in enumerate(prompts.items(), 1):
-            with st.expander(f"**Phase {i}: {phase_name}**", expanded=(i == 1)):
-                st.code(prompt, language="markdown")
-                st.download_button(
-                    label=f"📥 Download Phase {i}",
-                    data=prompt,
-                    file_name=f"phase_{i}_{phase_name.lower().replace(' ', '_')}.txt",
-                    mime="text/plain",
-                    key=f"download_full_{i}"
-                )
-        
-        # Phase 1
-        render_prompt_expander(
-            title="📋 PROMPT 1: Discovery & Risk Research",
-            prompt=prompts["phase1"],
-            filename=f"1_discovery_{company_name.replace(' ', '_')}.txt",
-            key_suffix="wf_p1",
-            expanded=True,
-            usage_note="Paste this into ChatGPT/Claude. The AI will research the company and identify legal triggers."
-        )
-        
-        # Phase 2
-        render_prompt_expander(
-            title="📋 PROMPT 2: Buyer Psychological Profiling",
-            prompt=prompts["phase2"],
-            filename=f"2_profiling_{company_name.replace(' ', '_')}.txt",
-            key_suffix="wf_p2",
-            usage_note="After completing Prompt 1, paste this prompt PLUS the output from Prompt 1."
-        )
-        
-        # Phase 2.5 - FIXED
-        st.markdown("---")
-        render_prompt_expander(
-            title="📋 PROMPT 2.5: 🆕 Solution Mapping (Product-to-Pain Fit)",
-            prompt=prompts["phase25"],  # ✅ FIXED: Changed from "phase2.5" to "phase25"
-            filename=f"2_5_solution_mapping_{company_name.replace(' ', '_')}.txt",
-            key_suffix="wf_p25",
-            expanded=True,
-            usage_note=(
-                "**🎯 NEW STEP: Product-to-Pain Mapping** - "
-                "After completing Prompts 1 & 2, paste this prompt PLUS the outputs from both. "
-                "The AI will map specific LexisNexis products to their pain points."
-            )
-        )
-        
-        # Phase 3
-        render_prompt_expander(
-            title="📋 PROMPT 3: Credibility-Based Email Drafting",
-            prompt=prompts["phase3"],
-            filename=f"3_email_{company_name.replace(' ', '_')}.txt",
-            key_suffix="wf_p3",
-            usage_note="After completing Prompts 1, 2, & 2.5, paste this prompt PLUS all outputs."
-        )
-        
-        # Phase 4
-        st.markdown("---")
-        render_prompt_expander(
-            title="📋 PROMPT 4: Sales Executive Summary (90-Second Brief)",
-            prompt=prompts["phase4"],
-            filename=f"4_summary_{company_name.replace(' ', '_')}.txt",
-            key_suffix="wf_p4",
-            expanded=False,
-            usage_note=(
-                "**🎯 For Time-Strapped Sales Reps** - "
-                "Creates a one-page cheat sheet for quick reference before calls."
-            )
-        )
-        
-        # Phase 5
+        budget = st.session_state.token_budget
+        if budget > 0:
+            # Each phase trimmed only as far as it needs; not shared through the workflow cache
+            fitted = fit_workflow(context, budget, locale)
+            phases = ((phase_id, prompt.prompt) for phase_id, prompt in fitted.items())
+        else:
+            # Display prompts as each phase is built (or served from the shared cache)
+            phases = iter_cached_workflow(context, locale)
+    else:
+        # Later reruns render from the session store; stale once the sidebar changes
+        output = lookup_output("workflow", context, locale)
+        if output is None:
+            return
+        context, locale = output.context, output.locale
+        phases = output.value.items()
+    
+    company_name = context.company_name
+    prompts = {}
+    
+    if output is not None:
+        render_stale_warning(output)
+    st.success("✅ Workflow generated! Copy each prompt below and paste into your AI tool sequentially.")
+    if fitted is not None:
+        render_fit_report(list(fitted.values()), PHASE_LABELS)
+    
+    # A single archive instead of a download per phase: nothing is serialized into the page until clicked.
+    # The button goes above the prompts but is filled in once they are all built.
+    dossier_slot = st.container()
+    
+    for phase_name, prompt in phases:
+        prompts[phase_name] = prompt
+        title, usage_note = WORKFLOW_STEPS.get(phase_name, (PHASE_LABELS.get(phase_name, phase_name), None))
         render_prompt_expander(
-            title="📋 PROMPT 5: OUS Framework Analysis",
-            prompt=prompts["phase5"],
-            filename=f"5_ous_{company_name.replace(' ', '_')}.txt",
-            key_suffix="wf_p5",
-            usage_note="Final strategic analysis to refine your positioning."
+            title=f"📋 {title}",
+            prompt=prompt,
+            filename=f"{phase_name}_{company_name.replace(' ', '_')}.txt",
+            key_suffix=f"wf_{phase_name}",
+            expanded=phase_name in ("phase1", "phase25"),
+            downloadable=False,
+            usage_note=usage_note
         )
+    if output is None:
+        store.put("workflow", context, prompts, locale)
+    
+    with dossier_slot:
+        # Built from the prompts as shown, after any token-budget fitting
+        render_dossier_download(context, locale, prompts)
 
 def render_main_content():
     """Render the main content area."""
@@ -612,6 +888,8 @@ def render_main_content():
 
 def main():
     """Main application entry point."""
+    started = time.perf_counter()
+    get_warm_up()
     init_session_state()
     render_sidebar()
     render_main_content()
@@ -624,6 +902,30 @@ def main():
         "</div>",
         unsafe_allow_html=True
     )
+    
+    elapsed = time.perf_counter() - started
+    st.session_state.rerun_timings["full run"] = elapsed * 1000
+    metrics.observe("app_rerun_seconds", elapsed, RERUN_HELP, scope="full run")
+    if is_debug_mode():
+        st.caption(f"⏱️ full run: {elapsed * 1000:.1f} ms")
+        render_metrics_panel()
+    metrics.maybe_write_textfile()
+
+def run_profiled():
+    """Run main() under cProfile and tracemalloc and keep the profile for this session."""
+    profiler = RerunProfiler()
+    try:
+        with profiler:
+            main()
+    finally:
+        # Kept even when the rerun was stopped early by st.rerun() or st.stop()
+        history = st.session_state.setdefault("rerun_profiles", deque(maxlen=KEEP_RERUNS))
+        if profiler.profile is not None:
+            history.append(profiler.profile)
+    render_profile_panel(history, skipped=profiler.skipped)
 
 if __name__ == "__main__":
-    main()
+    if is_profile_mode():
+        run_profiled()
+    else:
+        main()
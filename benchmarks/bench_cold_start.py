@@ -0,0 +1,86 @@
+"""Benchmark: what the first user after a deploy waits for, with and without the warm-up.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_cold_start [--runs 5] [--think 1.0]
+
+Each run starts a fresh interpreter (a new server process) and drives
+app.py with Streamlit's AppTest: the first page, filling in the company
+name, then "Generate Full Workflow". A second session then does the
+same in the same process. ``--think`` is the pause between the first
+page and the sidebar input, i.e. a user reading the page; the warm-up
+runs in the background meanwhile. Medians are printed for
+APP_WARM_UP=1 and APP_WARM_UP=0. Timings include AppTest's own
+overhead, which is the same in both settings.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_CHILD = """
+import json, os, sys, time
+from streamlit.testing.v1 import AppTest
+
+def session():
+    timings = {{}}
+    started = time.perf_counter()
+    app = AppTest.from_file({app!r}, default_timeout=60).run()
+    timings["first page"] = time.perf_counter() - started
+    time.sleep({think})
+    app.session_state["company_name"] = "ABC Corporation"
+    app.run()
+    button = next(button for button in app.button if "Full Workflow" in button.label)
+    started = time.perf_counter()
+    button.click().run()
+    timings["first prompt"] = time.perf_counter() - started
+    assert not app.exception, [exception.value for exception in app.exception]
+    return timings
+
+first, second = session(), session()
+print(json.dumps({{"first": first, "second": second}}))
+"""
+
+STEPS = ("first page", "first prompt")
+
+
+def measure(warm_up: bool, runs: int, think: float) -> dict[str, dict[str, float]]:
+    """Median milliseconds per step for the first and second session over ``runs`` processes."""
+    app = os.path.abspath("app.py")
+    samples = []
+    with tempfile.TemporaryDirectory() as directory:
+        # Run outside the repository so every process starts with an empty preset library
+        env = dict(os.environ, APP_WARM_UP="1" if warm_up else "0", PYTHONPATH=os.getcwd())
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", _CHILD.format(app=app, think=think)],
+                check=True, capture_output=True, text=True, cwd=directory, env=env,
+            ).stdout
+            samples.append(json.loads(output.splitlines()[-1]))
+            for leftover in os.listdir(directory):
+                os.remove(os.path.join(directory, leftover))
+    return {
+        session: {step: statistics.median(sample[session][step] for sample in samples) * 1000 for step in STEPS}
+        for session in ("first", "second")
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh server processes per setting")
+    parser.add_argument("--think", type=float, default=1.0, help="Seconds between the first page and input")
+    args = parser.parse_args(argv)
+
+    print(f"{'warm-up':<10}{'session':<9}" + "".join(f"{step + ' ms':>17}" for step in STEPS))
+    for warm_up in (True, False):
+        for session, steps in measure(warm_up, args.runs, args.think).items():
+            print(f"{'on' if warm_up else 'off':<10}{session:<9}" + "".join(f"{steps[step]:>17.1f}" for step in STEPS))
+
+
+if __name__ == "__main__":
+    main()
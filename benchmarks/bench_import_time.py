@@ -0,0 +1,71 @@
+"""Benchmark: import time and memory of the components package.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time [--runs 10]
+
+Each statement runs in a fresh interpreter. The figures cover only the
+statement itself, not interpreter startup: the median wall time over
+``--runs`` runs, the growth in peak RSS, and whether Streamlit was
+imported along the way.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import components",
+    "from components import PromptRecipeManager",
+    "from components import check_plain_english",
+    "from components import EmailTemplateGenerator",
+    "from components import ProspectPreset",
+    "from components import get_cached_workflow",
+    "import components.batch",
+    "import components.service",
+    "import streamlit",
+]
+
+_CHILD = """
+import json, resource, sys, time
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"ms": elapsed * 1000, "rss_kb": after - before, "streamlit": "streamlit" in sys.modules}}))
+"""
+
+
+def measure(statement: str, runs: int) -> dict[str, float]:
+    """Median import time and peak-RSS growth of ``statement`` over fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(statement=statement)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        samples.append(json.loads(output.splitlines()[-1]))
+    return {
+        "ms": statistics.median(sample["ms"] for sample in samples),
+        "rss_mb": statistics.median(sample["rss_kb"] for sample in samples) / 1024,
+        "streamlit": samples[0]["streamlit"],
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per statement")
+    args = parser.parse_args(argv)
+
+    print(f"{'statement':<48}{'ms':>9}{'+RSS MB':>10}{'streamlit':>11}")
+    for statement in STATEMENTS:
+        result = measure(statement, args.runs)
+        print(f"{statement:<48}{result['ms']:>9.1f}{result['rss_mb']:>10.1f}{str(result['streamlit']):>11}")
+
+
+if __name__ == "__main__":
+    main()
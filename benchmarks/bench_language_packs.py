@@ -0,0 +1,53 @@
+"""Benchmark: cold versus warm full-workflow render time per locale.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_language_packs [--repeat 20]
+
+"Cold" is the first render after the language pack and header caches are
+cleared, so it includes reading the locale file and compiling its
+templates. "Warm" is a render once the pack is loaded (header cache
+cleared between runs, so the header is still built each time).
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+import timeit
+
+from benchmarks.suite import SEED, make_prospects
+from components.language_packs import available_locales, clear_language_packs
+from components.recipes import PromptRecipeManager, _render_header
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Cold renders per locale")
+    args = parser.parse_args(argv)
+
+    prospects = make_prospects(random.Random(SEED), 50)
+    print(f"{'locale':<10}{'cold first render us':>22}{'warm render us':>16}{'cold/warm':>11}")
+    for locale in available_locales():
+        cold = []
+        for i in range(args.repeat):
+            clear_language_packs()
+            _render_header.cache_clear()
+            started = time.perf_counter()
+            PromptRecipeManager.generate_full_workflow(prospects[i % len(prospects)], locale)
+            cold.append(time.perf_counter() - started)
+
+        def warm() -> None:
+            for prospect in prospects:
+                PromptRecipeManager.generate_full_workflow(prospect, locale)
+            _render_header.cache_clear()
+
+        number, _ = timeit.Timer(warm).autorange()
+        warm_us = min(timeit.repeat(warm, repeat=5, number=number)) / number / len(prospects) * 1e6
+        cold_us = statistics.median(cold) * 1e6
+        print(f"{locale:<10}{cold_us:>22.1f}{warm_us:>16.2f}{cold_us / warm_us:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: cost of the metrics instrumentation, per suite case.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_metrics [--rounds 3] [--only workflow check]
+
+Runs benchmarks.suite in fresh processes with PROMPT_METRICS=0 and
+PROMPT_METRICS=1 (alternating, ``--rounds`` times each, best result kept)
+and prints the slowdown of every case with metrics enabled.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+def _run_suite(enabled: bool, only: list[str] | None) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "run.json")
+        command = [sys.executable, "-m", "benchmarks.suite", "--output", output]
+        if only:
+            command += ["--only", *only]
+        # Same hash seed in both settings, so dict and set layouts match
+        env = dict(os.environ, PROMPT_METRICS="1" if enabled else "0", PYTHONHASHSEED="0")
+        subprocess.run(command, env=env, check=True, stderr=subprocess.DEVNULL)
+        with open(output, encoding="utf-8") as handle:
+            results = json.load(handle)["results"]
+    return {name: result["us_per_op"] for name, result in results.items()}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3, help="Suite runs per setting")
+    parser.add_argument("--only", nargs="+", help="Run only cases whose name contains one of these")
+    args = parser.parse_args(argv)
+
+    best: dict[bool, dict[str, float]] = {False: {}, True: {}}
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            for name, us in _run_suite(enabled, args.only).items():
+                best[enabled][name] = min(us, best[enabled].get(name, float("inf")))
+
+    print(f"{'case':<50}{'off us':>12}{'on us':>12}{'overhead':>10}")
+    for name, off in best[False].items():
+        on = best[True][name]
+        print(f"{name:<50}{off:>12.2f}{on:>12.2f}{(on / off - 1) * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: streaming JSONL preset export/import throughput.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_preset_io [--records 250000]
+
+Measures write and read (with validation) for plain and gzip JSONL, using
+every available JSON backend, plus peak traced memory for each read.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from components import preset_io
+from components.presets import ProspectPreset
+
+PRACTICE_AREAS = ["M&A", "Litigation", "Compliance", "IP", "Employment", "Real Estate"]
+INDUSTRIES = ["Financial Services", "Technology/Software", "Real Estate", "Manufacturing"]
+
+
+def _make_presets(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield ProspectPreset(
+            company_name=f"Account {i:07d}",
+            company_url=f"https://account{i}.example.com",
+            practice_area=rng.choice(PRACTICE_AREAS),
+            buyer_persona="General Counsel",
+            industry=rng.choice(INDUSTRIES),
+            notes=f"Renewal due Q{rng.randint(1, 4)}; {rng.randint(2, 400)} seats; CRM id {i}.",
+        )
+
+
+def _backends():
+    yield "json", json.loads, lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+    if preset_io.orjson is not None:
+        yield "orjson", preset_io.orjson.loads, preset_io.orjson.dumps
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=250_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'backend':<8}{'file':<12}{'write rec/s':>14}{'read rec/s':>14}{'read peak MB':>14}{'size MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend, loads, dumps in _backends():
+            preset_io._loads, preset_io._dumps = loads, dumps
+            for suffix in (".jsonl", ".jsonl.gz"):
+                path = Path(tmp) / f"presets{suffix}"
+
+                started = time.perf_counter()
+                written = preset_io.write_presets_jsonl(_make_presets(args.records), path)
+                write_rate = written / (time.perf_counter() - started)
+
+                report = preset_io.ImportReport()
+                tracemalloc.start()
+                started = time.perf_counter()
+                read = sum(1 for _ in preset_io.iter_presets_jsonl(path, report))
+                read_rate = read / (time.perf_counter() - started)
+                peak = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+                assert read == written and not report.errors
+
+                size = path.stat().st_size / 1e6
+                print(f"{backend:<8}{suffix:<12}{write_rate:>14,.0f}{read_rate:>14,.0f}{peak:>14.2f}{size:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
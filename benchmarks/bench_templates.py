@@ -0,0 +1,126 @@
+"""Micro-benchmark: phase prompt rendering before and after compiled templates.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_templates [--contexts N]
+
+"Before" reproduces the original string-concatenation workflow: the header is
+rebuilt on every call and all seven phases are built even when one is needed.
+"After" uses the compiled templates in ``components.recipes``. The 7xN case
+renders N distinct prospects per iteration, so after the first iteration their
+headers come from the header cache, as they would for repeat generations.
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from components.recipes import PHASE_REGISTRY, PromptRecipeManager, ProspectContext
+
+HEADER_SLOT = "{header}"
+LEGACY_BODIES = {
+    phase_id: template.source[len(HEADER_SLOT):]
+    for phase_id, template in PHASE_REGISTRY.items()
+}
+
+
+def _legacy_header(context: ProspectContext) -> str:
+    """Original, uncached ProspectContext.to_prompt_header."""
+    header_parts = []
+    if context.company_name:
+        header_parts.append(f"**Company:** {context.company_name}")
+    if context.industry_sector:
+        header_parts.append(f"**Industry:** {context.industry_sector}")
+    if context.transaction_type:
+        header_parts.append(f"**Transaction Type:** {context.transaction_type}")
+    if context.legal_entity_type:
+        header_parts.append(f"**Legal Entity:** {context.legal_entity_type}")
+    if context.transaction_size:
+        header_parts.append(f"**Transaction Size:** {context.transaction_size}")
+    if context.geographic_scope:
+        header_parts.append(f"**Geographic Scope:** {context.geographic_scope}")
+    if context.deal_context:
+        header_parts.append(f"**Deal Context:** {context.deal_context}")
+    if context.company_products:
+        header_parts.append(f"\n**Our Products/Services:**\n{context.company_products}")
+    if context.additional_notes:
+        header_parts.append(f"**Additional Notes:** {context.additional_notes}")
+    header = "\n".join(header_parts) if header_parts else "**General Sales Prospecting Context**"
+    return header + "\n\n---\n\n"
+
+
+def _legacy_workflow(context: ProspectContext) -> dict[str, str]:
+    header = _legacy_header(context)
+    return {phase_id: header + body for phase_id, body in LEGACY_BODIES.items()}
+
+
+def _legacy_individual(phase_id: str, context: ProspectContext) -> str:
+    return _legacy_workflow(context).get(phase_id, "")
+
+
+def _make_contexts(count: int) -> list[ProspectContext]:
+    return [
+        ProspectContext(
+            company_name=f"Prospect {i} Holdings",
+            industry_sector="Financial Services",
+            transaction_type="M&A (Buyer)",
+            legal_entity_type="Private Company",
+            transaction_size="$50M - $250M",
+            geographic_scope="Asia-Pacific, United Kingdom",
+            deal_context=f"Cross-border acquisition #{i}",
+            additional_notes="Board reviewing compliance tooling this quarter.",
+            company_products="Lexis+ AI, Practical Guidance",
+        )
+        for i in range(count)
+    ]
+
+
+def _rate(func, renders: int, repeat: int = 5) -> float:
+    """Best-of-``repeat`` phase renders per second for one call of ``func``."""
+    number = max(1, 20000 // renders)
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return renders * number / best
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contexts", type=int, default=100, help="N for the 7xN case")
+    args = parser.parse_args(argv)
+
+    contexts = _make_contexts(args.contexts)
+    context = contexts[0]
+    phase_count = len(PHASE_REGISTRY)
+
+    for phase_id in PHASE_REGISTRY:
+        assert PromptRecipeManager.render(phase_id, context) == _legacy_individual(phase_id, context)
+
+    cases = [
+        (
+            "1 phase",
+            1,
+            lambda: _legacy_individual("phase1", context),
+            lambda: PromptRecipeManager.render("phase1", context),
+        ),
+        (
+            f"{phase_count} phases",
+            phase_count,
+            lambda: _legacy_workflow(context),
+            lambda: PromptRecipeManager.generate_full_workflow(context),
+        ),
+        (
+            f"{phase_count}x{len(contexts)} phases",
+            phase_count * len(contexts),
+            lambda: [_legacy_workflow(c) for c in contexts],
+            lambda: [PromptRecipeManager.generate_full_workflow(c) for c in contexts],
+        ),
+    ]
+
+    print(f"{'case':<16}{'before (renders/s)':>20}{'after (renders/s)':>20}{'speedup':>10}")
+    for name, renders, before, after in cases:
+        before_rate = _rate(before, renders)
+        after_rate = _rate(after, renders)
+        print(f"{name:<16}{before_rate:>20,.0f}{after_rate:>20,.0f}{after_rate / before_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
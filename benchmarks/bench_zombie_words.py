@@ -0,0 +1,122 @@
+"""Benchmark: jargon detection, per-term regex loop versus the single-pass matcher.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_zombie_words [--sizes 1KB 100KB 10MB] [--terms 40 1000 10000]
+
+"Before" is the original loop that compiles and scans one regex per term on
+every call. Its cost grows with terms x text size (about 23 s per call for
+10,000 terms on 100KB), so with more than ``--legacy-sample`` terms it is
+timed once over that many terms and scaled up to the full dictionary; such
+figures are printed with a leading "~". The loop does the same work for
+every term, so the scaling is close, but it is an estimate. It is skipped
+where even the sample would take more than ``--legacy-budget`` term-bytes.
+"After" builds one JargonMatcher per dictionary (build time
+reported separately) and runs find_terms(), which stops as soon as every
+term has been seen; with a small dictionary that can be early in the text.
+"Full pass" lists every occurrence with finditer(), so it always scans the
+whole text, and MB/s is taken from it.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from components.writing_checker import ZOMBIE_WORDS, JargonMatcher
+
+SIZES = {"1KB": 1_000, "100KB": 100_000, "10MB": 10_000_000}
+LEGACY_SAMPLE = 200  # terms timed in the legacy loop before scaling up
+FILLER = (
+    "the partner asked for a short note on the merger and we sent the draft "
+    "before the call with counsel on friday about the filing deadline"
+).split()
+
+
+def _make_terms(count: int, rng: random.Random) -> dict[str, str]:
+    """ZOMBIE_WORDS topped up with synthetic one- to three-word terms."""
+    terms = dict(list(ZOMBIE_WORDS.items())[:count])
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(terms) < count:
+        words = [
+            "".join(rng.choice(letters) for _ in range(rng.randint(4, 10)))
+            for _ in range(rng.choice((1, 1, 2, 3)))
+        ]
+        terms[" ".join(words)] = "plain word"
+    return terms
+
+
+def _make_text(size: int, terms: list[str], rng: random.Random) -> str:
+    """Filler prose with roughly one dictionary term per 200 characters."""
+    chunks = []
+    length = 0
+    while length < size:
+        chunk = " ".join(rng.choice(FILLER) for _ in range(30))
+        chunk += f" {rng.choice(terms)}. "
+        chunks.append(chunk)
+        length += len(chunk)
+    return "".join(chunks)[:size]
+
+
+def _legacy_find(text: str, terms: dict[str, str]) -> list[str]:
+    text_lower = text.lower()
+    found = []
+    for zombie in terms:
+        pattern = re.compile(r'\b' + re.escape(zombie) + r'\b', re.IGNORECASE)
+        if pattern.search(text_lower):
+            found.append(zombie)
+    return found
+
+
+def _best(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=list(SIZES))
+    parser.add_argument("--terms", nargs="+", type=int, default=[40, 1_000, 10_000])
+    parser.add_argument("--legacy-sample", type=int, default=LEGACY_SAMPLE,
+                        help="Time the legacy loop over at most this many terms and scale up")
+    parser.add_argument("--legacy-budget", type=float, default=2e9,
+                        help="Skip the legacy loop when timed terms x text bytes exceeds this")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    print(f"{'terms':>7}{'text':>8}{'build (ms)':>12}{'before (ms)':>14}{'after (ms)':>12}"
+          f"{'full pass (ms)':>16}{'MB/s full':>11}")
+    for term_count in args.terms:
+        terms = _make_terms(term_count, rng)
+        started = time.perf_counter()
+        matcher = JargonMatcher(terms)
+        build_ms = (time.perf_counter() - started) * 1000
+        for size_name in args.sizes:
+            size = SIZES[size_name]
+            text = _make_text(size, list(terms), rng)
+            repeat = 5 if size <= 100_000 else 1
+
+            after = _best(lambda: matcher.find_terms(text), repeat)
+            full = _best(lambda: list(matcher.finditer(text)), repeat)
+            sample = dict(list(terms.items())[:args.legacy_sample])
+            if len(sample) * size <= args.legacy_budget:
+                found = _legacy_find(text, sample)
+                assert sorted(found) == sorted(term for term in matcher.find_terms(text) if term in sample)
+                if len(sample) == len(terms):
+                    before_ms = f"{_best(lambda: _legacy_find(text, terms), repeat) * 1000:.2f}"
+                else:
+                    before = _best(lambda: _legacy_find(text, sample), 1) * len(terms) / len(sample)
+                    before_ms = f"~{before * 1000:.2f}"
+            else:
+                before_ms = "skipped"
+            print(f"{term_count:>7}{size_name:>8}{build_ms:>12.1f}{before_ms:>14}"
+                  f"{after * 1000:>12.2f}{full * 1000:>16.2f}{size / full / 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Load test: concurrent Streamlit sessions of app.py, driven headlessly with AppTest.
+
+Run from the repository root:
+
+    python -m benchmarks.load_app [--sessions 1 5 10 20] [--iterations 3] [--think 0.2]
+    python -m benchmarks.load_app --sessions 50 100 200 --output reports/load_app.json
+
+Each ``--sessions`` level runs in a fresh process, which plays the part of
+one server container. In it, N threads each own an AppTest session. All
+sessions stay alive together and share the process's caches, as they
+would on the server. AppTest swaps a process-wide mock runtime in and
+out around every run, so only one rerun executes at a time. The others
+queue, much as CPU-bound script threads would under the GIL. Every
+session repeats a rep's flow ``--iterations`` times, pausing a random
+0-2x ``--think`` seconds between actions:
+
+    open the page, fill in the sidebar (name, industry, deal type,
+    regions, notes), generate the full workflow, switch to the
+    individual prompts and generate two phases, reset all fields
+
+Every action is one script rerun. Per level the report gives the rerun
+latency p50/p95/p99, overall and per action. Latency includes the time
+spent queued behind other sessions; ``service_ms`` is the mean time of
+the rerun alone. The report also gives reruns per second, errors
+(exceptions shown by the app), and the process's resident memory before
+the sessions started and at its peak. Latencies include AppTest's own
+element-tree handling. AppTest reruns the whole script where the browser
+would rerun only a fragment, so button clicks in fragments are
+pessimistic. The JSON report (``--output``, default load_app.json) adds
+the machine, Python and Streamlit versions and a timestamp, for tracking
+over time.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.suite import EMAIL_SENTENCES, SEED
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+PERCENTILES = {"p50_ms": 50, "p95_ms": 95, "p99_ms": 99}
+# Streamlit release whose private AppTest internals _share_script_cache was checked against
+SCRIPT_CACHE_CHECKED_WITH = "1.65.0"
+
+# AppTest installs and removes a global mock Runtime around each run, so runs cannot overlap
+_RUN_LOCK = threading.Lock()
+
+
+def _rss_mb() -> float:
+    """Current resident memory of this process (peak so far where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _latency_figures(latencies: list[float]) -> dict[str, float]:
+    if len(latencies) < 2:
+        return {name: (latencies[0] * 1000 if latencies else 0.0) for name in PERCENTILES}
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {name: cuts[percentile - 1] * 1000 for name, percentile in PERCENTILES.items()}
+
+
+def _share_script_cache() -> bool:
+    """
+    Compile app.py once per process, as the Streamlit server does; False if that is not possible.
+
+    AppTest gives every rerun a new ScriptCache, so each rerun parses the
+    script again, and parsing from many threads at once fails on some
+    Python versions ("AST constructor recursion depth mismatch"). This
+    replaces a private name in streamlit.testing.v1.local_script_runner
+    (checked against the release in SCRIPT_CACHE_CHECKED_WITH). When a release no
+    longer has it, the level runs with AppTest's own per-rerun cache and a
+    warning, and its latencies include parsing the script.
+    """
+    import streamlit
+    from streamlit.testing.v1 import local_script_runner
+
+    try:
+        from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    except ImportError:
+        ScriptCache = None
+    if ScriptCache is None or not hasattr(local_script_runner, "ScriptCache"):
+        warnings.warn(
+            f"Streamlit {streamlit.__version__}: AppTest's ScriptCache is not where it was in "
+            f"{SCRIPT_CACHE_CHECKED_WITH}; app.py is parsed again on every rerun",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return False
+
+    shared = ScriptCache()
+    local_script_runner.ScriptCache = lambda: shared
+    return True
+
+
+class Session:
+    """One simulated rep: an AppTest session that records each rerun's latency by action."""
+
+    def __init__(self, number: int, think: float, latencies: dict[str, list[float]],
+                 service: dict[str, list[float]], errors: list[str], lock: threading.Lock):
+        from components.options import (
+            GEOGRAPHIC_OPTIONS,
+            INDUSTRY_OPTIONS,
+            TRANSACTION_TYPE_OPTIONS,
+        )
+        from streamlit.testing.v1 import AppTest
+
+        self.rng = random.Random(SEED + number)
+        self.number = number
+        self.think = think
+        self.latencies = latencies
+        self.service = service
+        self.errors = errors
+        self.lock = lock
+        self.industries = INDUSTRY_OPTIONS[1:]
+        self.transactions = TRANSACTION_TYPE_OPTIONS[1:]
+        self.regions = GEOGRAPHIC_OPTIONS
+        self.app = AppTest.from_file(APP_PATH, default_timeout=120)
+
+    def _widget(self, kind: str, label: str):
+        return next(widget for widget in getattr(self.app, kind) if widget.label.startswith(label))
+
+    def _rerun(self, action: str, interact) -> None:
+        time.sleep(self.rng.uniform(0, 2 * self.think))
+        queued = time.perf_counter()
+        with _RUN_LOCK:
+            started = time.perf_counter()
+            interact()
+            finished = time.perf_counter()
+        with self.lock:
+            self.latencies.setdefault(action, []).append(finished - queued)
+            self.service.setdefault(action, []).append(finished - started)
+            self.errors.extend(f"{action}: {exception.value}" for exception in self.app.exception)
+
+    def flow(self) -> None:
+        """One pass through a rep's typical use of the app."""
+        rng = self.rng
+        notes = " ".join(rng.sample(EMAIL_SENTENCES, 4))
+        phases = rng.sample(range(1, 6), 2)
+        self._rerun("open page", self.app.run)
+        self._rerun("company name", lambda: self._widget("text_input", "Company Name")
+                    .set_value(f"Prospect {self.number} Holdings").run())
+        self._rerun("industry", lambda: self._widget("selectbox", "Industry")
+                    .set_value(rng.choice(self.industries)).run())
+        self._rerun("deal type", lambda: self._widget("selectbox", "Transaction Type")
+                    .set_value(rng.choice(self.transactions)).run())
+        self._rerun("regions", lambda: self._widget("multiselect", "Geographic Scope")
+                    .set_value(rng.sample(self.regions, 2)).run())
+        self._rerun("notes", lambda: self._widget("text_area", "Extra Context").set_value(notes).run())
+        self._rerun("full workflow", lambda: self._widget("button", "✨ Generate Full Workflow").click().run())
+        self._rerun("individual tab", lambda: self._widget("radio", "Choose your workflow")
+                    .set_value("Individual Prompts").run())
+        for phase in phases:
+            self._rerun("phase prompt", lambda: self._widget("button", f"Generate Phase {phase} ")
+                        .click().run())
+        self._rerun("reset", lambda: self._widget("button", "🔄 Reset All Fields").click().run())
+
+
+def run_level(sessions: int, iterations: int, think: float) -> dict:
+    """Drive ``sessions`` concurrent sessions in this process and return the level's figures."""
+    shared_script_cache = _share_script_cache()  # also loads Streamlit before the baseline RSS is taken
+
+    latencies: dict[str, list[float]] = {}
+    service: dict[str, list[float]] = {}
+    errors: list[str] = []
+    lock = threading.Lock()
+    baseline_rss = _rss_mb()
+    peak_rss = [baseline_rss]
+    done = threading.Event()
+
+    def sample_rss() -> None:
+        while not done.wait(0.05):
+            peak_rss[0] = max(peak_rss[0], _rss_mb())
+
+    def drive(number: int) -> None:
+        try:
+            session = Session(number, think, latencies, service, errors, lock)
+            for _ in range(iterations):
+                session.flow()
+        except Exception as error:  # a broken flow is reported, not fatal for the level
+            with lock:
+                errors.append(f"session {number}: {error!r}")
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=drive, args=(number,)) for number in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    sampler.join()
+
+    every = [latency for action in latencies.values() for latency in action]
+    busy = [seconds for action in service.values() for seconds in action]
+    return {
+        "sessions": sessions,
+        "reruns": len(every),
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "seconds": elapsed,
+        "shared_script_cache": shared_script_cache,
+        "reruns_per_s": len(every) / elapsed,
+        **_latency_figures(every),
+        "service_ms": statistics.fmean(busy) * 1000 if busy else 0.0,
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": max(peak_rss[0], _rss_mb()),
+        "actions": {
+            action: {
+                "reruns": len(values),
+                **_latency_figures(values),
+                "service_ms": statistics.fmean(service[action]) * 1000,
+            }
+            for action, values in latencies.items()
+        },
+    }
+
+
+def _run_level_process(sessions: int, iterations: int, think: float) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        # Outside the repository, so each level starts with an empty preset library
+        env = dict(os.environ, PYTHONPATH=os.getcwd())
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.load_app", "--level", str(sessions),
+             "--iterations", str(iterations), "--think", str(think)],
+            check=True, capture_output=True, text=True, cwd=directory, env=env,
+        ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20],
+                        help="Concurrent sessions per level")
+    parser.add_argument("--iterations", type=int, default=3, help="Flows per session")
+    parser.add_argument("--think", type=float, default=0.2, help="Mean seconds between a rep's actions")
+    parser.add_argument("--output", "-o", default="load_app.json", help="JSON report path")
+    parser.add_argument("--level", type=int, help=argparse.SUPPRESS)  # child process: run one level
+    args = parser.parse_args(argv)
+
+    if args.level is not None:
+        print(json.dumps(run_level(args.level, args.iterations, args.think)))
+        return 0
+
+    import streamlit
+
+    levels = []
+    print(f"{'sessions':>8}{'reruns':>8}{'errors':>8}{'reruns/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'svc ms':>9}{'base MB':>9}{'peak MB':>9}")
+    for sessions in args.sessions:
+        level = _run_level_process(sessions, args.iterations, args.think)
+        levels.append(level)
+        print(f"{sessions:>8}{level['reruns']:>8}{level['errors']:>8}{level['reruns_per_s']:>10.1f}"
+              f"{level['p50_ms']:>9.1f}{level['p95_ms']:>9.1f}{level['p99_ms']:>9.1f}{level['service_ms']:>9.1f}"
+              f"{level['baseline_rss_mb']:>9.0f}{level['peak_rss_mb']:>9.0f}")
+        for sample in level["error_samples"]:
+            print(f"{'':>8}error: {sample}")
+        if not level["shared_script_cache"]:
+            print(f"{'':>8}warning: app.py parsed on every rerun; AppTest internals differ from "
+                  f"Streamlit {SCRIPT_CACHE_CHECKED_WITH}")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "script_cache_checked_with": SCRIPT_CACHE_CHECKED_WITH,
+            "cpus": os.cpu_count(),
+        },
+        "iterations": args.iterations,
+        "think": args.think,
+        "levels": levels,
+    }
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Report written to {args.output}")
+    return 1 if any(level["errors"] for level in levels) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
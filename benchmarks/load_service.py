@@ -0,0 +1,155 @@
+"""Load test: requests per second and latency percentiles for components.service.
+
+Run from the repository root:
+
+    python -m benchmarks.load_service [--connections 32] [--duration 10] [--workers 1]
+    python -m benchmarks.load_service --url http://127.0.0.1:8765   # an already running server
+
+Without ``--url`` a server is started on a free localhost port for the
+run. Every scenario opens ``--connections`` keep-alive connections, each
+sending one request at a time for ``--duration`` seconds.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.suite import EMAIL_SIZES, SEED, make_email, make_prospects
+
+
+def _scenarios(rng: random.Random) -> dict[str, list[tuple[str, bytes]]]:
+    """Scenario name -> request pool of (path, JSON body), cycled by the clients."""
+    contexts = [context.to_dict() for context in make_prospects(rng, 200)]
+    small = make_email(rng, EMAIL_SIZES["500B"])
+    large = make_email(rng, EMAIL_SIZES["100KB"])
+
+    def body(obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    return {
+        "workflow": [("/v1/workflow", body(context)) for context in contexts],
+        "phase": [(f"/v1/phases/phase{n}", body(context)) for n, context in zip("12345" * 40, contexts)],
+        "email-templates": [("/v1/email-templates", body({"company_name": context["company_name"]}))
+                            for context in contexts],
+        "check[500B]": [("/v1/check", body({"text": small}))],
+        "check[100KB]": [("/v1/check", body({"text": large}))],
+        "workflow batch[50]": [("/v1/workflow", body(contexts[i:i + 50])) for i in range(0, 200, 50)],
+        "check batch[50x500B]": [("/v1/check", body([{"text": small}] * 50))],
+    }
+
+
+async def _client(host: str, port: int, requests: list[tuple[str, bytes]], deadline: float,
+                  latencies: list[float], errors: list[int], offset: int) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    i = offset
+    try:
+        while time.perf_counter() < deadline:
+            path, body = requests[i % len(requests)]
+            i += 1
+            started = time.perf_counter()
+            writer.write(
+                f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+            )
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(re.search(rb"(?i)content-length: *(\d+)", head).group(1))
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if not head.startswith(b"HTTP/1.1 200"):
+                errors.append(1)
+    finally:
+        writer.close()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run_scenario(host: str, port: int, requests: list[tuple[str, bytes]],
+                       connections: int, duration: float) -> dict[str, float]:
+    """Drive one scenario and return its throughput and latency figures."""
+    latencies: list[float] = []
+    errors: list[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _client(host, port, requests, deadline, latencies, errors, offset)
+        for offset in range(connections)
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+def _start_server(workers: int) -> tuple[subprocess.Popen, str, int]:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "components.service", "--port", "0", "--workers", str(workers)],
+        stderr=subprocess.PIPE, text=True,
+    )
+    line = process.stderr.readline()
+    match = re.search(r"http://([\d.]+):(\d+)", line)
+    if not match:
+        process.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    return process, match.group(1), int(match.group(2))
+
+
+async def _main(args: argparse.Namespace, host: str, port: int) -> dict[str, dict[str, float]]:
+    scenarios = _scenarios(random.Random(SEED))
+    results = {}
+    print(f"{'scenario':<24}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, requests in scenarios.items():
+        if args.only and not any(pattern in name for pattern in args.only):
+            continue
+        result = await run_scenario(host, port, requests, args.connections, args.duration)
+        results[name] = result
+        print(f"{name:<24}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10,.0f}"
+              f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Server to test (default: start one on a free port)")
+    parser.add_argument("--workers", type=int, default=1, help="Check workers for the started server")
+    parser.add_argument("--connections", "-c", type=int, default=32, help="Concurrent keep-alive connections")
+    parser.add_argument("--duration", "-d", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--only", nargs="+", help="Run only scenarios whose name contains one of these")
+    parser.add_argument("--output", "-o", help="Write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        process, host, port = _start_server(args.workers)
+    try:
+        results = asyncio.run(_main(args, host, port))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"connections": args.connections, "duration": args.duration, "results": results},
+                      handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""Performance benchmark suite with stored baselines.
+
+Run from the repository root:
+
+    python -m benchmarks.suite                      # run and print
+    python -m benchmarks.suite --output run.json    # also write results
+    python -m benchmarks.suite --save-baseline      # overwrite benchmarks/baseline.json
+    python -m benchmarks.suite --compare            # flag regressions against the baseline
+
+Every case runs against a fixed, seeded corpus of synthetic prospects and
+email texts, so numbers are comparable between runs on the same machine.
+Comparison mode exits with status 1 if any case is slower than the
+baseline by more than ``--threshold`` (default 20%) and by more than
+``--min-diff`` microseconds (default 1), so that timer noise on
+microsecond-scale cases is not reported as a regression. Cases that look
+slower are measured again in a new process (``--recheck`` rounds, default
+2) and keep their best time before anything is reported: on a shared
+machine the same case varies by up to ~50% between processes, far more
+than between repeats in one process.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from components.email_templates import EmailTemplateGenerator
+from components.presets import ProspectPreset
+from components.recipes import PromptRecipeManager, ProspectContext, _render_header
+from components.writing_checker import ZOMBIE_WORDS, check_plain_english
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+SEED = 1234
+
+INDUSTRIES = ["Financial Services", "Healthcare/Life Sciences", "Technology/Software", "Real Estate"]
+ENTITY_TYPES = ["Public Company (Listed)", "Private Company", "Private Equity Owned", "Partnership/LLP"]
+TRANSACTIONS = ["M&A (Buyer)", "M&A (Seller)", "IPO Preparation", "Regulatory Compliance Project"]
+SIZES = ["< $10M", "$10M - $50M", "$50M - $250M", "$1B - $5B"]
+REGIONS = ["United Kingdom", "European Union", "United States", "Asia-Pacific"]
+PRODUCTS = ["Lexis+ AI", "Practical Guidance", "Corporate Law Suite", "Due Diligence Tools"]
+EMAIL_SENTENCES = [
+    "I saw your team closed the acquisition last month.",
+    "The integration was delayed by the regulator.",
+    "We help firms leverage a seamless workflow for due diligence.",
+    "Would a short call on Tuesday work for you?",
+    "Your associates are spending hours on manual cite-checking.",
+    "The report was reviewed by three partners before filing.",
+    "Let's touch base and circle back on the low-hanging fruit.",
+    "Happy to share what a similar firm did.",
+]
+EMAIL_SIZES = {"500B": 500, "5KB": 5_000, "100KB": 100_000}
+
+# Cases faster than this are timed with more repeats: their best-of-5 still
+# moves by tens of percent between runs.
+FAST_CASE_US = 100.0
+FAST_CASE_REPEAT = 25
+RECHECK_ROUNDS = 2
+
+
+def make_prospects(rng: random.Random, count: int = 200) -> list[ProspectContext]:
+    """Synthetic prospects covering every header field."""
+    return [
+        ProspectContext(
+            company_name=f"Prospect {i} {rng.choice(['Holdings', 'LLP', 'Group', 'Ltd'])}",
+            industry_sector=rng.choice(INDUSTRIES),
+            transaction_type=rng.choice(TRANSACTIONS),
+            legal_entity_type=rng.choice(ENTITY_TYPES),
+            transaction_size=rng.choice(SIZES),
+            geographic_scope=", ".join(rng.sample(REGIONS, 2)),
+            deal_context=f"Cross-border deal number {i} under review.",
+            additional_notes=" ".join(rng.choices(EMAIL_SENTENCES, k=3)),
+            company_products=", ".join(rng.sample(PRODUCTS, 2)),
+        )
+        for i in range(count)
+    ]
+
+
+def make_email(rng: random.Random, size: int) -> str:
+    """Synthetic email text of roughly ``size`` characters."""
+    parts = []
+    length = 0
+    while length < size:
+        sentence = rng.choice(EMAIL_SENTENCES)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)[:size]
+
+
+def _repeat_for(us_per_op: float, repeat: int) -> int:
+    """Number of repeats for a case taking roughly ``us_per_op``."""
+    return max(repeat, FAST_CASE_REPEAT) if us_per_op < FAST_CASE_US else repeat
+
+
+def _measure(func: Callable[[], object], repeat: int = 5) -> dict[str, float]:
+    """
+    Best-of-``repeat`` timing, with the loop count picked by timeit.
+    
+    Cases under ``FAST_CASE_US`` get ``FAST_CASE_REPEAT`` repeats instead.
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    repeat = _repeat_for(elapsed / number * 1e6, repeat)
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {
+        "us_per_op": best * 1e6,
+        "ops_per_sec": 1 / best if best else float("inf"),
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def build_cases() -> dict[str, Callable[[], object]]:
+    """Benchmark name -> zero-argument callable, all over the seeded corpus."""
+    rng = random.Random(SEED)
+    prospects = make_prospects(rng)
+    emails = {name: make_email(rng, size) for name, size in EMAIL_SIZES.items()}
+    presets = [
+        ProspectPreset(
+            company_name=prospect.company_name,
+            company_url=f"https://example.com/{i}",
+            practice_area=prospect.transaction_type,
+            buyer_persona="General Counsel",
+            industry=prospect.industry_sector,
+            notes=prospect.additional_notes,
+        )
+        for i, prospect in enumerate(prospects)
+    ]
+    prospect = prospects[0]
+
+    def header_cold() -> None:
+        _render_header.cache_clear()
+        for context in prospects:
+            context.to_prompt_header()
+
+    def header_warm() -> None:
+        for context in prospects:
+            context.to_prompt_header()
+
+    def preset_round_trip() -> None:
+        for preset in presets:
+            ProspectPreset.from_json(json.loads(preset.to_json_bytes()))
+
+    cases: dict[str, Callable[[], object]] = {
+        "recipes.generate_full_workflow": lambda: PromptRecipeManager.generate_full_workflow(prospect),
+        "recipes.to_prompt_header[200 cold]": header_cold,
+        "recipes.to_prompt_header[200 warm]": header_warm,
+        "email_templates.generate_all_templates": lambda: EmailTemplateGenerator.generate_all_templates(
+            prospect.company_name
+        ),
+        "presets.json_round_trip[200]": preset_round_trip,
+    }
+    for name, text in emails.items():
+        cases[f"writing_checker.check_plain_english[{name}]"] = (
+            lambda text=text: check_plain_english(text)
+        )
+    return cases
+
+
+def run(selected: list[str] | None = None) -> dict:
+    """Run the suite and return a JSON-serializable report."""
+    results = {}
+    for name, func in build_cases().items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        results[name] = _measure(func)
+        print(f"{name:<50}{results[name]['us_per_op']:>14.2f} us/op", file=sys.stderr)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": SEED,
+            "zombie_words": len(ZOMBIE_WORDS),
+        },
+        "results": results,
+    }
+
+
+def _is_regression(us_per_op: float, base_us_per_op: float, threshold: float, min_diff_us: float) -> bool:
+    return us_per_op / base_us_per_op > 1 + threshold and us_per_op - base_us_per_op > min_diff_us
+
+
+def _measure_in_new_process(names: list[str]) -> dict[str, dict[str, float]]:
+    """Results for ``names`` from a fresh interpreter, whose memory layout differs from this one's."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--only", *names],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)["results"]
+
+
+def recheck(
+    report: dict,
+    baseline: dict,
+    threshold: float,
+    min_diff_us: float = 1.0,
+    rounds: int = RECHECK_ROUNDS,
+    measure: Callable[[list[str]], dict[str, dict[str, float]]] = _measure_in_new_process,
+) -> None:
+    """Measure the cases that look like regressions again, keeping each one's best result in ``report``."""
+    for _ in range(rounds):
+        suspects = [
+            name
+            for name, result in report["results"].items()
+            if name in baseline.get("results", {})
+            and _is_regression(result["us_per_op"], baseline["results"][name]["us_per_op"], threshold, min_diff_us)
+        ]
+        if not suspects:
+            return
+        results = measure(suspects)
+        for name in suspects:
+            result = results[name]
+            print(f"{name:<50}{result['us_per_op']:>14.2f} us/op (recheck)", file=sys.stderr)
+            if result["us_per_op"] < report["results"][name]["us_per_op"]:
+                report["results"][name] = result
+
+
+def compare(report: dict, baseline: dict, threshold: float, min_diff_us: float = 1.0) -> list[str]:
+    """
+    Return a line per case slower than baseline by more than ``threshold``.
+    
+    A case is only flagged when it is also slower by more than
+    ``min_diff_us`` microseconds per operation.
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<50}{'(no baseline)':>30}", file=sys.stderr)
+            continue
+        ratio = result["us_per_op"] / base["us_per_op"]
+        flag = "REGRESSION" if _is_regression(result["us_per_op"], base["us_per_op"], threshold, min_diff_us) else ""
+        print(f"{name:<50}{base['us_per_op']:>12.2f}{result['us_per_op']:>12.2f}{ratio:>8.2f}x {flag}",
+              file=sys.stderr)
+        if flag:
+            regressions.append(f"{name}: {ratio:.2f}x baseline")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the performance benchmark suite.")
+    parser.add_argument("--output", "-o", help="Write the JSON report to this file")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write the report to {BASELINE_PATH.name}")
+    parser.add_argument("--compare", nargs="?", const=str(BASELINE_PATH), metavar="BASELINE",
+                        help="Compare against a baseline report (default: the stored baseline)")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Allowed slowdown before a case is flagged (default: 0.20)")
+    parser.add_argument("--min-diff", type=float, default=1.0, metavar="US",
+                        help="Also require this many microseconds of slowdown per operation (default: 1)")
+    parser.add_argument("--recheck", type=int, default=RECHECK_ROUNDS, metavar="ROUNDS",
+                        help=f"Measure apparent regressions again up to this many times (default: {RECHECK_ROUNDS})")
+    parser.add_argument("--only", nargs="+", help="Run only cases whose name contains one of these")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    report = run(args.only)
+    print(f"Suite finished in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    if baseline is not None:
+        recheck(report, baseline, args.threshold, args.min_diff, args.recheck)
+
+    payload = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+    if args.save_baseline:
+        BASELINE_PATH.write_text(payload, encoding="utf-8")
+    if baseline is not None:
+        print(f"\n{'case':<50}{'baseline':>12}{'current':>12}{'ratio':>9}", file=sys.stderr)
+        regressions = compare(report, baseline, args.threshold, args.min_diff)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+    if not (args.output or args.save_baseline):
+        sys.stdout.write(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import local_script_runner
+
+from benchmarks.load_app import _latency_figures, _share_script_cache, run_level
+
+
+def test_latency_figures():
+    assert _latency_figures([]) == {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    assert _latency_figures([0.002]) == {"p50_ms": 2.0, "p95_ms": 2.0, "p99_ms": 2.0}
+    figures = _latency_figures([i / 1000 for i in range(1, 101)])
+    assert figures["p50_ms"] == pytest.approx(50.5)
+    assert figures["p99_ms"] == pytest.approx(99.01)
+
+
+def test_one_session_runs_the_flow_without_errors(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("APP_WARM_UP", "0")
+    # run_level shares one ScriptCache for the rest of the process; undo that afterwards
+    monkeypatch.setattr(local_script_runner, "ScriptCache", local_script_runner.ScriptCache)
+    st.cache_resource.clear()
+    try:
+        level = run_level(sessions=1, iterations=1, think=0)
+    finally:
+        st.cache_resource.clear()
+    assert level["errors"] == 0, level["error_samples"]
+    assert level["reruns"] == 11
+    assert level["shared_script_cache"]
+    assert set(level["actions"]) == {
+        "open page", "company name", "industry", "deal type", "regions", "notes",
+        "full workflow", "individual tab", "phase prompt", "reset",
+    }
+
+
+def test_script_cache_falls_back_when_streamlit_moves_it(monkeypatch):
+    monkeypatch.delattr(local_script_runner, "ScriptCache")
+    with pytest.warns(RuntimeWarning, match="parsed again on every rerun"):
+        assert _share_script_cache() is False
+    assert not hasattr(local_script_runner, "ScriptCache")
@@ -0,0 +1,38 @@
+from benchmarks.suite import FAST_CASE_REPEAT, FAST_CASE_US, _repeat_for, compare, recheck
+
+
+def _report(**us_per_op: float) -> dict:
+    return {"results": {name: {"us_per_op": value} for name, value in us_per_op.items()}}
+
+
+def test_compare_ignores_noise_on_microsecond_cases():
+    baseline = _report(email=2.0, workflow=400.0)
+    assert compare(_report(email=2.96, workflow=410.0), baseline, 0.20) == []
+
+
+def test_compare_flags_real_regressions():
+    baseline = _report(email=2.0, workflow=400.0)
+    regressions = compare(_report(email=4.0, workflow=600.0), baseline, 0.20)
+    assert regressions == ["email: 2.00x baseline", "workflow: 1.50x baseline"]
+    assert compare(_report(email=4.0), baseline, 0.20, min_diff_us=5.0) == []
+
+
+def test_fast_cases_get_more_repeats():
+    assert _repeat_for(FAST_CASE_US / 50, 5) == FAST_CASE_REPEAT
+    assert _repeat_for(FAST_CASE_US * 50, 5) == 5
+
+
+def test_recheck_keeps_the_best_measurement_of_a_suspect_case():
+    baseline = _report(noop=0.001, steady=400.0)
+    report = _report(noop=1000.0, steady=410.0)  # noop slowed by the machine during the first run
+    measured = []
+
+    def measure(names):
+        measured.append(names)
+        return {name: {"us_per_op": 0.5} for name in names}
+
+    recheck(report, baseline, 0.20, measure=measure)
+    assert measured == [["noop"]]
+    assert report["results"]["noop"] == {"us_per_op": 0.5}
+    assert report["results"]["steady"] == {"us_per_op": 410.0}
+    assert compare(report, baseline, 0.20) == []
@@ -1,27 +1,133 @@
-"""Components package for Legal Tech Sales Prospecting Tool."""
+"""
+Components package for Legal Tech Sales Prospecting Tool.
 
-from .email_templates import EmailTemplate, EmailTemplateGenerator
-from .presets import ProspectPreset, export_preset_bytes, load_preset_into_state
-from .recipes import ProspectContext, PromptRecipeManager
-from .writing_checker import WritingAnalysis, WritingIssue, check_plain_english, get_writing_tips
+Submodules are imported on first attribute access, so
+``from components import PromptRecipeManager`` loads only the recipe
+engine. Nothing outside the Streamlit helpers in presets imports
+Streamlit.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # Workflow cache
+    "WORKFLOW_CACHE": "cache",
+    "LRUCache": "cache",
+    "context_fingerprint": "cache",
+    "get_cached_prompt": "cache",
+    "get_cached_workflow": "cache",
+    "invalidate_workflow_cache": "cache",
+    "iter_cached_workflow": "cache",
+
+    # Dossier archive
+    "DOSSIER_CACHE": "dossier",
+    "build_dossier": "dossier",
+    "get_dossier": "dossier",
 
-__all__ = [
     # Email templates
-    "EmailTemplate",
-    "EmailTemplateGenerator",
-    
+    "EmailTemplate": "email_templates",
+    "EmailTemplateGenerator": "email_templates",
+
+    # Language packs
+    "LanguagePack": "language_packs",
+    "available_locales": "language_packs",
+    "get_language_pack": "language_packs",
+
+    # OUS scoring
+    "OUSPortfolio": "ous_scoring",
+    "parse_ous_response": "ous_scoring",
+    "rank_accounts": "ous_scoring",
+
     # Presets
-    "ProspectPreset",
-    "export_preset_bytes",
-    "load_preset_into_state",
-    
+    "ImportReport": "preset_io",
+    "PresetStore": "preset_store",
+    "ProspectPreset": "presets",
+    "export_preset_bytes": "presets",
+    "iter_presets_jsonl": "preset_io",
+    "load_preset_into_state": "presets",
+    "write_presets_jsonl": "preset_io",
+
     # Recipes
-    "ProspectContext",
-    "PromptRecipeManager",
-    
+    "ProspectBatch": "recipes",
+    "ProspectContext": "recipes",
+    "PromptRecipeManager": "recipes",
+
+    # Shared resources
+    "WarmUp": "resources",
+    "warm_up": "resources",
+
+    # Session outputs
+    "SessionOutputStore": "session_store",
+    "StoredOutput": "session_store",
+
+    # Token budgets
+    "FittedPrompt": "tokens",
+    "estimate_tokens": "tokens",
+    "fit_prompt": "tokens",
+    "fit_workflow": "tokens",
+    "prompt_tokens": "tokens",
+
     # Writing checker
-    "WritingAnalysis",
-    "WritingIssue",
-    "check_plain_english",
-    "get_writing_tips",
-]
+    "BatchWritingReport": "writing_checker",
+    "IncrementalAnalyzer": "writing_checker",
+    "JargonMatcher": "writing_checker",
+    "WritingAnalysis": "writing_checker",
+    "WritingIssue": "writing_checker",
+    "check_plain_english": "writing_checker",
+    "check_plain_english_many": "writing_checker",
+    "get_writing_tips": "writing_checker",
+    "iter_writing_issues": "writing_checker",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .cache import (
+        WORKFLOW_CACHE,
+        LRUCache,
+        context_fingerprint,
+        get_cached_prompt,
+        get_cached_workflow,
+        invalidate_workflow_cache,
+        iter_cached_workflow,
+    )
+    from .dossier import DOSSIER_CACHE, build_dossier, get_dossier
+    from .email_templates import EmailTemplate, EmailTemplateGenerator
+    from .language_packs import LanguagePack, available_locales, get_language_pack
+    from .ous_scoring import OUSPortfolio, parse_ous_response, rank_accounts
+    from .preset_io import ImportReport, iter_presets_jsonl, write_presets_jsonl
+    from .preset_store import PresetStore
+    from .presets import ProspectPreset, export_preset_bytes, load_preset_into_state
+    from .recipes import ProspectBatch, ProspectContext, PromptRecipeManager
+    from .resources import WarmUp, warm_up
+    from .session_store import SessionOutputStore, StoredOutput
+    from .tokens import FittedPrompt, estimate_tokens, fit_prompt, fit_workflow, prompt_tokens
+    from .writing_checker import (
+        BatchWritingReport,
+        IncrementalAnalyzer,
+        JargonMatcher,
+        WritingAnalysis,
+        WritingIssue,
+        check_plain_english,
+        check_plain_english_many,
+        get_writing_tips,
+        iter_writing_issues,
+    )
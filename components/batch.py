@@ -0,0 +1,162 @@
+"""
+Headless batch generator for prospect prompt dossiers.
+
+Usage:
+    python -m components.batch prospects.csv --output prompts.jsonl --workers 8
+    python -m components.batch prospects.jsonl --output-dir dossiers/
+
+Input rows use the ProspectContext.from_dict field names. CSV files need a
+header row; JSONL files hold one JSON object per line.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from .recipes import PromptRecipeManager, ProspectContext
+
+T = TypeVar("T")
+
+
+def iter_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Stream rows from a CSV or JSONL file as dictionaries.
+
+    The format is picked from the file extension (.csv, otherwise JSONL).
+    A leading byte order mark, as written by Excel and CRM exports, is
+    dropped. Blank JSONL lines are skipped; malformed ones raise
+    ValueError with the line number.
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        if path.suffix.lower() == ".csv":
+            yield from csv.DictReader(handle)
+            return
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object")
+            yield record
+
+
+def render_record(item: tuple[int, dict[str, Any]]) -> tuple[int, str, dict[str, str]]:
+    """Render every phase for one (row_index, record) pair."""
+    index, record = item
+    context = ProspectContext.from_dict(record)
+    return index, context.company_name, PromptRecipeManager.generate_full_workflow(context)
+
+
+def render_jsonl_line(item: tuple[int, dict[str, Any]]) -> str:
+    """Render one record and serialize it as a JSONL line (without newline)."""
+    index, company_name, prompts = render_record(item)
+    return json.dumps(
+        {"row": index, "company_name": company_name, "prompts": prompts},
+        ensure_ascii=False,
+    )
+
+
+def _slugify(name: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")
+    return slug[:60] or "prospect"
+
+
+class DirectoryTask:
+    """Render one record and write a folder with a text file per phase."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def __call__(self, item: tuple[int, dict[str, Any]]) -> str:
+        index, company_name, prompts = render_record(item)
+        folder = self.root / f"{index:06d}_{_slugify(company_name)}"
+        folder.mkdir(exist_ok=True)
+        for phase_id, prompt in prompts.items():
+            (folder / f"{phase_id}.txt").write_text(prompt, encoding="utf-8")
+        return str(folder)
+
+
+def run_batch(
+    records: Iterable[dict[str, Any]],
+    task: Callable[[tuple[int, dict[str, Any]]], T],
+    *,
+    workers: int = 1,
+    chunksize: int = 64,
+) -> Iterator[T]:
+    """
+    Apply ``task`` to every (row_index, record) pair, yielding results as they finish.
+
+    Serialization and file writes happen inside ``task`` so the parent
+    process only streams results. With more than one worker, results
+    arrive in completion order rather than input order.
+    """
+    items = enumerate(records)
+    if workers <= 1:
+        yield from map(task, items)
+        return
+
+    with multiprocessing.Pool(processes=workers) as pool:
+        yield from pool.imap_unordered(task, items, chunksize=chunksize)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m components.batch",
+        description="Render every workflow phase for each prospect in a CSV or JSONL file.",
+    )
+    parser.add_argument("input", help="CSV (with header row) or JSONL file of prospects")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--output", "-o", help="JSONL file to write, or - for stdout")
+    target.add_argument("--output-dir", help="Directory for one folder of phase files per prospect")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count; 1 runs in-process)",
+    )
+    parser.add_argument("--chunksize", type=int, default=64, help="Rows sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    records = iter_records(args.input)
+    started = time.perf_counter()
+    count = 0
+    try:
+        if args.output_dir:
+            Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+            for _ in run_batch(records, DirectoryTask(args.output_dir),
+                               workers=args.workers, chunksize=args.chunksize):
+                count += 1
+        else:
+            handle = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+            try:
+                for line in run_batch(records, render_jsonl_line,
+                                      workers=args.workers, chunksize=args.chunksize):
+                    handle.write(line)
+                    handle.write("\n")
+                    count += 1
+            finally:
+                if handle is not sys.stdout:
+                    handle.close()
+    except (OSError, ValueError) as e:
+        print(f"error: {e} (after {count} rows)", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"Rendered {count} prospects in {elapsed:.2f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
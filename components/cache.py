@@ -0,0 +1,236 @@
+"""Process-wide LRU cache for generated prompt workflows."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator
+
+from .metrics import Sample, register_collector
+from .recipes import (
+    DEFAULT_LOCALE,
+    PHASE_REGISTRY,
+    PromptRecipeManager,
+    ProspectContext,
+    recipe_fingerprint,
+)
+
+# Defaults, overridable per deployment through the environment
+DEFAULT_MAX_ENTRIES = int(os.environ.get("PROMPT_CACHE_MAX_ENTRIES", "2048"))
+DEFAULT_MAX_BYTES = int(os.environ.get("PROMPT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _sizeof_prompts(prompts: dict[str, str]) -> int:
+    """Approximate memory held by a phase_id -> prompt mapping."""
+    return sys.getsizeof(prompts) + sum(
+        sys.getsizeof(key) + sys.getsizeof(value) for key, value in prompts.items()
+    )
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count and by total size.
+    
+    Streamlit serves every session from threads in one process, so a
+    module-level instance is shared by all sessions.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._sizeof = sizeof
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key`` (marking it recently used) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting least recently used entries."""
+        size = self._sizeof(value)
+        with self._lock:
+            if size > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def configure(self, *, max_entries: int | None = None, max_bytes: int | None = None) -> None:
+        """Change the limits at runtime; shrinking evicts immediately."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return a consistent snapshot of the counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        # Caller holds the lock
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+def context_fingerprint(context: ProspectContext) -> str:
+    """Stable hash of every ProspectContext field, usable across processes."""
+    payload = json.dumps(context.field_values(), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+WORKFLOW_CACHE = LRUCache(sizeof=_sizeof_prompts)
+
+
+def _recipe_sources() -> tuple[tuple[str, str], ...]:
+    return tuple((phase_id, template.source) for phase_id, template in PHASE_REGISTRY.items())
+
+
+def cache_stats_samples(cache: str, stats: CacheStats) -> Iterator[Sample]:
+    """Samples for an LRUCache ``stats()`` snapshot."""
+    labels = (("cache", cache),)
+    yield Sample("cache_hits_total", "counter", "Cache lookups answered from the cache", labels, stats.hits)
+    yield Sample("cache_misses_total", "counter", "Cache lookups that had to build the value", labels, stats.misses)
+    yield Sample("cache_entries", "gauge", "Entries held by the cache", labels, stats.entries)
+    yield Sample("cache_evictions_total", "counter", "Entries evicted to stay within the limits", labels, stats.evictions)
+    yield Sample("cache_bytes", "gauge", "Approximate memory held by the cache", labels, stats.bytes)
+
+
+@register_collector
+def _workflow_cache_samples():
+    return cache_stats_samples("workflow", WORKFLOW_CACHE.stats())
+
+
+# Fingerprint of the recipe text the cached entries were built from, and
+# the (phase_id, source) pairs it was computed over. Comparing the pairs is
+# cheap (unchanged sources are the same string objects), so every lookup
+# checks them and only re-hashes when a template was re-registered or edited.
+_cached_recipe_version = recipe_fingerprint()
+_cached_recipe_sources = _recipe_sources()
+_version_lock = threading.Lock()
+
+
+def invalidate_workflow_cache() -> None:
+    """Drop all cached workflows and language packs, e.g. after editing recipe text."""
+    from .language_packs import clear_language_packs
+
+    global _cached_recipe_version, _cached_recipe_sources
+    with _version_lock:
+        _cached_recipe_sources = _recipe_sources()
+        _cached_recipe_version = recipe_fingerprint()
+        clear_language_packs()
+        WORKFLOW_CACHE.clear()
+
+
+def _recipe_version() -> str:
+    """Fingerprint of the current recipe text; invalidates the cache when it changed."""
+    if _recipe_sources() != _cached_recipe_sources:
+        invalidate_workflow_cache()
+    return _cached_recipe_version
+
+
+def _workflow_key(context: ProspectContext, locale: str) -> tuple[str, str, str]:
+    return _recipe_version(), locale, context_fingerprint(context)
+
+
+def get_cached_workflow(context: ProspectContext, locale: str = DEFAULT_LOCALE) -> dict[str, str]:
+    """Return the full workflow for ``context``, generating it on a cache miss."""
+    key = _workflow_key(context, locale)
+    prompts = WORKFLOW_CACHE.get(key)
+    if prompts is None:
+        prompts = PromptRecipeManager.generate_full_workflow(context, locale)
+        WORKFLOW_CACHE.put(key, prompts)
+    return dict(prompts)
+
+
+def iter_cached_workflow(context: ProspectContext, locale: str = DEFAULT_LOCALE) -> Iterator[tuple[str, str]]:
+    """
+    Yield (phase_id, prompt) pairs, from the cache when possible.
+    
+    On a miss the phases are yielded as they are built and the completed
+    workflow is stored once the last phase has been produced.
+    """
+    key = _workflow_key(context, locale)
+    prompts = WORKFLOW_CACHE.get(key)
+    if prompts is not None:
+        yield from list(prompts.items())
+        return
+
+    built: dict[str, str] = {}
+    for phase_id, prompt in PromptRecipeManager.iter_workflow(context, locale):
+        built[phase_id] = prompt
+        yield phase_id, prompt
+    WORKFLOW_CACHE.put(key, built)
+
+
+def get_cached_prompt(phase_id: str, context: ProspectContext, locale: str = DEFAULT_LOCALE) -> str:
+    """Return one phase, from a cached workflow if present; never fills the cache."""
+    prompts = WORKFLOW_CACHE.get(_workflow_key(context, locale))
+    if prompts is not None and phase_id in prompts:
+        return prompts[phase_id]
+    return PromptRecipeManager.render(phase_id, context, locale)
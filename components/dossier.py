@@ -0,0 +1,186 @@
+"""
+Prospect dossier: the whole workflow as one zip archive.
+
+The prospect header is stored once, in header.md. Each phase file holds
+only the phase body, with HEADER_MARKER where the header goes, so a long
+header is not repeated seven times. The archive also holds both email
+templates, filled in with the company name, and report.md: token
+estimates per phase and a plain-English check of the emails.
+
+The app passes the prompts it shows, which may have been fitted to a
+token budget. A phase whose header was shortened holds its whole prompt,
+since its header differs from header.md.
+
+Archives are built on first request and kept in DOSSIER_CACHE, keyed like
+the workflow cache (recipe version, locale, context fingerprint) plus a
+fingerprint of any prompts passed in. The same inputs always give the
+same bytes.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+import zipfile
+
+from .cache import LRUCache, _workflow_key, cache_stats_samples
+from .email_templates import EmailTemplate, EmailTemplateGenerator
+from .metrics import register_collector
+from .recipes import DEFAULT_LOCALE, PromptTemplate, ProspectContext, _localized
+from .tokens import _body_tokens, header_tokens, prompt_tokens
+from .writing_checker import check_plain_english
+
+HEADER_FILE = "header.md"
+HEADER_MARKER = "<!-- paste header.md here -->\n\n"
+# Fixed timestamp, so the archive bytes depend only on the contents
+_ZIP_DATE = (2024, 1, 1, 0, 0, 0)
+
+DOSSIER_CACHE = LRUCache(
+    max_entries=int(os.environ.get("PROMPT_DOSSIER_CACHE_MAX_ENTRIES", "128")),
+    max_bytes=int(os.environ.get("PROMPT_DOSSIER_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+    sizeof=len,
+)
+
+
+@register_collector
+def _dossier_cache_samples():
+    return cache_stats_samples("dossier", DOSSIER_CACHE.stats())
+
+
+_README = """# Prospect dossier: {company}
+
+Each file in phases/ is one prompt without the prospect header. To use a
+phase, replace the line
+
+    {marker}
+at its top with the contents of header.md, then paste the result into
+your AI tool. Phases without that line were shortened to fit a token
+budget and already hold their whole prompt. Run the phases in file
+order. See report.md for the size of each prompt and a plain-English
+check of the email templates in emails/.
+"""
+
+
+def dossier_filename(context: ProspectContext) -> str:
+    """Download name for the dossier of ``context``."""
+    slug = re.sub(r"[^\w-]+", "_", context.company_name).strip("_")
+    return f"dossier_{slug or 'prospect'}.zip"
+
+
+def _phase_path(number: int, phase_id: str) -> str:
+    return f"phases/{number:02d}_{phase_id}.md"
+
+
+def _email_markdown(template: EmailTemplate) -> str:
+    return (
+        f"# {template.name}\n\n"
+        f"**When to use:** {template.when_to_use}\n\n"
+        f"**Subject:** {template.subject}\n\n"
+        f"{template.body}\n"
+    )
+
+
+def _report(
+    context: ProspectContext,
+    locale: str,
+    templates: dict[str, PromptTemplate],
+    labels: tuple[str, ...] | None,
+    emails: dict[str, EmailTemplate],
+    prompts: dict[str, str] | None,
+) -> str:
+    header = header_tokens(context, labels)
+    lines = [
+        f"# Dossier report: {context.company_name}",
+        "",
+        "## Prompts",
+        "",
+        f"The shared header ({HEADER_FILE}) is about {header:,} tokens.",
+        "",
+        "| Phase | File | Tokens with header |",
+        "| --- | --- | ---: |",
+    ]
+    for number, phase_id in enumerate(templates, 1):
+        if prompts is None:
+            tokens = header + _body_tokens(phase_id, locale)
+        else:
+            tokens = prompt_tokens(prompts[phase_id])
+        lines.append(f"| {number} | {_phase_path(number, phase_id)} | {tokens:,} |")
+
+    lines += ["", "## Plain-English check of the email templates"]
+    for key, email in emails.items():
+        analysis = check_plain_english(email.body)
+        grade, emoji = analysis.grade_info
+        lines += ["", f"### {email.name} (emails/{key}.md)", "", f"{emoji} Score {analysis.score}/100, grade {grade}"]
+        if not analysis.has_issues:
+            lines.append("- No zombie words or passive voice found")
+        for issue in analysis.zombie_words:
+            lines.append(f'- Zombie word "{issue.text}": {issue.suggestion}')
+        for issue in analysis.passive_voice:
+            lines.append(f'- Passive voice "{issue.text}": {issue.suggestion}')
+    return "\n".join(lines) + "\n"
+
+
+def build_dossier(
+    context: ProspectContext,
+    locale: str = DEFAULT_LOCALE,
+    prompts: dict[str, str] | None = None,
+) -> bytes:
+    """
+    The dossier zip for ``context``, built without the cache.
+
+    ``prompts`` (phase_id -> prompt) are the prompts as shown, e.g. fitted
+    to a token budget; by default every phase uses the full header.
+    Raises KeyError for unknown locales.
+    """
+    templates, labels = _localized(locale)
+    emails = EmailTemplateGenerator.generate_all_templates(context.company_name or "[Company]")
+    header = context.to_prompt_header(labels)
+
+    files = {
+        "README.md": _README.format(company=context.company_name, marker=HEADER_MARKER.strip()),
+        HEADER_FILE: header,
+    }
+    for number, (phase_id, template) in enumerate(templates.items(), 1):
+        prompt = None if prompts is None else prompts[phase_id]
+        if prompt is None or prompt == template.splice(header):
+            files[_phase_path(number, phase_id)] = template.splice(HEADER_MARKER)
+        else:
+            files[_phase_path(number, phase_id)] = prompt
+    for key, email in emails.items():
+        files[f"emails/{key}.md"] = _email_markdown(email)
+    files["report.md"] = _report(context, locale, templates, labels, emails, prompts)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, text in files.items():
+            info = zipfile.ZipInfo(path, _ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, text.encode("utf-8"))
+    return buffer.getvalue()
+
+
+def _prompts_fingerprint(prompts: dict[str, str] | None) -> str:
+    if prompts is None:
+        return ""
+    digest = hashlib.sha256()
+    for phase_id, prompt in prompts.items():
+        digest.update(phase_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_dossier(
+    context: ProspectContext,
+    locale: str = DEFAULT_LOCALE,
+    prompts: dict[str, str] | None = None,
+) -> bytes:
+    """The dossier zip for ``context`` and ``prompts``, from DOSSIER_CACHE when possible."""
+    key = (*_workflow_key(context, locale), _prompts_fingerprint(prompts))
+    archive = DOSSIER_CACHE.get(key)
+    if archive is None:
+        archive = build_dossier(context, locale, prompts)
+        DOSSIER_CACHE.put(key, archive)
+    return archive
@@ -3,6 +3,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+# Arguments of EmailTemplateGenerator.generate_all_templates, i.e. the mail-merge fields
+TEMPLATE_FIELDS = (
+    "company_name",
+    "outcome",
+    "pain_point",
+    "specific_challenge",
+    "similar_client",
+    "solution_approach",
+    "buyer_name",
+)
+
 
 @dataclass
 class EmailTemplate:
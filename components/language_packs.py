@@ -0,0 +1,93 @@
+"""
+Language packs for prompts in languages other than English.
+
+Each locale is a JSON file in components/locales/<locale>.json:
+
+    {
+      "header_labels": {"company_name": "...", ..., "general_context": "..."},
+      "response_instruction": "Asks the model to answer in this language",
+      "phases": {"phase1": "{header}...full translated template..."}
+    }
+
+Missing header labels fall back to English. Phases without a translation
+use the English template with the response instruction placed after the
+header. A pack is read the first time its locale is used, compiled into
+PromptTemplates once, and shared by every session in the process.
+English is built in and has no file.
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from .metrics import cache_info_samples, register_collector
+from .recipes import (
+    DEFAULT_LOCALE,
+    HEADER_LABEL_KEYS,
+    HEADER_LABELS,
+    PHASE_REGISTRY,
+    PromptTemplate,
+)
+
+LOCALES_DIR = Path(__file__).with_name("locales")
+
+_LOCALE_PATTERN = re.compile(r"[A-Za-z]{2,3}(-[A-Za-z0-9]{2,8})*")
+
+
+@dataclass(frozen=True, eq=False)
+class LanguagePack:
+    """Compiled prompt templates and header labels for one locale."""
+    locale: str
+    header_labels: tuple[str, ...]
+    templates: dict[str, PromptTemplate]
+
+
+def available_locales() -> list[str]:
+    """Every locale that can be rendered; only lists files, does not load them."""
+    return [DEFAULT_LOCALE] + sorted(path.stem for path in LOCALES_DIR.glob("*.json"))
+
+
+@lru_cache(maxsize=None)
+def get_language_pack(locale: str) -> LanguagePack:
+    """
+    Load and compile the pack for ``locale`` on first use; later calls are cached.
+
+    Raises KeyError for locales without a pack file.
+    """
+    if locale == DEFAULT_LOCALE:
+        return LanguagePack(locale, HEADER_LABELS, dict(PHASE_REGISTRY))
+    path = LOCALES_DIR / f"{locale}.json"
+    if not _LOCALE_PATTERN.fullmatch(locale) or not path.is_file():
+        raise KeyError(f"no language pack for locale {locale!r}")
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    labels = data.get("header_labels", {})
+    header_labels = tuple(
+        labels.get(key) or english for key, english in zip(HEADER_LABEL_KEYS, HEADER_LABELS)
+    )
+
+    # Escape braces so the instruction is literal text in the template
+    instruction = data.get("response_instruction", "").replace("{", "{{").replace("}", "}}")
+    translations = data.get("phases", {})
+    templates = {}
+    for phase_id, template in PHASE_REGISTRY.items():
+        source = translations.get(phase_id)
+        if source is None:
+            source = template.source
+            if instruction:
+                source = source.replace("{header}", "{header}" + instruction + "\n\n", 1)
+        templates[phase_id] = PromptTemplate(source)
+    return LanguagePack(locale, header_labels, templates)
+
+
+@register_collector
+def _pack_cache_samples():
+    return cache_info_samples("language_pack", get_language_pack.cache_info())
+
+
+def clear_language_packs() -> None:
+    """Forget loaded packs, e.g. after editing a locale file or the phase templates."""
+    get_language_pack.cache_clear()
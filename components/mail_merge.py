@@ -0,0 +1,111 @@
+"""
+Mail merge: render email templates A and B for every recipient in a list.
+
+Usage:
+    python -m components.mail_merge recipients.csv --output drafts.jsonl
+    python -m components.mail_merge recipients.jsonl --output drafts.jsonl --check --workers 4
+
+Rows use the generate_all_templates argument names (company_name,
+outcome, pain_point, specific_challenge, similar_client,
+solution_approach, buyer_name). Only company_name is required; blank
+fields keep the template's [placeholder] text. Each output line holds
+the row number, the subject and body of both drafts, and with --check
+their plain-English analysis.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any
+
+from .batch import iter_records, run_batch
+from .email_templates import TEMPLATE_FIELDS, EmailTemplateGenerator
+from .writing_checker import IncrementalAnalyzer
+
+# One analyzer per template in each process. Drafts from the same template
+# share most sentences, so only the merged-in sentences are re-checked.
+_analyzers: dict[str, IncrementalAnalyzer] = {}
+
+
+def merge_record(record: dict[str, Any], check: bool = False) -> dict[str, Any]:
+    """
+    Render both templates for one recipient.
+
+    Raises ValueError if company_name is missing or blank.
+    """
+    values = {name: str(record[name]) for name in TEMPLATE_FIELDS if record.get(name)}
+    if not values.get("company_name", "").strip():
+        raise ValueError("company_name is required")
+
+    merged: dict[str, Any] = {"company_name": values["company_name"]}
+    for key, template in EmailTemplateGenerator.generate_all_templates(**values).items():
+        draft: dict[str, Any] = {"subject": template.subject, "body": template.body}
+        if check:
+            analyzer = _analyzers.get(key)
+            if analyzer is None:
+                analyzer = _analyzers[key] = IncrementalAnalyzer()
+            draft["check"] = analyzer.analyze(template.body).to_dict()
+        merged[key] = draft
+    return merged
+
+
+class MergeTask:
+    """Merge one (row_index, record) pair into (merged ok, JSONL line without newline)."""
+
+    def __init__(self, check: bool = False):
+        self.check = check
+
+    def __call__(self, item: tuple[int, dict[str, Any]]) -> tuple[bool, str]:
+        index, record = item
+        try:
+            line, ok = {"row": index, **merge_record(record, self.check)}, True
+        except ValueError as e:
+            line, ok = {"row": index, "error": str(e)}, False
+        return ok, json.dumps(line, ensure_ascii=False)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m components.mail_merge",
+        description="Render email templates A and B for each recipient in a CSV or JSONL file.",
+    )
+    parser.add_argument("input", help="CSV (with header row) or JSONL file of recipients")
+    parser.add_argument("--output", "-o", required=True, help="JSONL file to write, or - for stdout")
+    parser.add_argument("--check", action="store_true", help="Run the plain-English check on every draft")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count; 1 runs in-process)",
+    )
+    parser.add_argument("--chunksize", type=int, default=256, help="Rows sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count = errors = 0
+    handle = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for ok, line in run_batch(iter_records(args.input), MergeTask(args.check),
+                              workers=args.workers, chunksize=args.chunksize):
+            handle.write(line)
+            handle.write("\n")
+            count += 1
+            errors += not ok
+    except (OSError, ValueError) as e:
+        print(f"error: {e} (after {count} rows)", file=sys.stderr)
+        return 1
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    elapsed = time.perf_counter() - started
+
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"Merged {count - errors} recipients ({errors} rows without company_name) "
+          f"in {elapsed:.2f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
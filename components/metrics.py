@@ -0,0 +1,268 @@
+"""
+Timers and counters for the prompt builder, exported in Prometheus text format.
+
+Metrics are off unless PROMPT_METRICS=1 is set before the components are
+imported. When off, ``timed`` returns the decorated function itself and
+the instrumented code runs exactly as it would without it.
+
+When on, a ``timed`` function counts every call but measures only one
+call in PROMPT_METRICS_SAMPLE (default 16); the exported ``_sum`` is the
+mean of the measured calls times the call count. Cache statistics are
+read from the caches when metrics are exported, so lookups cost nothing
+extra. Each process has its own metrics: checks run in the service's
+worker pool are not included.
+
+Export:
+    render_prometheus()              text for a scrape or the admin panel
+    write_textfile(path)             atomic write, e.g. for node_exporter's
+                                     textfile collector
+    PROMPT_METRICS_FILE=path         the app rewrites this file after reruns
+    GET /metrics                     on components.service
+"""
+from __future__ import annotations
+
+import functools
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, TypeVar
+
+ENABLED = os.environ.get("PROMPT_METRICS", "").lower() in ("1", "true", "yes", "on")
+SAMPLE_EVERY = max(1, int(os.environ.get("PROMPT_METRICS_SAMPLE", "16")))
+TEXTFILE_PATH = os.environ.get("PROMPT_METRICS_FILE", "")
+NAMESPACE = "prompt_builder"
+
+F = TypeVar("F", bound=Callable)
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class Sample:
+    """One exported value: ``name`` is without the namespace prefix."""
+    name: str
+    kind: str  # "counter", "gauge" or "summary"
+    help: str
+    labels: Labels
+    value: float
+    suffix: str = ""  # "_count" or "_sum" for summaries
+
+
+class Timer:
+    """Call count plus the total of the measured calls for one label set."""
+
+    __slots__ = ("calls", "_reads", "_measured", "_total", "_lock")
+
+    def __init__(self):
+        self.calls = itertools.count()  # next() is atomic, so calls need no lock
+        self._reads = 0
+        self._measured = 0
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        """Add a measured call that was already counted with ``next(calls)``."""
+        with self._lock:
+            self._measured += 1
+            self._total += seconds
+
+    def observe(self, seconds: float) -> None:
+        """Count and add one call."""
+        next(self.calls)
+        self.add(seconds)
+
+    def snapshot(self) -> tuple[int, float]:
+        """(call count, estimated total seconds)."""
+        with self._lock:
+            count = next(self.calls) - self._reads
+            self._reads += 1
+            total = self._total * count / self._measured if self._measured else 0.0
+        return count, total
+
+
+class Counter:
+    """A value that only goes up, for one label set."""
+
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Registry:
+    """Named counters and timers plus collectors that report cache statistics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: dict[str, str] = {}
+        self._counters: dict[tuple[str, Labels], Counter] = {}
+        self._timers: dict[tuple[str, Labels], Timer] = {}
+        self._collectors: list[Callable[[], Iterable[Sample]]] = []
+
+    def timer(self, name: str, help: str = "", **labels: str) -> Timer:
+        """Return the timer for ``name`` and ``labels``, creating it on first use."""
+        return self._get(self._timers, Timer, name, help, labels)
+
+    def counter(self, name: str, help: str = "", **labels: str) -> Counter:
+        """Return the counter for ``name`` and ``labels``, creating it on first use."""
+        return self._get(self._counters, Counter, name, help, labels)
+
+    def _get(self, series: dict, factory: type, name: str, help: str, labels: dict[str, str]):
+        key = (name, tuple(sorted((key, str(value)) for key, value in labels.items())))
+        metric = series.get(key)
+        if metric is None:
+            with self._lock:
+                self._help.setdefault(name, help)
+                metric = series.setdefault(key, factory())
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Call ``collector`` on every export; it yields Samples read from elsewhere."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> Iterator[Sample]:
+        """Every current value, counters first, then timers, then collected samples."""
+        with self._lock:
+            counters = list(self._counters.items())
+            timers = list(self._timers.items())
+            collectors = list(self._collectors)
+            described = dict(self._help)
+        for (name, labels), counter in counters:
+            yield Sample(name, "counter", described[name], labels, counter.value)
+        for (name, labels), timer in timers:
+            count, total = timer.snapshot()
+            yield Sample(name, "summary", described[name], labels, count, "_count")
+            yield Sample(name, "summary", described[name], labels, total, "_sum")
+        for collector in collectors:
+            yield from collector()
+
+    def reset(self) -> None:
+        """Forget counters and timers (collectors are kept)."""
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+REGISTRY = Registry()
+
+
+def timed(name: str, help: str = "", **labels: str) -> Callable[[F], F]:
+    """
+    Decorator recording calls to the function in the ``name`` summary (seconds).
+
+    Returns the function unchanged when metrics are disabled.
+    """
+    def decorate(func: F) -> F:
+        if not ENABLED:
+            return func
+        timer = REGISTRY.timer(name, help, **labels)
+        tick, add, every, clock = timer.calls.__next__, timer.add, SAMPLE_EVERY, time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if tick() % every:
+                # Forwarding an empty **kwargs costs more than the rest of the wrapper
+                return func(*args, **kwargs) if kwargs else func(*args)
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add(clock() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def observe(name: str, seconds: float, help: str = "", **labels: str) -> None:
+    """
+    Record one duration measured by the caller; does nothing when metrics are disabled.
+
+    Looks the timer up on every call; hot callers keep ``REGISTRY.timer(...)``.
+    """
+    if ENABLED:
+        REGISTRY.timer(name, help, **labels).observe(seconds)
+
+
+def inc(name: str, amount: float = 1, help: str = "", **labels: str) -> None:
+    """Add to a counter; does nothing when metrics are disabled."""
+    if ENABLED:
+        REGISTRY.counter(name, help, **labels).inc(amount)
+
+
+def register_collector(collector: Callable[[], Iterable[Sample]]) -> Callable[[], Iterable[Sample]]:
+    """Register a collector on the default registry; usable as a decorator."""
+    REGISTRY.register_collector(collector)
+    return collector
+
+
+def cache_info_samples(cache: str, info) -> Iterator[Sample]:
+    """Samples for a functools.lru_cache ``cache_info()`` result."""
+    labels = (("cache", cache),)
+    yield Sample("cache_hits_total", "counter", "Cache lookups answered from the cache", labels, info.hits)
+    yield Sample("cache_misses_total", "counter", "Cache lookups that had to build the value", labels, info.misses)
+    yield Sample("cache_entries", "gauge", "Entries held by the cache", labels, info.currsize)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(registry: Registry = REGISTRY) -> str:
+    """Every metric in the Prometheus text exposition format (version 0.0.4)."""
+    grouped: dict[str, list[Sample]] = {}
+    for sample in registry.collect():
+        grouped.setdefault(sample.name, []).append(sample)
+
+    lines = []
+    for name, samples in grouped.items():
+        full_name = f"{NAMESPACE}_{name}"
+        kind = samples[0].kind
+        if samples[0].help:
+            lines.append(f"# HELP {full_name} {_escape(samples[0].help)}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        for sample in samples:
+            lines.append(f"{full_name}{sample.suffix}{_format_labels(sample.labels)} {_format_value(sample.value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: str | os.PathLike, registry: Registry = REGISTRY) -> None:
+    """Write the exposition text to ``path`` atomically (write, then rename)."""
+    temporary = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        handle.write(render_prometheus(registry))
+    os.replace(temporary, path)
+
+
+_last_textfile_write = 0.0
+
+
+def maybe_write_textfile(min_interval: float = 10.0) -> None:
+    """Rewrite PROMPT_METRICS_FILE, if set, at most once per ``min_interval`` seconds."""
+    global _last_textfile_write
+    if not TEXTFILE_PATH:
+        return
+    now = time.monotonic()
+    if now - _last_textfile_write < min_interval:
+        return
+    _last_textfile_write = now
+    write_textfile(TEXTFILE_PATH)
@@ -0,0 +1,79 @@
+"""Fixed option lists for the prospect form, shared by the UI and the data model."""
+from __future__ import annotations
+
+INDUSTRY_OPTIONS: tuple[str, ...] = (
+    "",
+    "Financial Services",
+    "Healthcare/Life Sciences",
+    "Technology/Software",
+    "Manufacturing",
+    "Energy/Utilities",
+    "Real Estate",
+    "Professional Services",
+    "Retail/Consumer Goods",
+    "Other",
+)
+
+LEGAL_ENTITY_OPTIONS: tuple[str, ...] = (
+    "",
+    "Public Company (Listed)",
+    "Private Company",
+    "Private Equity Owned",
+    "Family Office/HNW Owned",
+    "Government Entity",
+    "Non-Profit",
+    "Partnership/LLP",
+    "Unknown",
+)
+
+TRANSACTION_TYPE_OPTIONS: tuple[str, ...] = (
+    "",
+    "M&A (Buyer)",
+    "M&A (Seller)",
+    "M&A (Target)",
+    "Private Equity Deal",
+    "Corporate Restructuring",
+    "IPO Preparation",
+    "Regulatory Compliance Project",
+    "Other/Exploratory",
+)
+
+REVENUE_SIZE_OPTIONS: tuple[str, ...] = (
+    "",
+    "< $10M",
+    "$10M - $50M",
+    "$50M - $250M",
+    "$250M - $1B",
+    "$1B - $5B",
+    "$5B+",
+    "Unknown",
+)
+
+GEOGRAPHIC_OPTIONS: tuple[str, ...] = (
+    "United Kingdom",
+    "European Union",
+    "United States",
+    "Asia-Pacific",
+    "Middle East",
+    "Latin America",
+    "Global/Multi-Regional",
+)
+
+PRODUCT_OPTIONS: tuple[str, ...] = (
+    "Lexis+ AI",
+    "Practical Guidance",
+    "Halsbury's Laws",
+    "Corporate Law Suite",
+    "Due Diligence Tools",
+    "Compliance & Risk Solutions",
+    "PSL (Practice Area Specific)",
+    "Not Sure/Exploratory",
+)
+
+# Prompt output languages: locale code -> display name. Every code other than
+# "en" has a language pack in components/locales/<code>.json.
+LANGUAGE_OPTIONS: dict[str, str] = {
+    "en": "English",
+    "zh-Hant": "繁體中文 (Traditional Chinese)",
+    "zh-Hans": "简体中文 (Simplified Chinese)",
+}
@@ -0,0 +1,352 @@
+"""
+OUS scoring: read the subscores from filled-in Phase 5 responses and rank accounts.
+
+Usage:
+    python -m components.ous_scoring responses.jsonl --output ranked.csv
+    python -m components.ous_scoring responses/ --top 20
+    python -m components.ous_scoring responses.csv --workers 4 --output ranked.jsonl
+
+Input is a CSV or JSONL file with one row per account (``account`` or
+``company_name``, plus ``response``: the model's Phase 5 answer), or a
+directory of .md/.txt responses named after their accounts.
+
+Phase 5 asks for three subscores out of 10. Besides the template's
+"**Outcome Subscore:** 7 / 10" lines, markdown table rows ("| Outcome
+Subscore | 7 |"), "Outcome = 7", "Outcome (out of 10): 7" and a
+"Subscores:" list of "- Outcome: 7" are read. When a subscore line is left
+blank, the mean of the item scores in its section is used instead. The
+overall score is computed for every account at once with NumPy, using
+the Phase 5 weights (Outcome 35%, Understanding Pain 35%, Selection
+Process 30%) and tiered by its decision rules before it is rounded to
+two decimals: 8 and above pursue, 6 to below 8 standard, below 6
+deprioritize. Accounts with a subscore that cannot be found are
+"incomplete", ranked last and reported on stderr by the command line.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from .batch import iter_records, run_batch
+
+SUBSCORES = ("outcome", "understanding_pain", "selection_process")
+OUS_WEIGHTS = (0.35, 0.35, 0.30)  # same order as SUBSCORES
+PURSUE_AT = 8.0
+STANDARD_AT = 6.0
+_TIER_TOLERANCE = 1e-9
+_MAX_WARNINGS = 20  # incomplete accounts named on stderr
+
+PURSUE, STANDARD, DEPRIORITIZE, INCOMPLETE = "pursue", "standard", "deprioritize", "incomplete"
+TIER_ACTIONS = {
+    PURSUE: "Pursue aggressively",
+    STANDARD: "Pursue with standard effort",
+    DEPRIORITIZE: "Deprioritize or qualify out",
+    INCOMPLETE: "Subscores missing: finish the Phase 5 analysis",
+}
+
+# Section names as Phase 5 writes them, plus the usual Chinese renderings
+_LABELS = {
+    "outcome": r"outcome|成果|结果|結果",
+    "understanding_pain": r"understanding\s+pain|理解痛[点點]|痛[点點]理解",
+    "selection_process": r"selection\s+process|(?:选择|選擇|采购|採購|决策|決策)(?:流程|过程|過程)",
+}
+_NUMBER = r"(\d{1,2}(?:\.\d+)?)(?![\d.]*\s*%)"  # not a weight such as "35%"
+_SEPARATOR = r"[ \t*_:：=|–—-]"
+_SCALE = r"(?:\((?:out\s+of\s+|/\s*)10\))"  # "(out of 10)" or "(/10)" before the number
+# Markdown emphasis, table bars, colons, dashes and blanks between a label and its number,
+# over at most one line break
+_FILLER = rf"{_SEPARATOR}*(?:{_SCALE}{_SEPARATOR}*)?(?:\n[ \t*_]*)?"
+# Responses are lowercased once and scanned for keywords with a short literal
+# start; the label before a keyword is only checked on its own line, which keeps
+# parsing to a few passes over the text instead of one per label.
+_SUBSCORE = re.compile(rf"(?:sub-?\s?score|子(?:分数|分數|评分|評分|得分)){_FILLER}{_NUMBER}")
+_WEIGHT = re.compile(r"weight|权重|權重")
+_LIST_PREFIX = r"[#>|\s*_-]*(?:\d+(?:\.\d+)*[.)][\s*_]*)?"  # "### 2. ", "- **1) ", "> ", "| "
+_LABEL_GROUPS = "(?:" + "|".join(rf"(?P<{name}>{label})" for name, label in _LABELS.items()) + ")"
+_LINE_LABEL = re.compile(_LIST_PREFIX + _LABEL_GROUPS)
+# A label followed directly by its number on the same line, without "subscore":
+# "Outcome = 7", "- Outcome: 7" under a "Subscores:" heading, "| Outcome | 7 |"
+_LABEL_SCORE = re.compile(
+    rf"^[ \t#>|*_-]*{_LABEL_GROUPS}[ \t*_]*{_SCALE}?[ \t*_]*[:：=|–—-]{_SEPARATOR}*{_SCALE}?{_SEPARATOR}*{_NUMBER}",
+    re.MULTILINE,
+)
+_OVERALL_HEADING = re.compile(rf"^{_LIST_PREFIX}(?:overall|总分|總分|综合)", re.MULTILINE)
+_ITEM_SCORE = re.compile(rf"(?<![\w-])(?:score|评分|評分|得分){_FILLER}{_NUMBER}")
+_REPORTED_OVERALL = re.compile(rf"(?:overall\s+score|总分|總分){_FILLER}{_NUMBER}")
+_COMPANY = re.compile(r"\*\*Company:\*\*\s*(.+)")
+
+
+def _score(text: str | None) -> float:
+    """A 0-10 score from its text; NaN when missing or out of range."""
+    if text is None:
+        return math.nan
+    value = float(text)
+    return value if 0 <= value <= 10 else math.nan
+
+
+@dataclass(frozen=True)
+class ParsedResponse:
+    """Subscores read from one Phase 5 response; NaN where none was found."""
+    row: int
+    account: str
+    outcome: float
+    understanding_pain: float
+    selection_process: float
+    reported_overall: float = math.nan  # the overall score the model wrote, if any
+    from_items: tuple[str, ...] = ()  # subscores averaged from item scores because the line was blank
+
+
+def _line_label(text: str, position: int, rest: bool = False) -> str | None:
+    """The subscore named at the start of the line holding ``position``, if any.
+
+    Only filler may come between the label and ``position`` unless ``rest`` is true.
+    """
+    line = text[text.rfind("\n", 0, position) + 1:position]
+    match = _LINE_LABEL.match(line)
+    if match is None or not (rest or not line[match.end():].strip(" \t*_:：=|–—-")):
+        return None
+    return match.lastgroup
+
+
+def parse_ous_response(text: str, account: str = "", row: int = 0) -> ParsedResponse:
+    """Read the three OUS subscores (and the stated overall score) from a Phase 5 response."""
+    lowered = text.lower()
+    scores: dict[str, float] = {}
+    for match in _SUBSCORE.finditer(lowered):
+        name = _line_label(lowered, match.start())
+        value = _score(match.group(1))
+        if name and name not in scores and not math.isnan(value):
+            scores[name] = value
+
+    if len(scores) < len(SUBSCORES):
+        for match in _LABEL_SCORE.finditer(lowered):
+            name = next(name for name in SUBSCORES if match.group(name))
+            value = _score(match.groups()[-1])
+            if name not in scores and not math.isnan(value):
+                scores[name] = value
+
+    from_items = []
+    missing = [name for name in SUBSCORES if name not in scores]
+    if missing:
+        # Section of each heading ("Outcome (weight: 35%)"): up to the next one, or to "Overall"
+        headings = [
+            (name, match.start())
+            for match in _WEIGHT.finditer(lowered)
+            if (name := _line_label(lowered, match.start(), rest=True))
+        ]
+        headings += [("overall", match.start()) for match in _OVERALL_HEADING.finditer(lowered)]
+        headings.sort(key=lambda heading: heading[1])
+        for index, (name, start) in enumerate(headings):
+            if name not in missing:
+                continue
+            end = headings[index + 1][1] if index + 1 < len(headings) else len(lowered)
+            items = [_score(value) for value in _ITEM_SCORE.findall(lowered, start, end)]
+            items = [value for value in items if not math.isnan(value)]
+            if items:
+                scores[name] = sum(items) / len(items)
+                from_items.append(name)
+
+    if not account:
+        company = _COMPANY.search(text)
+        account = company.group(1).strip() if company else f"row {row}"
+    reported = _REPORTED_OVERALL.search(lowered)
+    return ParsedResponse(
+        row=row,
+        account=account,
+        outcome=scores.get("outcome", math.nan),
+        understanding_pain=scores.get("understanding_pain", math.nan),
+        selection_process=scores.get("selection_process", math.nan),
+        reported_overall=_score(reported.group(1)) if reported else math.nan,
+        from_items=tuple(from_items),
+    )
+
+
+def parse_record(item: tuple[int, dict[str, Any]]) -> ParsedResponse:
+    """Parse one (row_index, record) pair; records hold ``response`` and ``account`` or ``company_name``."""
+    index, record = item
+    account = str(record.get("account") or record.get("company_name") or "").strip()
+    return parse_ous_response(str(record.get("response") or ""), account, index)
+
+
+def iter_responses(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Records from a CSV/JSONL file, or one per .md/.txt file in a directory."""
+    path = Path(path)
+    if not path.is_dir():
+        yield from iter_records(path)
+        return
+    for file in sorted(path.iterdir()):
+        if file.suffix.lower() in (".md", ".txt"):
+            yield {"account": file.stem, "response": file.read_text(encoding="utf-8")}
+
+
+@dataclass(frozen=True)
+class RankedAccount:
+    """One account's place in the ranking."""
+    rank: int
+    account: str
+    overall: float  # NaN when incomplete
+    tier: str
+    outcome: float
+    understanding_pain: float
+    selection_process: float
+    reported_overall: float
+    row: int
+
+    @property
+    def action(self) -> str:
+        return TIER_ACTIONS[self.tier]
+
+    @property
+    def missing(self) -> tuple[str, ...]:
+        """Subscores that could not be found in the response."""
+        return tuple(name for name in SUBSCORES if math.isnan(getattr(self, name)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready form; missing scores become None."""
+        return {
+            key: (None if isinstance(value, float) and math.isnan(value) else value)
+            for key, value in asdict(self).items()
+        }
+
+
+class OUSPortfolio:
+    """Subscores for many accounts as one array, scored and ranked together."""
+
+    def __init__(self, parsed: Sequence[ParsedResponse]):
+        self.parsed = list(parsed)
+        self.subscores = np.array(
+            [[getattr(response, name) for name in SUBSCORES] for response in self.parsed],
+            dtype=np.float64,
+        ).reshape(len(self.parsed), len(SUBSCORES))
+        self.reported = np.array([response.reported_overall for response in self.parsed], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.parsed)
+
+    def overall(self, weights: Sequence[float] = OUS_WEIGHTS) -> np.ndarray:
+        """Weighted overall score per account, unrounded; NaN if a subscore is missing."""
+        return self.subscores @ np.asarray(weights, dtype=np.float64)
+
+    @staticmethod
+    def tiers(overall: np.ndarray) -> np.ndarray:
+        """Decision tier for each unrounded overall score (7.995 is not "8+")."""
+        # The tolerance only absorbs float error in the weighted sum, e.g. 7.999999999999999 for 8
+        overall = overall + _TIER_TOLERANCE
+        return np.select(
+            [np.isnan(overall), overall >= PURSUE_AT, overall >= STANDARD_AT],
+            [INCOMPLETE, PURSUE, STANDARD],
+            default=DEPRIORITIZE,
+        )
+
+    def rank(self, weights: Sequence[float] = OUS_WEIGHTS) -> list[RankedAccount]:
+        """Accounts by overall score, highest first; ties keep input order, incomplete ones last."""
+        overall = self.overall(weights)
+        tiers = self.tiers(overall)
+        order = np.argsort(-np.where(np.isnan(overall), -np.inf, overall), kind="stable")
+        overall = np.round(overall, 2)  # for display only
+        return [
+            RankedAccount(
+                rank=rank,
+                account=self.parsed[index].account,
+                overall=float(overall[index]),
+                tier=str(tiers[index]),
+                outcome=float(self.subscores[index, 0]),
+                understanding_pain=float(self.subscores[index, 1]),
+                selection_process=float(self.subscores[index, 2]),
+                reported_overall=float(self.reported[index]),
+                row=self.parsed[index].row,
+            )
+            for rank, index in enumerate(order.tolist(), 1)
+        ]
+
+
+def rank_accounts(
+    records: Iterable[dict[str, Any]],
+    weights: Sequence[float] = OUS_WEIGHTS,
+    workers: int = 1,
+) -> list[RankedAccount]:
+    """Parse every record's Phase 5 response and rank the accounts."""
+    parsed = sorted(run_batch(records, parse_record, workers=workers), key=lambda response: response.row)
+    return OUSPortfolio(parsed).rank(weights)
+
+
+def _write(ranked: list[RankedAccount], output: str) -> None:
+    rows = [account.to_dict() for account in ranked]
+    handle = sys.stdout if output == "-" else open(output, "w", encoding="utf-8", newline="")
+    try:
+        if output.lower().endswith(".csv"):
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            for row in rows:
+                handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+
+
+def _format_score(value: float) -> str:
+    return "-" if math.isnan(value) else f"{value:.2f}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m components.ous_scoring",
+        description="Rank accounts by the OUS scores in their Phase 5 responses.",
+    )
+    parser.add_argument("input", help="CSV or JSONL file (account, response), or a directory of .md/.txt files")
+    parser.add_argument("--output", "-o", help="Write every ranked account to this .csv or .jsonl file (- for stdout)")
+    parser.add_argument("--top", type=int, default=25, help="Accounts to print (default: 25)")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=1,
+        help="Worker processes for parsing (default: 1, in-process)",
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        ranked = rank_accounts(iter_responses(args.input), workers=args.workers)
+        if args.output:
+            _write(ranked, args.output)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+
+    if args.output != "-":
+        print(f"{'rank':>5}  {'account':<40}{'overall':>8}{'O':>7}{'U':>7}{'S':>7}  tier")
+        for account in ranked[:args.top]:
+            print(
+                f"{account.rank:>5}  {account.account[:39]:<40}{_format_score(account.overall):>8}"
+                f"{_format_score(account.outcome):>7}{_format_score(account.understanding_pain):>7}"
+                f"{_format_score(account.selection_process):>7}  {account.tier}"
+            )
+    counts = {tier: 0 for tier in TIER_ACTIONS}
+    for account in ranked:
+        counts[account.tier] += 1
+    incomplete = [account for account in ranked if account.tier == INCOMPLETE]
+    for account in incomplete[:_MAX_WARNINGS]:
+        missing = ", ".join(name.replace("_", " ") for name in account.missing)
+        print(f"warning: {account.account} (row {account.row}): no {missing} subscore found", file=sys.stderr)
+    if len(incomplete) > _MAX_WARNINGS:
+        print(f"warning: ... and {len(incomplete) - _MAX_WARNINGS} more incomplete accounts", file=sys.stderr)
+    summary = ", ".join(f"{count} {tier}" for tier, count in counts.items())
+    rate = len(ranked) / elapsed if elapsed else float("inf")
+    print(f"Scored {len(ranked)} accounts in {elapsed:.2f}s ({rate:,.0f}/s): {summary}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
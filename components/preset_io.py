@@ -0,0 +1,192 @@
+"""
+Streaming JSONL import and export for ProspectPreset.
+
+Usage:
+    python -m components.preset_io export presets.jsonl.gz --db presets.db
+    python -m components.preset_io import crm_accounts.jsonl --db presets.db
+
+Files ending in .gz are gzip-compressed. Records are processed one line at
+a time, so memory use does not grow with the file. orjson is used for
+parsing and serialization when it is installed.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from . import metrics
+from .presets import ProspectPreset
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+if orjson is not None:
+    _loads: Callable[[bytes], Any] = orjson.loads
+    JSON_BACKEND = "orjson"
+
+    def _dumps(obj: dict[str, Any]) -> bytes:
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+    JSON_BACKEND = "json"
+
+    def _dumps(obj: dict[str, Any]) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+REQUIRED_FIELDS = ("company_name", "company_url", "practice_area", "buyer_persona")
+KNOWN_FIELDS = tuple(f.name for f in fields(ProspectPreset))
+_RECORDS_HELP = "Presets read or written by bulk JSONL import and export"
+
+
+@dataclass
+class ImportReport:
+    """Counts and the first errors from a bulk import."""
+    read: int = 0
+    imported: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)  # (line number, message)
+    max_errors: int = 100
+
+    @property
+    def skipped(self) -> int:
+        return self.read - self.imported
+
+    def record_error(self, line_number: int, message: str) -> None:
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_number, message))
+
+
+def validate_preset_record(data: Any) -> ProspectPreset:
+    """
+    Build a ProspectPreset from one decoded record, or raise ValueError.
+
+    Required fields must be present and every known field must be a string;
+    unknown fields are ignored, as in ProspectPreset.from_json.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    missing = [name for name in REQUIRED_FIELDS if name not in data]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    values = {}
+    for name in KNOWN_FIELDS:
+        if name in data:
+            value = data[name]
+            if not isinstance(value, str):
+                raise ValueError(f"field {name!r} must be a string, got {type(value).__name__}")
+            values[name] = value
+    if not values["company_name"].strip():
+        raise ValueError("company_name is empty")
+    return ProspectPreset(**values)
+
+
+def _open(path: str | Path, mode: str) -> IO[bytes]:
+    if str(path) == "-":
+        return sys.stdin.buffer if "r" in mode else sys.stdout.buffer
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "b", compresslevel=5)
+    return open(path, mode + "b")
+
+
+def iter_presets_jsonl(
+    path: str | Path,
+    report: ImportReport | None = None,
+) -> Iterator[ProspectPreset]:
+    """
+    Stream valid presets from a JSONL (optionally .gz) file.
+
+    Invalid lines are skipped and recorded in ``report`` with their line
+    number; the import never stops on a bad row.
+    """
+    report = report if report is not None else ImportReport()
+    imported, skipped = report.imported, report.skipped
+    handle = _open(path, "r")
+    try:
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            report.read += 1
+            try:
+                preset = validate_preset_record(_loads(line))
+            except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError included
+                report.record_error(line_number, str(e))
+                continue
+            report.imported += 1
+            yield preset
+    finally:
+        if handle is not sys.stdin.buffer:
+            handle.close()
+        # Counted once per file, not per row
+        metrics.inc("preset_records_total", report.imported - imported, _RECORDS_HELP,
+                    direction="import", result="ok")
+        metrics.inc("preset_records_total", report.skipped - skipped, direction="import", result="invalid")
+
+
+def write_presets_jsonl(presets: Iterable[ProspectPreset], path: str | Path) -> int:
+    """Write presets one per line (gzip if ``path`` ends in .gz); returns the count."""
+    count = 0
+    handle = _open(path, "w")
+    try:
+        for preset in presets:
+            handle.write(_dumps(asdict(preset)))
+            handle.write(b"\n")
+            count += 1
+    finally:
+        if handle is not sys.stdout.buffer:
+            handle.close()
+        metrics.inc("preset_records_total", count, _RECORDS_HELP, direction="export", result="ok")
+    return count
+
+
+def _iter_all(store) -> Iterator[ProspectPreset]:
+    """Every preset in a PresetStore, page by page."""
+    after = None
+    while True:
+        page = store.list_presets(limit=5000, after=after)
+        if not page:
+            return
+        yield from page
+        after = page[-1].company_name
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    from .preset_store import DEFAULT_DB_PATH, PresetStore
+
+    parser = argparse.ArgumentParser(
+        prog="python -m components.preset_io",
+        description="Bulk import/export presets as JSONL (.gz for gzip).",
+    )
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("path", help="JSONL file (.jsonl or .jsonl.gz), or - for stdin/stdout")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Preset library database")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with PresetStore(args.db) as store:
+        if args.command == "import":
+            report = ImportReport()
+            count = store.upsert_many(iter_presets_jsonl(args.path, report))
+            for line_number, message in report.errors:
+                print(f"{args.path}:{line_number}: {message}", file=sys.stderr)
+            if report.skipped > len(report.errors):
+                print(f"... {report.skipped - len(report.errors)} more bad rows", file=sys.stderr)
+            summary = f"Imported {count} presets, skipped {report.skipped} bad rows"
+        else:
+            count = write_presets_jsonl(_iter_all(store), args.path)
+            summary = f"Exported {count} presets"
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{summary} in {elapsed:.2f}s ({rate:,.0f} records/s, {JSON_BACKEND})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
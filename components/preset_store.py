@@ -0,0 +1,221 @@
+"""SQLite-backed local library of prospect presets."""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from dataclasses import astuple, fields
+from pathlib import Path
+from typing import Iterable
+
+from .presets import ProspectPreset
+
+DEFAULT_DB_PATH = os.environ.get("PRESET_DB_PATH", "presets.db")
+
+PRESET_COLUMNS = tuple(f.name for f in fields(ProspectPreset))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    id INTEGER PRIMARY KEY,
+    company_name TEXT NOT NULL COLLATE NOCASE UNIQUE,
+    company_url TEXT NOT NULL DEFAULT '',
+    practice_area TEXT NOT NULL DEFAULT '',
+    buyer_persona TEXT NOT NULL DEFAULT '',
+    industry TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    version TEXT NOT NULL DEFAULT '1.0',
+    tool TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+    legal_entity_type TEXT NOT NULL DEFAULT '',
+    revenue_size TEXT NOT NULL DEFAULT '',
+    geographic_scope TEXT NOT NULL DEFAULT '',
+    product_interest TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS presets_industry ON presets (industry, company_name);
+CREATE INDEX IF NOT EXISTS presets_practice_area ON presets (practice_area, company_name);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS presets_fts USING fts5(
+    notes, content='presets', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS presets_ai AFTER INSERT ON presets BEGIN
+    INSERT INTO presets_fts (rowid, notes) VALUES (new.id, new.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS presets_ad AFTER DELETE ON presets BEGIN
+    INSERT INTO presets_fts (presets_fts, rowid, notes) VALUES ('delete', old.id, old.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS presets_au AFTER UPDATE OF notes ON presets BEGIN
+    INSERT INTO presets_fts (presets_fts, rowid, notes) VALUES ('delete', old.id, old.notes);
+    INSERT INTO presets_fts (rowid, notes) VALUES (new.id, new.notes);
+END;
+"""
+
+_SELECT = f"SELECT {', '.join(PRESET_COLUMNS)} FROM presets"
+
+_UPSERT = f"""
+INSERT INTO presets ({', '.join(PRESET_COLUMNS)})
+VALUES ({', '.join('?' for _ in PRESET_COLUMNS)})
+ON CONFLICT (company_name) DO UPDATE SET
+    {', '.join(f'{name} = excluded.{name}' for name in PRESET_COLUMNS)},
+    updated_at = datetime('now')
+"""
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching all words (prefix match on the last)."""
+    words = [word.replace('"', '""') for word in text.split()]
+    if not words:
+        return ""
+    terms = [f'"{word}"' for word in words[:-1]] + [f'"{words[-1]}"*']
+    return " ".join(terms)
+
+
+class PresetStore:
+    """
+    Local preset library in a single SQLite file.
+
+    Presets are keyed by company name (case-insensitive). Company name,
+    industry and practice area are indexed, and notes have a full-text
+    index. One store can be shared by every Streamlit session in the
+    process: the connection is guarded by a lock.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_DB_PATH):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA case_sensitive_like=OFF")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            # Libraries created before a column was added get it with its default
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(presets)")}
+            for name in PRESET_COLUMNS:
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE presets ADD COLUMN {name} TEXT NOT NULL DEFAULT ''")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> PresetStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, preset: ProspectPreset) -> None:
+        """Insert a preset, or replace the one with the same company name."""
+        self.upsert_many([preset])
+
+    def upsert_many(self, presets: Iterable[ProspectPreset], batch_size: int = 5000) -> int:
+        """Insert or replace many presets in batched transactions; returns the count."""
+        count = 0
+        batch: list[tuple] = []
+        for preset in presets:
+            batch.append(astuple(preset))
+            if len(batch) >= batch_size:
+                count += self._write_batch(batch)
+                batch = []
+        if batch:
+            count += self._write_batch(batch)
+        return count
+
+    def delete(self, company_name: str) -> bool:
+        """Delete a preset by company name; returns whether one existed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM presets WHERE company_name = ?", (company_name,))
+        return cursor.rowcount > 0
+
+    def _write_batch(self, rows: list[tuple]) -> int:
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, company_name: str) -> ProspectPreset | None:
+        """Return the preset for ``company_name`` (case-insensitive), if any."""
+        rows = self._query(f"{_SELECT} WHERE company_name = ?", (company_name,))
+        return rows[0] if rows else None
+
+    def count(self, *, industry: str | None = None, practice_area: str | None = None) -> int:
+        """Number of presets, optionally filtered."""
+        where, params = self._filters(industry, practice_area)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM presets{where}", params).fetchone()[0]
+
+    def list_presets(
+        self,
+        *,
+        limit: int = 50,
+        after: str | None = None,
+        industry: str | None = None,
+        practice_area: str | None = None,
+    ) -> list[ProspectPreset]:
+        """
+        One page of presets ordered by company name.
+
+        Pass the last company name of the previous page as ``after`` to get
+        the next page; this keyset pagination costs the same on every page.
+        """
+        where, params = self._filters(industry, practice_area)
+        if after is not None:
+            where += " AND company_name > ?" if where else " WHERE company_name > ?"
+            params.append(after)
+        params.append(limit)
+        return self._query(f"{_SELECT}{where} ORDER BY company_name LIMIT ?", params)
+
+    def search_companies(self, prefix: str, limit: int = 50) -> list[ProspectPreset]:
+        """Presets whose company name starts with ``prefix`` (case-insensitive)."""
+        return self._query(
+            f"{_SELECT} WHERE company_name LIKE ? ESCAPE '\\' ORDER BY company_name LIMIT ?",
+            (_escape_like(prefix) + "%", limit),
+        )
+
+    def search_notes(self, text: str, limit: int = 50, ranked: bool = False) -> list[ProspectPreset]:
+        """
+        Presets whose notes contain every word of ``text`` (prefix match on the last word).
+
+        Results come most recently added first, which lets SQLite stop
+        after ``limit`` matches. ``ranked=True`` orders by relevance (bm25) instead; that has
+        to score every match, so it slows down for very common words.
+        """
+        query = _fts_query(text)
+        if not query:
+            return []
+        columns = ", ".join(f"p.{name}" for name in PRESET_COLUMNS)
+        order = "presets_fts.rank" if ranked else "presets_fts.rowid DESC"
+        return self._query(
+            f"SELECT {columns} FROM presets_fts JOIN presets AS p ON p.id = presets_fts.rowid "
+            f"WHERE presets_fts MATCH ? ORDER BY {order} LIMIT ?",
+            (query, limit),
+        )
+
+    @staticmethod
+    def _filters(industry: str | None, practice_area: str | None) -> tuple[str, list]:
+        clauses = []
+        params: list = []
+        if industry is not None:
+            clauses.append("industry = ?")
+            params.append(industry)
+        if practice_area is not None:
+            clauses.append("practice_area = ?")
+            params.append(practice_area)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _query(self, sql: str, params: Iterable) -> list[ProspectPreset]:
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(params)).fetchall()
+        return [ProspectPreset(*row) for row in rows]
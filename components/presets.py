@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
-import streamlit as st
+from .metrics import timed
 
 
 @dataclass
@@ -19,31 +19,43 @@ class ProspectPreset:
     notes: str = ""
     version: str = "1.0"
     tool: str = "LegalTech Sales Prospecting - OUS Framework"
+    # Remaining sidebar choices; regions and products are comma-separated
+    legal_entity_type: str = ""
+    revenue_size: str = ""
+    geographic_scope: str = ""
+    product_interest: str = ""
     
+    @timed("preset_export_seconds", "Presets serialized to JSON")
     def to_json_bytes(self) -> bytes:
         """Export preset as JSON bytes."""
-        data = asdict(self)
-        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # Every field is a plain string, so the instance dict is what asdict()
+        # would build, without its recursive copy
+        return json.dumps(vars(self), ensure_ascii=False, indent=2).encode("utf-8")
     
     @classmethod
+    @timed("preset_load_seconds", "Presets built from JSON data")
     def from_json(cls, json_data: dict[str, Any]) -> ProspectPreset:
         """Create preset from JSON data."""
         # Filter only known fields
-        known_fields = {
-            'company_name', 'company_url', 'practice_area', 
-            'buyer_persona', 'industry', 'notes', 'version', 'tool'
-        }
-        filtered = {k: v for k, v in json_data.items() if k in known_fields}
+        filtered = {k: v for k, v in json_data.items() if k in _PRESET_FIELDS}
         return cls(**filtered)
     
     def load_into_session_state(self) -> None:
         """Load this preset into Streamlit session state."""
+        import streamlit as st
+        
         st.session_state["company_name"] = self.company_name
         st.session_state["company_url"] = self.company_url
         st.session_state["practice_area"] = self.practice_area
         st.session_state["buyer_persona"] = self.buyer_persona
         st.session_state["industry"] = self.industry
         st.session_state["notes"] = self.notes
+        st.session_state["legal_entity_type"] = self.legal_entity_type
+        st.session_state["revenue_size"] = self.revenue_size
+
+
+# Field names accepted by from_json, computed once rather than per preset
+_PRESET_FIELDS = frozenset(f.name for f in fields(ProspectPreset))
 
 
 def export_preset_bytes(
@@ -54,6 +66,10 @@ def export_preset_bytes(
     buyer_persona: str,
     industry: str = "",
     notes: str = "",
+    legal_entity_type: str = "",
+    revenue_size: str = "",
+    geographic_scope: str = "",
+    product_interest: str = "",
 ) -> bytes:
     """Export prospect research as a JSON preset for reuse."""
     preset = ProspectPreset(
@@ -62,13 +78,19 @@ def export_preset_bytes(
         practice_area=practice_area,
         buyer_persona=buyer_persona,
         industry=industry,
-        notes=notes
+        notes=notes,
+        legal_entity_type=legal_entity_type,
+        revenue_size=revenue_size,
+        geographic_scope=geographic_scope,
+        product_interest=product_interest,
     )
     return preset.to_json_bytes()
 
 
 def load_preset_into_state(uploaded_file) -> None:
     """Load a saved prospect preset into session state."""
+    import streamlit as st
+    
     try:
         raw = uploaded_file.read()
         data = json.loads(raw.decode("utf-8"))
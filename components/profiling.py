@@ -0,0 +1,257 @@
+"""
+cProfile and tracemalloc profiles of whole app reruns.
+
+Used by app.py when profiling is switched on (APP_PROFILE=1, or
+?profile=1 in the URL when the server allows it with APP_PROFILE_ALLOW=1):
+
+    with RerunProfiler() as profiler:
+        main()
+    history.append(profiler.profile)
+
+Each profile keeps the functions with the most cumulative time, the
+allocation sites that grew the most during the rerun, and the path of a
+.pstats file in PROFILE_DIR for offline tools (``snakeviz file.pstats``,
+``flameprof file.pstats > flame.svg``, ``python -m pstats file.pstats``).
+
+Only one rerun in the process is profiled at a time. From Python 3.12
+cProfile hooks into sys.monitoring, which is process-wide and takes a
+single profiler (a second enable() raises ValueError), and tracemalloc is
+process-wide on every version. A rerun that starts while another session's
+rerun is being profiled runs unprofiled, with ``skipped`` set. tracemalloc
+runs only during a profiled rerun, so other sessions pay for allocation
+tracing only meanwhile; their allocations during it are included.
+"""
+from __future__ import annotations
+
+import cProfile
+import itertools
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_DIR = Path(os.environ.get("APP_PROFILE_DIR") or Path(tempfile.gettempdir()) / "prompt-builder-profiles")
+KEEP_RERUNS = int(os.environ.get("APP_PROFILE_KEEP", "5"))  # reruns kept per session for comparison
+MAX_PSTATS_FILES = 200  # oldest .pstats files beyond this are deleted
+TOP = 25
+TRACEBACK_FRAMES = 1  # frames stored per allocation; more gives longer call sites but costs more
+
+_numbers = itertools.count(1)
+
+# Held for the whole of a profiled rerun; see the module docstring
+_profiler_lock = threading.Lock()
+# Whether tracemalloc was started for the profiled rerun (guarded by _profiler_lock)
+_started_tracing = False
+
+# Allocations made by the profilers themselves
+_OWN_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, pstats.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass(frozen=True)
+class FunctionStat:
+    """cProfile figures for one function."""
+    function: str  # "file:line(name)"
+    calls: int
+    total_seconds: float  # in the function itself
+    cumulative_seconds: float  # including everything it called
+
+
+@dataclass(frozen=True)
+class AllocationStat:
+    """Memory allocated at one source line during a rerun and still held at its end."""
+    location: str  # "file:line"
+    size_bytes: int
+    count: int
+
+
+@dataclass(frozen=True)
+class RerunProfile:
+    """Timing and memory profile of one rerun."""
+    number: int
+    started: datetime
+    duration: float  # seconds, including profiler overhead
+    functions: list[FunctionStat]
+    allocations: list[AllocationStat] = field(default_factory=list)
+    allocated_bytes: int = 0  # net growth of traced memory during the rerun
+    peak_bytes: int = 0  # highest traced memory during the rerun, above the level at its start
+    pstats_path: Path | None = None
+
+    @property
+    def label(self) -> str:
+        return f"#{self.number} {self.started:%H:%M:%S} ({self.duration * 1000:.0f} ms)"
+
+    def compare(self, other: RerunProfile) -> list[tuple[str, float, float]]:
+        """
+        (function, seconds here, seconds in ``other``) for functions in the top list of either.
+
+        Sorted by the largest change in cumulative time first.
+        """
+        mine = {stat.function: stat.cumulative_seconds for stat in self.functions}
+        theirs = {stat.function: stat.cumulative_seconds for stat in other.functions}
+        rows = [(name, mine.get(name, 0.0), theirs.get(name, 0.0)) for name in mine.keys() | theirs.keys()]
+        rows.sort(key=lambda row: abs(row[1] - row[2]), reverse=True)
+        return rows
+
+
+def _short_path(filename: str) -> str:
+    """Path inside site-packages or relative to the working directory, for display."""
+    index = filename.rfind("site-packages" + os.sep)
+    if index != -1:
+        return filename[index + len("site-packages") + 1:]
+    try:
+        relative = os.path.relpath(filename)
+    except ValueError:  # different drive on Windows
+        return filename
+    return filename if relative.startswith("..") else relative
+
+
+def top_functions(profiler: cProfile.Profile, limit: int = TOP) -> list[FunctionStat]:
+    """The ``limit`` functions with the most cumulative time."""
+    stats = pstats.Stats(profiler).stats  # (file, line, name) -> (primitive calls, calls, tottime, cumtime, callers)
+    ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        FunctionStat(
+            function=f"{_short_path(filename)}:{line}({name})" if line else name,
+            calls=calls,
+            total_seconds=total,
+            cumulative_seconds=cumulative,
+        )
+        for (filename, line, name), (_, calls, total, cumulative, _) in ranked
+    ]
+
+
+def top_allocations(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, limit: int = TOP
+) -> tuple[list[AllocationStat], int]:
+    """Largest allocation sites that grew between two snapshots, and the total growth."""
+    differences = after.filter_traces(_OWN_FRAMES).compare_to(before.filter_traces(_OWN_FRAMES), "lineno")
+    growth = sum(difference.size_diff for difference in differences)
+    grown = [difference for difference in differences if difference.size_diff > 0][:limit]
+    return [
+        AllocationStat(
+            location=f"{_short_path(difference.traceback[0].filename)}:{difference.traceback[0].lineno}",
+            size_bytes=difference.size_diff,
+            count=difference.count_diff,
+        )
+        for difference in grown
+    ], growth
+
+
+def _start_tracing() -> None:
+    global _started_tracing
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEBACK_FRAMES)
+        _started_tracing = True
+
+
+def _stop_tracing() -> None:
+    """Stop tracemalloc after the profiled rerun, unless something else had started it."""
+    global _started_tracing
+    if _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def _prune(directory: Path, keep: int) -> None:
+    files = sorted(directory.glob("*.pstats"), key=lambda path: path.stat().st_mtime)
+    for path in files[:-keep]:
+        path.unlink(missing_ok=True)
+
+
+class RerunProfiler:
+    """
+    Context manager that profiles the code it wraps; the result is in ``profile``.
+
+    The profile is built even when the block raises (Streamlit stops a
+    rerun with an exception when st.rerun() or st.stop() is called). When
+    another rerun is already being profiled, or another tool holds the
+    Python 3.12+ profiler slot, the block runs unprofiled: ``skipped`` is
+    True and ``profile`` stays None.
+    """
+
+    def __init__(
+        self,
+        *,
+        top: int = TOP,
+        trace_memory: bool = True,
+        output_dir: str | os.PathLike | None = PROFILE_DIR,
+    ):
+        self.top = top
+        self.trace_memory = trace_memory
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.profile: RerunProfile | None = None
+        self.skipped = False
+        self._profiler = cProfile.Profile()
+        self._before: tracemalloc.Snapshot | None = None
+        self._start_memory = 0
+        self._started = datetime.now()
+        self._clock = 0.0
+
+    def __enter__(self) -> RerunProfiler:
+        if not _profiler_lock.acquire(blocking=False):
+            self.skipped = True
+            return self
+        if self.trace_memory:
+            _start_tracing()
+            self._before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            self._start_memory = tracemalloc.get_traced_memory()[0]
+        self._started = datetime.now()
+        self._clock = time.perf_counter()
+        try:
+            self._profiler.enable()
+        except ValueError:  # "Another profiling tool is already active" (Python 3.12+)
+            self._release()
+            self.skipped = True
+        return self
+
+    def _release(self) -> None:
+        if self._before is not None:
+            self._before = None
+            _stop_tracing()
+        _profiler_lock.release()
+
+    def __exit__(self, *exc_info) -> None:
+        if self.skipped:
+            return
+        self._profiler.disable()
+        duration = time.perf_counter() - self._clock
+        number = next(_numbers)
+
+        allocations: list[AllocationStat] = []
+        allocated = peak = 0
+        try:
+            if self._before is not None:
+                peak = tracemalloc.get_traced_memory()[1] - self._start_memory
+                allocations, allocated = top_allocations(self._before, tracemalloc.take_snapshot(), self.top)
+        finally:
+            self._release()
+
+        path = None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"rerun-{self._started:%Y%m%d-%H%M%S}-{os.getpid()}-{number}.pstats"
+            self._profiler.dump_stats(path)
+            _prune(self.output_dir, MAX_PSTATS_FILES)
+
+        self.profile = RerunProfile(
+            number=number,
+            started=self._started,
+            duration=duration,
+            functions=top_functions(self._profiler, self.top),
+            allocations=allocations,
+            allocated_bytes=allocated,
+            peak_bytes=peak,
+            pstats_path=path,
+        )
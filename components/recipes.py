@@ -1,7 +1,101 @@
-from typing import Dict, Optional, Callable
+import hashlib
+import sys
+from array import array
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .metrics import cache_info_samples, register_collector, timed
+from .options import (
+    GEOGRAPHIC_OPTIONS,
+    INDUSTRY_OPTIONS,
+    LEGAL_ENTITY_OPTIONS,
+    REVENUE_SIZE_OPTIONS,
+    TRANSACTION_TYPE_OPTIONS,
+)
+
+# ProspectContext fields, in declaration order
+CONTEXT_FIELDS: Tuple[str, ...] = (
+    "company_name",
+    "industry_sector",
+    "transaction_type",
+    "legal_entity_type",
+    "transaction_size",
+    "geographic_scope",
+    "deal_context",
+    "additional_notes",
+    "company_products",
+)
+
+# Labels for the prompt header, in CONTEXT_FIELDS order, followed by the
+# heading used when every field is empty. Language packs translate these.
+HEADER_LABEL_KEYS: Tuple[str, ...] = CONTEXT_FIELDS + ("general_context",)
+HEADER_LABELS: Tuple[str, ...] = (
+    "Company",
+    "Industry",
+    "Transaction Type",
+    "Legal Entity",
+    "Transaction Size",
+    "Geographic Scope",
+    "Deal Context",
+    "Additional Notes",
+    "Our Products/Services",
+    "General Sales Prospecting Context",
+)
+
+# Locale of the built-in phase templates; other locales come from language packs
+DEFAULT_LOCALE = "en"
+
+# Fields that take values from the fixed sidebar option lists
+CATEGORICAL_FIELDS: Tuple[str, ...] = (
+    "industry_sector",
+    "transaction_type",
+    "legal_entity_type",
+    "transaction_size",
+    "geographic_scope",
+)
+
+_CANONICAL_OPTIONS: Dict[str, str] = {
+    option: option
+    for options in (
+        INDUSTRY_OPTIONS,
+        LEGAL_ENTITY_OPTIONS,
+        TRANSACTION_TYPE_OPTIONS,
+        REVENUE_SIZE_OPTIONS,
+        GEOGRAPHIC_OPTIONS,
+    )
+    for option in options
+}
+
+
+def _intern_option(value: str) -> str:
+    """Return the shared string object for a categorical value"""
+    canonical = _CANONICAL_OPTIONS.get(value)
+    if canonical is not None:
+        return canonical
+    return sys.intern(value) if type(value) is str else value
+
 
 class ProspectContext:
-    """Context object containing all prospect information for prompt generation"""
+    """
+    Context object containing all prospect information for prompt generation
+    
+    Instances are immutable and hashable, so they can be used as cache keys.
+    They use __slots__ instead of a per-instance __dict__, and categorical
+    fields share one string object per distinct value.
+    """
+    
+    __slots__ = CONTEXT_FIELDS + ("_hash",)
+    
+    company_name: str
+    industry_sector: str
+    transaction_type: str
+    legal_entity_type: str
+    transaction_size: str
+    geographic_scope: str
+    deal_context: str
+    additional_notes: str
+    company_products: str
     
     def __init__(
         self,
@@ -15,70 +109,285 @@ class ProspectContext:
         additional_notes: str = "",
         company_products: str = ""
     ):
-        self.company_name = company_name
-        self.industry_sector = industry_sector
-        self.transaction_type = transaction_type
-        self.legal_entity_type = legal_entity_type
-        self.transaction_size = transaction_size
-        self.geographic_scope = geographic_scope
-        self.deal_context = deal_context
-        self.additional_notes = additional_notes
-        self.company_products = company_products
-    
-    def to_prompt_header(self) -> str:
-        """Convert context to formatted header for prompts"""
-        header_parts = []
-        
-        if self.company_name:
-            header_parts.append(f"**Company:** {self.company_name}")
-        if self.industry_sector:
-            header_parts.append(f"**Industry:** {self.industry_sector}")
-        if self.transaction_type:
-            header_parts.append(f"**Transaction Type:** {self.transaction_type}")
-        if self.legal_entity_type:
-            header_parts.append(f"**Legal Entity:** {self.legal_entity_type}")
-        if self.transaction_size:
-            header_parts.append(f"**Transaction Size:** {self.transaction_size}")
-        if self.geographic_scope:
-            header_parts.append(f"**Geographic Scope:** {self.geographic_scope}")
-        if self.deal_context:
-            header_parts.append(f"**Deal Context:** {self.deal_context}")
-        if self.company_products:
-            header_parts.append(f"\n**Our Products/Services:**\n{self.company_products}")
-        if self.additional_notes:
-            header_parts.append(f"**Additional Notes:** {self.additional_notes}")
-        
-        header = "\n".join(header_parts) if header_parts else "**General Sales Prospecting Context**"
-        header += "\n\n---\n\n"
-        
-        return header
+        init = object.__setattr__
+        init(self, "company_name", company_name)
+        init(self, "industry_sector", _intern_option(industry_sector))
+        init(self, "transaction_type", _intern_option(transaction_type))
+        init(self, "legal_entity_type", _intern_option(legal_entity_type))
+        init(self, "transaction_size", _intern_option(transaction_size))
+        init(self, "geographic_scope", _intern_option(geographic_scope))
+        init(self, "deal_context", deal_context)
+        init(self, "additional_notes", additional_notes)
+        init(self, "company_products", company_products)
+        init(self, "_hash", None)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"ProspectContext is immutable; use replace(). Tried to set {name!r}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ProspectContext is immutable. Tried to delete {name!r}")
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProspectContext):
+            return NotImplemented
+        return self.field_values() == other.field_values()
+    
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self.field_values()))
+        return self._hash
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(CONTEXT_FIELDS, self.field_values()) if value
+        )
+        return f"ProspectContext({fields})"
+    
+    def __reduce__(self):
+        return (ProspectContext, self.field_values())
+    
+    def replace(self, **changes: str) -> 'ProspectContext':
+        """Return a copy with the given fields changed"""
+        values = dict(zip(CONTEXT_FIELDS, self.field_values()))
+        values.update(changes)
+        return ProspectContext(**values)
+    
+    def to_prompt_header(self, labels: Optional[Tuple[str, ...]] = None) -> str:
+        """Convert context to formatted header for prompts (``labels`` default to English)"""
+        if labels is None:
+            return _render_header(self.field_values())
+        return _render_header(self.field_values(), labels)
+    
+    def field_values(self) -> Tuple[str, ...]:
+        """Return all field values in declaration order"""
+        return (
+            self.company_name,
+            self.industry_sector,
+            self.transaction_type,
+            self.legal_entity_type,
+            self.transaction_size,
+            self.geographic_scope,
+            self.deal_context,
+            self.additional_notes,
+            self.company_products,
+        )
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to a dictionary accepted by from_dict"""
+        return dict(zip(CONTEXT_FIELDS, self.field_values()))
     
     @classmethod
     def from_dict(cls, data: dict) -> 'ProspectContext':
         """Create ProspectContext from dictionary"""
         return cls(
-            company_name=data.get('company_name', ''),
-            industry_sector=data.get('industry_sector', ''),
-            transaction_type=data.get('transaction_type', ''),
-            legal_entity_type=data.get('legal_entity_type', ''),
-            transaction_size=data.get('transaction_size', ''),
-            geographic_scope=data.get('geographic_scope', ''),
-            deal_context=data.get('deal_context', ''),
-            additional_notes=data.get('additional_notes', ''),
-            company_products=data.get('company_products', '')
+            company_name=data.get('company_name') or '',
+            industry_sector=data.get('industry_sector') or '',
+            transaction_type=data.get('transaction_type') or '',
+            legal_entity_type=data.get('legal_entity_type') or '',
+            transaction_size=data.get('transaction_size') or '',
+            geographic_scope=data.get('geographic_scope') or '',
+            deal_context=data.get('deal_context') or '',
+            additional_notes=data.get('additional_notes') or '',
+            company_products=data.get('company_products') or ''
         )
 
 
-class PromptRecipeManager:
-    """Manages all prompt recipes for sales prospecting workflow"""
+class ProspectBatch:
+    """
+    Columnar storage for many prospects, for batch jobs.
+    
+    Categorical fields are stored as small integer codes in arrays, with one
+    table of distinct values per field; free-text fields are stored as
+    plain lists. Rows are materialized as ProspectContext on access.
+    """
+    
+    def __init__(self, contexts: Iterable[ProspectContext] = ()):
+        self._values: Dict[str, List[str]] = {name: [] for name in CATEGORICAL_FIELDS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL_FIELDS}
+        self._columns: Dict[str, array] = {name: array("H") for name in CATEGORICAL_FIELDS}
+        self._text: Dict[str, List[str]] = {
+            name: [] for name in CONTEXT_FIELDS if name not in CATEGORICAL_FIELDS
+        }
+        self.extend(contexts)
     
     @classmethod
-    def generate_full_workflow(cls, context: ProspectContext) -> Dict[str, str]:
-        """Generate all prompts for the complete workflow"""
-        
-        header = context.to_prompt_header()
+    def from_records(cls, records: Iterable[dict]) -> 'ProspectBatch':
+        """Build a batch from from_dict-compatible dictionaries"""
+        batch = cls()
+        for record in records:
+            batch.append_values(**{name: record.get(name) or "" for name in CONTEXT_FIELDS})
+        return batch
+    
+    def append(self, context: ProspectContext) -> None:
+        """Add one prospect"""
+        self.append_values(**context.to_dict())
+    
+    def append_values(self, **values: str) -> None:
+        """Add one prospect from field values without building a ProspectContext"""
+        for name in CATEGORICAL_FIELDS:
+            self._columns[name].append(self._encode(name, values.get(name, "")))
+        for name, column in self._text.items():
+            column.append(values.get(name, ""))
+    
+    def extend(self, contexts: Iterable[ProspectContext]) -> None:
+        """Add many prospects"""
+        for context in contexts:
+            self.append(context)
+    
+    def column(self, name: str) -> List[str]:
+        """All values of one field, in row order"""
+        if name in self._text:
+            return list(self._text[name])
+        values = self._values[name]
+        return [values[code] for code in self._columns[name]]
+    
+    def __len__(self) -> int:
+        return len(self._text["company_name"])
+    
+    def __getitem__(self, index: int) -> ProspectContext:
+        values = {name: column[index] for name, column in self._text.items()}
+        for name in CATEGORICAL_FIELDS:
+            values[name] = self._values[name][self._columns[name][index]]
+        return ProspectContext(**values)
+    
+    def __iter__(self) -> Iterator[ProspectContext]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def _encode(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            self._values[name].append(_intern_option(value))
+            if code > 0xFFFF and self._columns[name].typecode == "H":
+                self._columns[name] = array("I", self._columns[name])
+        return code
+
+
+@lru_cache(maxsize=1024)
+@timed("header_build_seconds", "Prompt header builds (header cache misses only)")
+def _render_header(fields: Tuple[str, ...], labels: Tuple[str, ...] = HEADER_LABELS) -> str:
+    """Build the prompt header for a tuple of context field values (cached)"""
+    (
+        company_label,
+        industry_label,
+        transaction_type_label,
+        legal_entity_label,
+        transaction_size_label,
+        geographic_scope_label,
+        deal_context_label,
+        additional_notes_label,
+        company_products_label,
+        general_context_label,
+    ) = labels
+    (
+        company_name,
+        industry_sector,
+        transaction_type,
+        legal_entity_type,
+        transaction_size,
+        geographic_scope,
+        deal_context,
+        additional_notes,
+        company_products,
+    ) = fields
+    
+    header_parts = []
+    
+    if company_name:
+        header_parts.append(f"**{company_label}:** {company_name}")
+    if industry_sector:
+        header_parts.append(f"**{industry_label}:** {industry_sector}")
+    if transaction_type:
+        header_parts.append(f"**{transaction_type_label}:** {transaction_type}")
+    if legal_entity_type:
+        header_parts.append(f"**{legal_entity_label}:** {legal_entity_type}")
+    if transaction_size:
+        header_parts.append(f"**{transaction_size_label}:** {transaction_size}")
+    if geographic_scope:
+        header_parts.append(f"**{geographic_scope_label}:** {geographic_scope}")
+    if deal_context:
+        header_parts.append(f"**{deal_context_label}:** {deal_context}")
+    if company_products:
+        header_parts.append(f"\n**{company_products_label}:**\n{company_products}")
+    if additional_notes:
+        header_parts.append(f"**{additional_notes_label}:** {additional_notes}")
+    
+    header = "\n".join(header_parts) if header_parts else f"**{general_context_label}**"
+    header += "\n\n---\n\n"
+    
+    return header
+
+
+@register_collector
+def _header_cache_samples():
+    return cache_info_samples("prompt_header", _render_header.cache_info())
+
+
+class PromptTemplate:
+    """Prompt body compiled once into constant segments and named slots"""
+    
+    __slots__ = ("source", "slots", "_parts", "_slot_positions", "_single_slot")
+    
+    def __init__(self, source: str):
+        self.source = source
+        parts = []
+        slot_positions = []
+        for literal, field_name, _, _ in Formatter().parse(source):
+            if literal:
+                parts.append(literal)
+            if field_name is not None:
+                slot_positions.append((len(parts), field_name))
+                parts.append("")
+        self._parts: Tuple[str, ...] = tuple(parts)
+        self._slot_positions: Tuple[Tuple[int, str], ...] = tuple(slot_positions)
+        self.slots: Tuple[str, ...] = tuple(dict.fromkeys(name for _, name in slot_positions))
         
-        phase1 = header + """**Phase 1: Discovery & Compliance Research**
+        # Phase templates are a header slot followed by one constant body,
+        # so the common case is a single slot spliced between two constants.
+        self._single_slot: Optional[Tuple[str, str, str]] = None
+        if len(slot_positions) == 1:
+            position, name = slot_positions[0]
+            self._single_slot = (
+                "".join(parts[:position]),
+                name,
+                "".join(parts[position + 1:]),
+            )
+    
+    def render(self, **values: str) -> str:
+        """Splice slot values into the constant segments"""
+        if self._single_slot is not None:
+            return self.splice(values[self._single_slot[1]])
+        parts = list(self._parts)
+        for position, name in self._slot_positions:
+            parts[position] = values[name]
+        return "".join(parts)
+    
+    def splice(self, value: str) -> str:
+        """Fast path for single-slot templates: insert ``value`` into the slot"""
+        if self._single_slot is None:
+            raise ValueError(f"Template has {len(self.slots)} slots, splice() needs exactly one")
+        prefix, _, suffix = self._single_slot
+        if prefix:
+            return prefix + value + suffix
+        return value + suffix
+
+
+# Registry of compiled phase templates, in workflow order. Every template
+# has a ``header`` slot that receives the rendered prospect header.
+PHASE_REGISTRY: Dict[str, PromptTemplate] = {}
+
+
+def register_phase(phase_id: str, source: str) -> PromptTemplate:
+    """Compile ``source`` and register it as the template for ``phase_id``"""
+    template = PromptTemplate(source)
+    PHASE_REGISTRY[phase_id] = template
+    return template
+
+
+register_phase("phase1", """{header}**Phase 1: Discovery & Compliance Research**
 
 Research the target company to inform our engagement strategy:
 
@@ -104,9 +413,10 @@ Research the target company to inform our engagement strategy:
    - Directory rankings and recognition trends
    - Strategic initiatives or stated growth priorities
 
-**For each section, distinguish clearly between verified facts (with sources) and reasonable inferences.**"""
+**For each section, distinguish clearly between verified facts (with sources) and reasonable inferences.**""")
 
-        phase2 = header + """**Phase 2: Decision-Making Dynamics Analysis**
+
+register_phase("phase2", """{header}**Phase 2: Decision-Making Dynamics Analysis**
 
 Analyze typical decision-making dynamics for this firm when evaluating solutions:
 
@@ -132,9 +442,10 @@ Analyze typical decision-making dynamics for this firm when evaluating solutions
    - Common hesitations from similar firms in past deals
    - Competitive alternatives they're probably aware of
 
-**Note: These are working hypotheses based on firm type and market context. Validate and refine through actual conversations.**"""
+**Note: These are working hypotheses based on firm type and market context. Validate and refine through actual conversations.**""")
+
 
-        phase25 = header + """**Phase 2.5: Pain Point Hypothesis & Solution Mapping**
+register_phase("phase25", """{header}**Phase 2.5: Pain Point Hypothesis & Solution Mapping**
 
 **Part A: Pain Point Hypothesis**
 
@@ -171,9 +482,10 @@ For each identified pain point above, map to our capabilities:
 - What would measurable success look like for them?
 - What's the implementation complexity?
 
-**Note: These are hypothesized pain points. Create discovery questions to validate in first conversation.**"""
+**Note: These are hypothesized pain points. Create discovery questions to validate in first conversation.**""")
 
-        phase3 = header + """**Phase 3: Credibility-Based Email Outreach**
+
+register_phase("phase3", """{header}**Phase 3: Credibility-Based Email Outreach**
 
 Draft initial outreach emails customized for different stakeholder types.
 
@@ -196,9 +508,10 @@ Draft initial outreach emails customized for different stakeholder types.
 - No buzzwords or vendor-speak
 - Specific to their situation (not a template that could go to any law firm)
 - One clear ask, not multiple options
-- Make it easy to say yes"""
+- Make it easy to say yes""")
+
 
-        phase4 = header + """**Phase 4: Sales Executive Summary**
+register_phase("phase4", """{header}**Phase 4: Sales Executive Summary**
 
 Create a 90-second executive summary for this opportunity:
 
@@ -227,9 +540,10 @@ Create a 90-second executive summary for this opportunity:
    - Target timeline to first meeting
    - Required resources
 
-**Format for quick scanning—use bullets, keep sections tight. No fluff.**"""
+**Format for quick scanning—use bullets, keep sections tight. No fluff.**""")
+
 
-        phase5 = header + """**Phase 5: OUS Framework Analysis**
+register_phase("phase5", """{header}**Phase 5: OUS Framework Analysis**
 
 Analyze this opportunity using the OUS framework. For each score (1-10), provide specific evidence or reasoning.
 
@@ -281,9 +595,10 @@ Overall = (Outcome × 0.35) + (Understanding Pain × 0.35) + (Selection Process
 [Based on the overall score, provide clear next actions and resource allocation guidance]
 
 **KEY GAPS TO ADDRESS:**
-[What critical information is missing? What needs validation in first conversation?]"""
+[What critical information is missing? What needs validation in first conversation?]""")
 
-        phase6 = header + """**Phase 6: Deal Qualification (BANT+ Framework)**
+
+register_phase("phase6", """{header}**Phase 6: Deal Qualification (BANT+ Framework)**
 
 Assess this opportunity against qualification criteria.
 
@@ -332,23 +647,66 @@ Assess this opportunity against qualification criteria.
 3. [Question to validate need]
 4. [Question to validate timeline]
 
-**Recommended Next Actions:**"""
+**Recommended Next Actions:**""")
+
+
+def recipe_fingerprint() -> str:
+    """Stable hash of every registered phase template; changes when recipe text changes"""
+    digest = hashlib.sha256()
+    for phase_id, template in PHASE_REGISTRY.items():
+        digest.update(phase_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(template.source.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _localized(locale: str) -> Tuple[Dict[str, PromptTemplate], Optional[Tuple[str, ...]]]:
+    """Phase templates and header labels for ``locale``; raises KeyError for unknown locales"""
+    if locale == DEFAULT_LOCALE:
+        return PHASE_REGISTRY, None
+    from .language_packs import get_language_pack
+    pack = get_language_pack(locale)
+    return pack.templates, pack.header_labels
+
 
+class PromptRecipeManager:
+    """Manages all prompt recipes for sales prospecting workflow"""
+    
+    @classmethod
+    @timed("phase_render_seconds", "Single phase prompt renders")
+    def render(cls, phase_id: str, context: ProspectContext, locale: str = DEFAULT_LOCALE) -> str:
+        """Build the prompt for a single phase; raises KeyError for unknown phases or locales"""
+        templates, labels = _localized(locale)
+        return templates[phase_id].splice(context.to_prompt_header(labels))
+    
+    @classmethod
+    def iter_workflow(
+        cls, context: ProspectContext, locale: str = DEFAULT_LOCALE
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (phase_id, prompt) pairs one phase at a time, in workflow order"""
+        templates, labels = _localized(locale)
+        header = context.to_prompt_header(labels)
+        for phase_id, template in templates.items():
+            yield phase_id, template.splice(header)
+    
+    @classmethod
+    @timed("workflow_seconds", "Full workflow generations")
+    def generate_full_workflow(cls, context: ProspectContext, locale: str = DEFAULT_LOCALE) -> Dict[str, str]:
+        """Generate all prompts for the complete workflow"""
+        templates, labels = _localized(locale)
+        header = context.to_prompt_header(labels)
         return {
-            "phase1": phase1,
-            "phase2": phase2,
-            "phase25": phase25,
-            "phase3": phase3,
-            "phase4": phase4,
-            "phase5": phase5,
-            "phase6": phase6
+            phase_id: template.splice(header)
+            for phase_id, template in templates.items()
         }
     
     @classmethod
-    def get_individual_prompt(cls, phase: str, context: ProspectContext) -> str:
+    def get_individual_prompt(cls, phase: str, context: ProspectContext, locale: str = DEFAULT_LOCALE) -> str:
         """Get a single prompt by phase name"""
-        all_prompts = cls.generate_full_workflow(context)
-        return all_prompts.get(phase, "")
+        if phase not in PHASE_REGISTRY:
+            return ""
+        return cls.render(phase, context, locale)
     
     @classmethod
     def get_phase_names(cls) -> Dict[str, str]:
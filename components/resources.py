@@ -0,0 +1,101 @@
+"""
+Warm-up of the process-wide engines, so the first user after a deploy does not build them.
+
+Everything here is immutable and shared by every session in the server
+process: compiled phase templates and language packs, the header and
+token-count caches, and the writing checker's jargon patterns. Each is
+otherwise built lazily on first use. warm_up() builds them all once;
+app.py starts a WarmUp from an st.cache_resource function, so it runs in
+a background thread during the first session's first page and is shared
+by all later sessions.
+
+Set APP_WARM_UP=0 to skip it (benchmarks.bench_cold_start compares both).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from . import metrics
+from .language_packs import available_locales, get_language_pack
+from .recipes import PromptRecipeManager, ProspectContext, _localized
+from .tokens import _body_tokens, header_tokens
+from .writing_checker import check_plain_english
+
+ENABLED = os.environ.get("APP_WARM_UP", "1").lower() not in ("0", "false", "no", "off")
+
+# Exercises the case-insensitive jargon pattern too: "İ" changes length when lowercased
+_SAMPLE_TEXT = "We will utilize the İntegration roadmap. The review was completed by the team."
+
+
+@dataclass(frozen=True)
+class WarmUpReport:
+    """Milliseconds spent on each warm-up step."""
+    steps: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.steps.values())
+
+
+def warm_up(locales: Iterable[str] | None = None) -> WarmUpReport:
+    """Build every shared engine for ``locales`` (default: all available) and time each step."""
+    locales = list(available_locales() if locales is None else locales)
+    context = ProspectContext(company_name="Warm-up")
+    steps = {}
+
+    def step(name: str, started: float) -> float:
+        now = time.perf_counter()
+        steps[name] = (now - started) * 1000
+        return now
+
+    started = time.perf_counter()
+    for locale in locales:
+        get_language_pack(locale)
+    started = step("language packs", started)
+
+    for locale in locales:
+        PromptRecipeManager.generate_full_workflow(context, locale)
+    started = step("prompt templates", started)
+
+    for locale in locales:
+        templates, labels = _localized(locale)
+        header_tokens(context, labels)
+        for phase_id in templates:
+            _body_tokens(phase_id, locale)
+    started = step("token estimates", started)
+
+    check_plain_english(_SAMPLE_TEXT)
+    step("writing checker", started)
+
+    report = WarmUpReport(steps)
+    metrics.observe("warm_up_seconds", report.total_ms / 1000, "Start-up warm-up of the shared engines")
+    return report
+
+
+class WarmUp:
+    """warm_up() in a daemon thread; ``report`` is None until it has finished."""
+
+    def __init__(self, locales: Iterable[str] | None = None):
+        self.report: WarmUpReport | None = None
+        self._locales = locales
+        self._thread = threading.Thread(target=self._run, name="warm-up", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        self.report = warm_up(self._locales)
+
+    def wait(self, timeout: float | None = None) -> WarmUpReport | None:
+        """Block until the warm-up has finished (or ``timeout`` seconds) and return its report."""
+        self._thread.join(timeout)
+        return self.report
+
+
+if __name__ == "__main__":
+    report = warm_up()
+    for name, ms in report.steps.items():
+        print(f"{name:<20}{ms:>8.1f} ms")
+    print(f"{'total':<20}{report.total_ms:>8.1f} ms")
@@ -0,0 +1,401 @@
+"""
+Local HTTP service exposing prompt generation for CRM integrations.
+
+Usage:
+    python -m components.service --port 8765 --workers 2
+
+Endpoints (JSON in, JSON out):
+    GET  /health
+    GET  /metrics                    Prometheus text format (see components.metrics)
+    GET  /v1/phases                  phase ids and display names
+    POST /v1/workflow                ProspectContext fields (+ "locale") -> every phase
+    POST /v1/phases/<phase_id>       ProspectContext fields (+ "locale") -> one phase
+    POST /v1/email-templates         generate_all_templates arguments -> templates A and B
+    POST /v1/check                   {"text": ...} -> plain-English analysis
+
+Any POST body may also be a JSON array of request objects; the response
+is an array of results in the same order. Connections are kept alive
+(HTTP/1.1). /v1/check requests with a lot of text are checked in a
+process pool so they do not block other requests.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import os
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from http import HTTPStatus
+from typing import Any, Callable
+
+from . import metrics
+from .cache import get_cached_prompt, get_cached_workflow
+from .email_templates import TEMPLATE_FIELDS, EmailTemplateGenerator
+from .language_packs import get_language_pack
+from .recipes import CONTEXT_FIELDS, DEFAULT_LOCALE, PHASE_REGISTRY, PromptRecipeManager, ProspectContext
+from .writing_checker import check_plain_english
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+if orjson is not None:
+    _loads: Callable[[bytes], Any] = orjson.loads
+    _dumps: Callable[[Any], bytes] = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+DEFAULT_PORT = 8765
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH_ITEMS = 1000
+OFFLOAD_CHARS = 20_000  # /v1/check requests with this much text go to the worker pool
+IDLE_TIMEOUT = 30.0  # seconds a kept-alive connection may sit idle
+
+
+_ROUTES = ("/health", "/metrics", "/v1/phases", "/v1/workflow", "/v1/email-templates", "/v1/check")
+
+
+class PlainText(str):
+    """A dispatch result sent as text rather than JSON."""
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class HTTPError(Exception):
+    """An error response with a status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ----------------------------------------------------------------------
+# Request handlers (one decoded JSON object in, one JSON-ready result out)
+# ----------------------------------------------------------------------
+
+def _require_object(item: Any, allowed: tuple[str, ...]) -> dict[str, str]:
+    if not isinstance(item, dict):
+        raise HTTPError(400, "expected a JSON object")
+    unknown = sorted(set(item) - set(allowed))
+    if unknown:
+        raise HTTPError(400, f"unknown field(s): {', '.join(unknown)}")
+    for name, value in item.items():
+        if not isinstance(value, str):
+            raise HTTPError(400, f"field {name!r} must be a string")
+    if not item.get("company_name", "").strip():
+        raise HTTPError(400, "company_name is required")
+    return item
+
+
+def _context(item: Any) -> tuple[ProspectContext, str]:
+    fields = _require_object(item, CONTEXT_FIELDS + ("locale",))
+    locale = fields.get("locale", DEFAULT_LOCALE)
+    try:
+        get_language_pack(locale)
+    except KeyError:
+        raise HTTPError(400, f"unknown locale {locale!r}") from None
+    return ProspectContext.from_dict(fields), locale
+
+
+def handle_workflow(item: Any) -> dict[str, Any]:
+    """Every phase prompt for one prospect."""
+    context, locale = _context(item)
+    return {"company_name": context.company_name, "locale": locale,
+            "prompts": get_cached_workflow(context, locale)}
+
+
+def handle_phase(phase_id: str, item: Any) -> dict[str, Any]:
+    """One phase prompt for one prospect."""
+    context, locale = _context(item)
+    return {"company_name": context.company_name, "locale": locale, "phase": phase_id,
+            "prompt": get_cached_prompt(phase_id, context, locale)}
+
+
+def handle_email_templates(item: Any) -> dict[str, Any]:
+    """Templates A and B; omitted arguments keep their [placeholder] defaults."""
+    templates = EmailTemplateGenerator.generate_all_templates(**_require_object(item, TEMPLATE_FIELDS))
+    return {key: asdict(template) for key, template in templates.items()}
+
+
+def _check_text(item: Any) -> str:
+    if not isinstance(item, dict) or not isinstance(item.get("text"), str) or set(item) != {"text"}:
+        raise HTTPError(400, 'expected {"text": "..."}')
+    return item["text"]
+
+
+def check_texts(texts: list[str]) -> list[dict[str, Any]]:
+    """Plain-English analysis for each text; runs in the worker pool."""
+    return [check_plain_english(text).to_dict() for text in texts]
+
+
+# ----------------------------------------------------------------------
+# HTTP/1.1 plumbing
+# ----------------------------------------------------------------------
+
+def _parse_head(head: bytes) -> tuple[str, str, str, dict[str, str]]:
+    try:
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise HTTPError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+    return method, target.split("?", 1)[0], version, headers
+
+
+def _route(path: str) -> str:
+    """``path`` with the phase id replaced, so metric labels stay few."""
+    if path in _ROUTES:
+        return path
+    return "/v1/phases/<phase_id>" if path.startswith("/v1/phases/") else "other"
+
+
+@functools.lru_cache(maxsize=None)
+def _request_metrics(route: str, status: int) -> tuple[metrics.Timer, metrics.Counter]:
+    """Metric handles per (route, status); looked up once instead of per request."""
+    return (
+        metrics.REGISTRY.timer("http_request_seconds", "Time to answer HTTP requests", route=route),
+        metrics.REGISTRY.counter("http_responses_total", "HTTP responses by status", route=route, status=status),
+    )
+
+
+def _response(status: int, payload: Any, keep_alive: bool) -> bytes:
+    if isinstance(payload, PlainText):
+        body, content_type = payload.encode("utf-8"), payload.content_type
+    else:
+        body, content_type = _dumps(payload), "application/json"
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class PromptService:
+    """
+    asyncio HTTP server for the prompt, email-template and writing-check endpoints.
+
+    Prompt and template requests are answered on the event loop; they take
+    microseconds and hit the shared workflow cache. /v1/check requests with
+    ``offload_chars`` or more of text in total are split across a pool of
+    ``workers`` processes (0 checks everything on the event loop).
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        offload_chars: int = OFFLOAD_CHARS,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ):
+        self.workers = workers
+        self.offload_chars = offload_chars
+        self.idle_timeout = idle_timeout
+        self._pool: ProcessPoolExecutor | None = None
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> asyncio.Server:
+        """Start listening (and the worker pool); returns the asyncio server."""
+        if self.workers > 0:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            loop = asyncio.get_running_loop()
+            # Start the processes now rather than on the first large check
+            await asyncio.gather(*(
+                loop.run_in_executor(self._pool, check_texts, [""]) for _ in range(self.workers)
+            ))
+        self._server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_HEADER_BYTES)
+        return self._server
+
+    async def close(self) -> None:
+        """Stop accepting connections and shut the worker pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Any:
+        """Route one request and return its JSON-ready result; raises HTTPError."""
+        if path == "/health":
+            self._require_method(method, "GET")
+            return {"status": "ok", "check_workers": self.workers}
+        if path == "/metrics":
+            self._require_method(method, "GET")
+            return PlainText(metrics.render_prometheus())
+        if path == "/v1/phases":
+            self._require_method(method, "GET")
+            names = PromptRecipeManager.get_phase_names()
+            return {phase_id: names.get(phase_id, phase_id) for phase_id in PHASE_REGISTRY}
+
+        if path == "/v1/workflow":
+            handler = handle_workflow
+        elif path == "/v1/email-templates":
+            handler = handle_email_templates
+        elif path == "/v1/check":
+            handler = None
+        elif path.startswith("/v1/phases/"):
+            phase_id = path[len("/v1/phases/"):]
+            if phase_id not in PHASE_REGISTRY:
+                raise HTTPError(404, f"unknown phase {phase_id!r}")
+            handler = functools.partial(handle_phase, phase_id)
+        else:
+            raise HTTPError(404, f"no such endpoint {path!r}")
+        self._require_method(method, "POST")
+
+        try:
+            payload = _loads(body)
+        except ValueError as e:
+            raise HTTPError(400, f"invalid JSON: {e}") from None
+        batch = isinstance(payload, list)
+        items = payload if batch else [payload]
+        if len(items) > MAX_BATCH_ITEMS:
+            raise HTTPError(413, f"at most {MAX_BATCH_ITEMS} items per batch")
+
+        if handler is None:
+            results = await self._check([_check_text(item) for item in items])
+        else:
+            results = []
+            for index, item in enumerate(items):
+                try:
+                    results.append(handler(item))
+                except HTTPError as e:
+                    if batch:
+                        e.message = f"item {index}: {e.message}"
+                    raise
+        return results if batch else results[0]
+
+    async def _check(self, texts: list[str]) -> list[dict[str, Any]]:
+        if self._pool is None or sum(map(len, texts)) < self.offload_chars:
+            return check_texts(texts)
+        loop = asyncio.get_running_loop()
+        size = -(-len(texts) // self.workers)  # ceil: one chunk per worker
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self._pool, check_texts, texts[i:i + size])
+            for i in range(0, len(texts), size)
+        ))
+        return [result for chunk in chunks for result in chunk]
+
+    @staticmethod
+    def _require_method(method: str, expected: str) -> None:
+        if method != expected:
+            raise HTTPError(405, f"use {expected}")
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: dict[str, str]) -> bytes:
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(501, "chunked request bodies are not supported; send Content-Length")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "invalid Content-Length") from None
+        if length < 0:
+            raise HTTPError(400, "invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"request body over {MAX_BODY_BYTES} bytes")
+        return await reader.readexactly(length) if length else b""
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(431, {"error": "request headers too large"}, False))
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                started = time.perf_counter()
+                keep_alive = False
+                body = None
+                path = ""
+                try:
+                    method, path, version, headers = _parse_head(head)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                    body = await self._read_body(reader, headers)
+                    status, payload = 200, await self.dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": e.message}
+                    # An unread request body would be parsed as the next request
+                    keep_alive = keep_alive and body is not None
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception:
+                    traceback.print_exc()
+                    status, payload, keep_alive = 500, {"error": "internal error"}, False
+
+                writer.write(_response(status, payload, keep_alive))
+                if metrics.ENABLED:
+                    timer, responses = _request_metrics(_route(path), status)
+                    timer.observe(time.perf_counter() - started)
+                    responses.inc()
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+async def serve(host: str, port: int, workers: int) -> None:
+    """Run the service until cancelled."""
+    service = PromptService(workers=workers)
+    server = await service.start(host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving on http://{address[0]}:{address[1]} ({workers} check workers)", file=sys.stderr, flush=True)
+    # Stop cleanly on SIGTERM too, so the check workers are shut down with the server
+    serving = asyncio.ensure_future(server.serve_forever())
+    with contextlib.suppress(NotImplementedError):  # no signal handlers on Windows event loops
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+    try:
+        await serving
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await service.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m components.service",
+        description="Serve prompts, email templates and plain-English checks over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=max(1, (os.cpu_count() or 1) - 1),
+        help="Processes for plain-English checks (default: CPU count - 1; 0 checks in-process)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Per-session store of generated outputs, keyed by prospect fingerprint."""
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+from .cache import LRUCache, context_fingerprint
+from .recipes import DEFAULT_LOCALE, ProspectContext
+
+# Defaults, overridable per deployment through the environment
+DEFAULT_SESSION_MAX_BYTES = int(os.environ.get("SESSION_OUTPUT_MAX_BYTES", str(2 * 1024 * 1024)))
+DEFAULT_SESSION_MAX_ENTRIES = int(os.environ.get("SESSION_OUTPUT_MAX_ENTRIES", "128"))
+
+
+@dataclass(frozen=True)
+class StoredOutput:
+    """A generated output and the prospect and locale it was generated for."""
+    value: Any
+    context: ProspectContext
+    locale: str = DEFAULT_LOCALE
+    stale: bool = False
+
+
+def _sizeof_output(output: StoredOutput) -> int:
+    """Approximate memory held by an output: a prompt or a phase_id -> prompt mapping."""
+    value = output.value
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(key) + sys.getsizeof(item) for key, item in value.items()
+        )
+    return sys.getsizeof(value)
+
+
+class SessionOutputStore:
+    """
+    Generated outputs for one user session.
+
+    Outputs are stored under (output id, locale, context fingerprint), so
+    going back to an earlier prospect shows its outputs again without
+    regenerating. When the sidebar changes, the latest output for an id
+    is still returned, marked stale, until it is generated again. Total
+    size is capped per session; the least recently used outputs go first.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_SESSION_MAX_BYTES,
+        max_entries: int = DEFAULT_SESSION_MAX_ENTRIES,
+    ):
+        self._outputs = LRUCache(max_entries=max_entries, max_bytes=max_bytes, sizeof=_sizeof_output)
+        self._latest: dict[str, tuple[str, str]] = {}  # output id -> key of the newest output
+
+    def put(self, output_id: str, context: ProspectContext, value: Any, locale: str = DEFAULT_LOCALE) -> None:
+        """Store ``value`` as the output ``output_id`` for ``context`` in ``locale``."""
+        key = (locale, context_fingerprint(context))
+        self._outputs.put((output_id, key), StoredOutput(value, context, locale))
+        self._latest[output_id] = key
+
+    def get(self, output_id: str, context: ProspectContext, locale: str = DEFAULT_LOCALE) -> StoredOutput | None:
+        """
+        Return the output for ``context``, or the newest one marked stale.
+
+        Returns None if ``output_id`` was never generated or its outputs
+        have been evicted.
+        """
+        output = self._outputs.get((output_id, (locale, context_fingerprint(context))))
+        if output is not None:
+            return output
+        latest = self._latest.get(output_id)
+        if latest is None:
+            return None
+        output = self._outputs.get((output_id, latest))
+        if output is None:
+            del self._latest[output_id]
+            return None
+        return StoredOutput(output.value, output.context, output.locale, stale=True)
+
+    def clear(self) -> None:
+        """Drop every output."""
+        self._outputs.clear()
+        self._latest.clear()
+
+    @property
+    def bytes(self) -> int:
+        """Approximate memory held by stored outputs."""
+        return self._outputs.stats().bytes
+
+    def __len__(self) -> int:
+        return len(self._outputs)
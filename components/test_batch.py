@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from components.batch import iter_records, main, run_batch
+from components.recipes import PromptRecipeManager, ProspectContext
+
+ROWS = [
+    {"company_name": "ACME Holdings", "industry_sector": "Technology/Software"},
+    {"company_name": "Northwind LLP", "deal_context": "Cross-border merger."},
+    {"company_name": "Contoso / Bank", "transaction_type": "IPO Preparation"},
+]
+
+
+def _write_jsonl(path, rows):
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n\n", encoding="utf-8")
+    return path
+
+
+def test_iter_records_reads_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "prospects.csv"
+    csv_path.write_text("company_name,industry_sector\nACME Holdings,Technology/Software\n", encoding="utf-8")
+    assert list(iter_records(csv_path)) == [ROWS[0]]
+    assert list(iter_records(_write_jsonl(tmp_path / "prospects.jsonl", ROWS))) == ROWS
+
+
+def test_iter_records_drops_a_byte_order_mark(tmp_path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_bytes("company_name,industry_sector\r\nACME Holdings,Technology/Software\r\n".encode("utf-8-sig"))
+    assert list(iter_records(csv_path)) == [ROWS[0]]
+    jsonl_path = tmp_path / "export.jsonl"
+    jsonl_path.write_bytes(json.dumps(ROWS[1]).encode("utf-8-sig"))
+    assert list(iter_records(jsonl_path)) == [ROWS[1]]
+
+
+@pytest.mark.parametrize(("line", "message"), [("{oops", "invalid JSON"), ("[1, 2]", "expected a JSON object")])
+def test_iter_records_reports_the_bad_line(tmp_path, line, message):
+    path = tmp_path / "bad.jsonl"
+    path.write_text(json.dumps(ROWS[0]) + "\n" + line + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=f"bad.jsonl:2: {message}"):
+        list(iter_records(path))
+
+
+def test_run_batch_in_a_worker_pool_matches_in_process():
+    serial = list(run_batch(ROWS, len))
+    pooled = sorted(run_batch(ROWS, len, workers=2, chunksize=1))
+    assert sorted(serial) == pooled == [2, 2, 2]
+
+
+def test_cli_writes_one_jsonl_line_per_prospect(tmp_path):
+    output = tmp_path / "prompts.jsonl"
+    assert main([str(_write_jsonl(tmp_path / "in.jsonl", ROWS)), "--output", str(output), "--workers", "1"]) == 0
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [line["row"] for line in lines] == [0, 1, 2]
+    assert lines[1]["prompts"] == PromptRecipeManager.generate_full_workflow(ProspectContext.from_dict(ROWS[1]))
+
+
+def test_cli_writes_a_folder_per_prospect(tmp_path):
+    output = tmp_path / "dossiers"
+    assert main([str(_write_jsonl(tmp_path / "in.jsonl", ROWS)), "--output-dir", str(output), "--workers", "2"]) == 0
+    folders = sorted(path.name for path in output.iterdir())
+    assert folders == ["000000_ACME_Holdings", "000001_Northwind_LLP", "000002_Contoso_Bank"]
+    assert sorted(path.name for path in (output / folders[0]).iterdir()) == sorted(
+        f"{phase_id}.txt" for phase_id in PromptRecipeManager.get_phase_names()
+    )
+
+
+def test_cli_reports_bad_input(tmp_path, capsys):
+    path = tmp_path / "bad.jsonl"
+    path.write_text("{oops\n", encoding="utf-8")
+    assert main([str(path), "--output", str(tmp_path / "out.jsonl"), "--workers", "1"]) == 1
+    assert "error:" in capsys.readouterr().err
@@ -0,0 +1,64 @@
+import pytest
+
+from components.cache import (
+    WORKFLOW_CACHE,
+    LRUCache,
+    get_cached_prompt,
+    get_cached_workflow,
+    invalidate_workflow_cache,
+    iter_cached_workflow,
+)
+from components.recipes import PHASE_REGISTRY, PromptRecipeManager, ProspectContext, register_phase
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    invalidate_workflow_cache()
+    yield
+    invalidate_workflow_cache()
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2, sizeof=lambda value: 1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 1, 1, 2)
+    assert stats.hit_rate == 0.5
+
+
+def test_lru_is_bounded_by_size():
+    cache = LRUCache(max_bytes=10, sizeof=len)
+    cache.put("big", "x" * 11)
+    assert cache.get("big") is None
+    cache.put("a", "x" * 6)
+    cache.put("b", "x" * 6)
+    assert len(cache) == 1 and cache.stats().bytes == 6
+    cache.configure(max_bytes=5)
+    assert len(cache) == 0
+
+
+def test_cached_workflow_matches_a_fresh_one():
+    context = ProspectContext(company_name="ACME Holdings")
+    expected = PromptRecipeManager.generate_full_workflow(context)
+    assert get_cached_workflow(context) == expected
+    hits = WORKFLOW_CACHE.stats().hits
+    assert dict(iter_cached_workflow(context)) == expected
+    assert get_cached_prompt("phase3", context) == expected["phase3"]
+    assert WORKFLOW_CACHE.stats().hits == hits + 2
+
+
+def test_recipe_edited_at_run_time_is_not_served_stale():
+    context = ProspectContext(company_name="ACME Holdings")
+    original = PHASE_REGISTRY["phase1"].source
+    get_cached_workflow(context)
+    try:
+        register_phase("phase1", original + "\nEdited at run time.")
+        assert get_cached_workflow(context)["phase1"].endswith("Edited at run time.")
+        assert get_cached_prompt("phase1", context).endswith("Edited at run time.")
+    finally:
+        register_phase("phase1", original)
+    assert get_cached_workflow(context)["phase1"] == PromptRecipeManager.render("phase1", context)
@@ -0,0 +1,57 @@
+import io
+import zipfile
+
+from components.dossier import DOSSIER_CACHE, HEADER_FILE, HEADER_MARKER, build_dossier, dossier_filename, get_dossier
+from components.recipes import PHASE_REGISTRY, PromptRecipeManager, ProspectContext
+from components.tokens import fit_workflow
+
+CONTEXT = ProspectContext(company_name="ABC Corporation", industry_sector="Financial Services")
+
+
+def _files(archive: bytes) -> dict[str, str]:
+    with zipfile.ZipFile(io.BytesIO(archive)) as zipped:
+        return {name: zipped.read(name).decode("utf-8") for name in zipped.namelist()}
+
+
+def test_phases_rebuild_the_full_prompts():
+    files = _files(build_dossier(CONTEXT))
+    header = files[HEADER_FILE]
+    prompts = PromptRecipeManager.generate_full_workflow(CONTEXT)
+    phase_files = sorted(name for name in files if name.startswith("phases/"))
+    assert len(phase_files) == len(PHASE_REGISTRY)
+    for name, (phase_id, prompt) in zip(phase_files, prompts.items()):
+        assert name.endswith(f"_{phase_id}.md")
+        assert files[name].replace(HEADER_MARKER, header) == prompt
+
+
+def test_archive_holds_emails_and_report():
+    files = _files(build_dossier(CONTEXT))
+    assert {"README.md", "emails/template_a.md", "emails/template_b.md", "report.md"} <= set(files)
+    assert "ABC Corporation" in files["emails/template_a.md"]
+    assert "| 1 | phases/01_phase1.md |" in files["report.md"]
+
+
+def test_same_context_gives_the_same_bytes_and_is_cached():
+    assert build_dossier(CONTEXT) == build_dossier(CONTEXT)
+    before = DOSSIER_CACHE.stats()
+    first = get_dossier(CONTEXT)
+    assert get_dossier(CONTEXT) is first
+    after = DOSSIER_CACHE.stats()
+    assert after.hits - before.hits >= 1
+
+
+def test_dossier_filename_is_safe():
+    assert dossier_filename(ProspectContext(company_name="A/B & Co.")) == "dossier_A_B_Co.zip"
+    assert dossier_filename(ProspectContext()) == "dossier_prospect.zip"
+
+
+def test_fitted_prompts_are_stored_as_shown():
+    context = CONTEXT.replace(additional_notes=" ".join(f"Note number {i} about the deal." for i in range(300)))
+    fitted = {phase_id: prompt.prompt for phase_id, prompt in fit_workflow(context, 1500).items()}
+    files = _files(build_dossier(context, prompts=fitted))
+    header = files[HEADER_FILE]
+    phase_files = sorted(name for name in files if name.startswith("phases/"))
+    for name, prompt in zip(phase_files, fitted.values()):
+        assert files[name].replace(HEADER_MARKER, header) == prompt
+    assert any(HEADER_MARKER not in files[name] for name in phase_files)
+    assert get_dossier(context, prompts=fitted) != get_dossier(context)
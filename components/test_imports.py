@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import components
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loaded_after(statement: str) -> set[str]:
+    """Modules present in a fresh interpreter after running ``statement``."""
+    script = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_package_import_loads_no_submodules():
+    loaded = _loaded_after("import components")
+    assert not {name for name in loaded if name.startswith("components.")}
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from components import PromptRecipeManager",
+        "from components import ProspectPreset, check_plain_english",
+        "import components.batch, components.mail_merge, components.service",
+    ],
+)
+def test_engines_do_not_import_streamlit(statement):
+    assert "streamlit" not in _loaded_after(statement)
+
+
+def test_every_export_resolves():
+    for name in components.__all__:
+        assert getattr(components, name) is not None
+    assert set(components.__all__) <= set(dir(components))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        components.missing
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from components import language_packs
+from components.language_packs import available_locales, clear_language_packs, get_language_pack
+from components.recipes import PHASE_REGISTRY, PromptRecipeManager, ProspectContext
+
+CONTEXT = ProspectContext(company_name="ACME Holdings")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_packs():
+    clear_language_packs()
+    yield
+    clear_language_packs()
+
+
+def test_available_locales_lists_the_pack_files():
+    assert available_locales() == ["en", "zh-Hans", "zh-Hant"]
+
+
+def test_pack_is_loaded_once_and_shared():
+    pack = get_language_pack("zh-Hans")
+    assert get_language_pack("zh-Hans") is pack
+    assert list(pack.templates) == list(PHASE_REGISTRY)
+
+
+def test_untranslated_phases_get_the_response_instruction_after_the_header():
+    prompt = PromptRecipeManager.render("phase1", CONTEXT, "zh-Hans")
+    assert prompt.startswith("**公司:** ACME Holdings\n\n---\n\n**输出语言：**")
+    assert prompt.endswith(PHASE_REGISTRY["phase1"].splice(""))
+
+
+@pytest.mark.parametrize("locale", ["fr", "../locales/zh-Hans", "zh-Hans.json"])
+def test_unknown_locales_raise_key_error(locale):
+    with pytest.raises(KeyError):
+        get_language_pack(locale)
+
+
+def test_translations_and_label_fallback(tmp_path, monkeypatch):
+    (tmp_path / "de.json").write_text(
+        json.dumps({
+            "header_labels": {"company_name": "Unternehmen"},
+            "response_instruction": "Antworte auf Deutsch {bitte}.",
+            "phases": {"phase2": "{header}Phase 2 auf Deutsch"},
+        }),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(language_packs, "LOCALES_DIR", tmp_path)
+    context = CONTEXT.replace(industry_sector="Real Estate")
+    assert PromptRecipeManager.render("phase2", context, "de") == (
+        "**Unternehmen:** ACME Holdings\n**Industry:** Real Estate\n\n---\n\nPhase 2 auf Deutsch"
+    )
+    assert "Antworte auf Deutsch {bitte}.\n\n**Phase 1" in PromptRecipeManager.render("phase1", context, "de")
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from components.email_templates import EmailTemplateGenerator
+from components.mail_merge import main, merge_record
+from components.writing_checker import check_plain_english
+
+RECIPIENTS = [
+    {"company_name": "ACME Holdings", "buyer_name": "Dana", "pain_point": "manual cite-checking"},
+    {"company_name": "", "buyer_name": "Nobody"},
+    {"company_name": "Northwind LLP", "outcome": None},
+]
+
+
+def test_merge_record_matches_the_templates():
+    merged = merge_record(RECIPIENTS[0])
+    templates = EmailTemplateGenerator.generate_all_templates(**RECIPIENTS[0])
+    assert merged["company_name"] == "ACME Holdings"
+    for key, template in templates.items():
+        assert merged[key] == {"subject": template.subject, "body": template.body}
+
+
+def test_blank_fields_keep_the_placeholders():
+    merged = merge_record(RECIPIENTS[2])
+    assert merged == merge_record({"company_name": "Northwind LLP"})
+
+
+def test_merge_record_with_check_matches_a_full_check():
+    for record in (RECIPIENTS[0], RECIPIENTS[2], RECIPIENTS[0]):
+        merged = merge_record(record, check=True)
+        for key, draft in merged.items():
+            if key != "company_name":
+                assert draft["check"] == check_plain_english(draft["body"]).to_dict()
+
+
+def test_company_name_is_required():
+    with pytest.raises(ValueError, match="company_name is required"):
+        merge_record(RECIPIENTS[1])
+
+
+def test_cli_writes_errors_in_place(tmp_path, capsys):
+    source = tmp_path / "recipients.jsonl"
+    source.write_text("\n".join(json.dumps(row) for row in RECIPIENTS), encoding="utf-8")
+    output = tmp_path / "drafts.jsonl"
+    assert main([str(source), "--output", str(output), "--workers", "1", "--check"]) == 0
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [line["row"] for line in lines] == [0, 1, 2]
+    assert lines[1] == {"row": 1, "error": "company_name is required"}
+    assert "Merged 2 recipients (1 rows without company_name)" in capsys.readouterr().err
+
+
+def test_cli_reads_csv_exports_with_a_byte_order_mark(tmp_path):
+    source = tmp_path / "recipients.csv"
+    source.write_bytes("company_name,buyer_name\r\nACME Holdings,Dana\r\n".encode("utf-8-sig"))
+    output = tmp_path / "drafts.jsonl"
+    assert main([str(source), "--output", str(output), "--workers", "1"]) == 0
+    [line] = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert line["company_name"] == "ACME Holdings"
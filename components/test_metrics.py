@@ -0,0 +1,65 @@
+import pytest
+
+from components import metrics
+from components.metrics import Registry, Sample, render_prometheus, write_textfile
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = Registry()
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    monkeypatch.setattr(metrics, "SAMPLE_EVERY", 2)
+    return registry
+
+
+def _double(value):
+    return value * 2
+
+
+def test_timed_returns_the_function_when_disabled(monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+    assert metrics.timed("double_seconds")(_double) is _double
+
+
+def test_timed_counts_every_call_and_samples_some(registry):
+    double = metrics.timed("double_seconds", "Doubles", kind="int")(_double)
+    assert [double(i) for i in range(5)] == [0, 2, 4, 6, 8]
+    count, total = registry.timer("double_seconds", kind="int").snapshot()
+    assert count == 5
+    assert total >= 0
+
+
+def test_counters_and_collectors_in_prometheus_format(registry):
+    metrics.inc("presets_total", 3, "Presets read", direction="import")
+    metrics.inc("presets_total", direction="import")
+    metrics.observe("render_seconds", 0.5, "Renders")
+    registry.register_collector(lambda: [Sample("cache_entries", "gauge", "Entries", (("cache", 'a"b'),), 7)])
+    assert render_prometheus(registry) == (
+        "# HELP prompt_builder_presets_total Presets read\n"
+        "# TYPE prompt_builder_presets_total counter\n"
+        'prompt_builder_presets_total{direction="import"} 4\n'
+        "# HELP prompt_builder_render_seconds Renders\n"
+        "# TYPE prompt_builder_render_seconds summary\n"
+        "prompt_builder_render_seconds_count 1\n"
+        "prompt_builder_render_seconds_sum 0.5\n"
+        "# HELP prompt_builder_cache_entries Entries\n"
+        "# TYPE prompt_builder_cache_entries gauge\n"
+        'prompt_builder_cache_entries{cache="a\\"b"} 7\n'
+    )
+
+
+def test_write_textfile_replaces_the_file(registry, tmp_path):
+    path = tmp_path / "prompt_builder.prom"
+    path.write_text("old", encoding="utf-8")
+    metrics.inc("presets_total")
+    write_textfile(path, registry)
+    assert path.read_text(encoding="utf-8") == render_prometheus(registry)
+    assert [p.name for p in tmp_path.iterdir()] == ["prompt_builder.prom"]
+
+
+def test_reset_keeps_collectors(registry):
+    metrics.inc("presets_total")
+    registry.register_collector(lambda: [Sample("up", "gauge", "", (), 1)])
+    registry.reset()
+    assert render_prometheus(registry) == "# TYPE prompt_builder_up gauge\nprompt_builder_up 1\n"
@@ -0,0 +1,235 @@
+import json
+import math
+
+import pytest
+
+from components.ous_scoring import (
+    DEPRIORITIZE,
+    INCOMPLETE,
+    PURSUE,
+    STANDARD,
+    OUSPortfolio,
+    ParsedResponse,
+    main,
+    parse_ous_response,
+    rank_accounts,
+)
+from components.recipes import PHASE_REGISTRY, ProspectContext
+
+# As the model fills in the Phase 5 template, with the subscore lines kept
+TEMPLATE_FILLED = """**Company:** Northwind Insurance Group
+
+**Phase 5: OUS Framework Analysis**
+
+**OUTCOME (weight: 35%)**
+
+- Strategic goals this solution would support: **Score:** 8 / **Evidence:** Board-mandated claims automation by 2026.
+- Alignment with stated priorities or strategic initiatives: **Score:** 9 / **Evidence:** CEO letter names legal spend.
+- Long-term value potential beyond immediate problem-solving: **Score:** 7 / **Evidence:** Could extend to compliance.
+- Executive visibility and sponsorship potential: **Score:** 8 / **Evidence:** GC reports to the CEO.
+
+**Outcome Subscore:** 8 / 10
+
+---
+
+**UNDERSTANDING PAIN (weight: 35%)**
+
+- Severity of pain points we can address (1=minor annoyance, 10=critical business issue): **Score:** 9 / **Evidence:** Two regulator fines in 2024.
+- Cost of status quo: **Score:** 8 / **Evidence:** Outside counsel spend up 30%.
+- Urgency/time pressure to solve this pain: **Score:** 7 / **Evidence:** Audit in Q3.
+- Our ability to articulate their pain better than they can: **Score:** 6 / **Evidence:** Limited access so far.
+
+**Understanding Pain Subscore:** 7.5 / 10
+
+---
+
+**SELECTION PROCESS (weight: 30%)**
+
+- Clarity on their evaluation criteria and decision process: **Score:** 6 / **Evidence:** RFP expected, no criteria yet.
+- Decision-maker access and influence: **Score:** 7 / **Evidence:** Met the deputy GC.
+
+**Selection Process Subscore:** 6.5 / 10
+
+---
+
+**OVERALL OUS SCORE:**
+Overall = (Outcome × 0.35) + (Understanding Pain × 0.35) + (Selection Process × 0.30)
+
+**Overall Score:** 7.38 / 10
+"""
+
+# Numbered markdown headings, item scores only: the subscore lines were dropped
+NUMBERED_HEADINGS = """## OUS Framework Analysis: Contoso Bank
+
+### 1. Outcome (Weight: 35%)
+- Strategic goals this solution would support — **Score: 9/10**. Evidence: digital-first legal ops programme.
+- Alignment with stated priorities — **Score: 7/10**. Evidence: cost-cutting mandate.
+
+### 2. Understanding Pain (Weight: 35%)
+- Severity of pain points — **Score: 8/10**. Evidence: manual contract review backlog.
+- Cost of status quo — **Score: 6/10**. Evidence: two FTEs on clause extraction.
+
+### 3. Selection Process (Weight: 30%)
+- Clarity on evaluation criteria — **Score: 5/10**. Evidence: procurement not yet engaged.
+- Decision-maker access — **Score: 7/10**. Evidence: sponsor identified.
+
+### 4. Overall OUS Score
+Overall = (8 × 0.35) + (7 × 0.35) + (6 × 0.30) = 7.05
+"""
+
+# Subscores separated from their labels by dashes instead of colons
+DASHES = """Outcome Subscore - 8
+Understanding Pain Subscore – 7
+Selection Process Sub-score — 6.5
+"""
+
+CHINESE = """**成果子分数：** 9
+**痛点理解子分数：** 8.5
+**选择流程子分数：** 7
+**总分：** 8.2
+"""
+
+
+def _unfilled() -> str:
+    return PHASE_REGISTRY["phase5"].splice(ProspectContext(company_name="Blank Co").to_prompt_header())
+
+
+def test_template_filled_in():
+    parsed = parse_ous_response(TEMPLATE_FILLED)
+    assert parsed.account == "Northwind Insurance Group"
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (8.0, 7.5, 6.5)
+    assert parsed.reported_overall == 7.38
+    assert parsed.from_items == ()
+
+
+def test_numbered_headings_fall_back_to_item_scores():
+    parsed = parse_ous_response(NUMBERED_HEADINGS, "Contoso Bank")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (8.0, 7.0, 6.0)
+    assert parsed.from_items == ("outcome", "understanding_pain", "selection_process")
+
+
+def test_dashes_between_label_and_score():
+    parsed = parse_ous_response(DASHES, "Dash Co")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (8.0, 7.0, 6.5)
+
+
+def test_chinese_labels():
+    parsed = parse_ous_response(CHINESE, "中文公司")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (9.0, 8.5, 7.0)
+    assert parsed.reported_overall == 8.2
+
+
+def test_unfilled_template_is_incomplete():
+    parsed = parse_ous_response(_unfilled())
+    assert parsed.account == "Blank Co"
+    assert all(math.isnan(getattr(parsed, name)) for name in ("outcome", "understanding_pain", "selection_process"))
+
+
+def test_blank_subscore_does_not_read_the_next_heading_number():
+    text = "**Outcome Subscore:**\n\n---\n\n### 2. Understanding Pain (Weight: 35%)\n- Severity: **Score:** 4\n"
+    parsed = parse_ous_response(text, "Gap Co")
+    assert math.isnan(parsed.outcome)
+    assert parsed.understanding_pain == 4.0
+
+
+def test_markdown_table_rows():
+    text = (
+        "| Subscore | Score |\n|---|---|\n"
+        "| Outcome Subscore | 7 |\n| Understanding Pain Subscore | 8.5 |\n| Selection Process Subscore | 6 |\n"
+    )
+    parsed = parse_ous_response(text, "Table Co")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (7.0, 8.5, 6.0)
+
+
+def test_label_equals_score():
+    parsed = parse_ous_response("Outcome = 7\nUnderstanding Pain = 8\nSelection Process = 6.5\n", "Equals Co")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (7.0, 8.0, 6.5)
+
+
+def test_out_of_ten_before_or_after_the_score():
+    text = (
+        "**Outcome Subscore (out of 10):** 7\n"
+        "**Understanding Pain:** 8 (out of 10)\n"
+        "**Selection Process (out of 10):** 6\n"
+    )
+    parsed = parse_ous_response(text, "Scale Co")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (7.0, 8.0, 6.0)
+
+
+def test_subscores_list_under_a_heading():
+    text = "**Subscores:**\n- Outcome: 7\n- Understanding Pain: 8\n- Selection Process: 6\n\n**Overall Score:** 7.05\n"
+    parsed = parse_ous_response(text, "List Co")
+    assert (parsed.outcome, parsed.understanding_pain, parsed.selection_process) == (7.0, 8.0, 6.0)
+    assert parsed.from_items == ()
+
+
+def test_weights_are_not_read_as_scores():
+    parsed = parse_ous_response("- Outcome: 35%\n- Understanding Pain: 35%\n", "Weights Co")
+    assert math.isnan(parsed.outcome) and math.isnan(parsed.understanding_pain)
+
+
+def _parsed(outcome: float, pain: float, selection: float, account: str = "") -> ParsedResponse:
+    return ParsedResponse(0, account, outcome, pain, selection)
+
+
+@pytest.mark.parametrize(
+    ("subscores", "tier"),
+    [
+        ((8, 8, 8), PURSUE),
+        ((9, 7, 8), PURSUE),  # 8.0 exactly, despite float error in the weighted sum
+        ((8, 8, 7.985), STANDARD),  # 7.9955: shown as 8.0, but below "8+"
+        ((6, 6, 6), STANDARD),
+        ((5.99, 6, 6), DEPRIORITIZE),
+        ((8, math.nan, 8), INCOMPLETE),
+    ],
+)
+def test_tiers_use_the_unrounded_score(subscores, tier):
+    [ranked] = OUSPortfolio([_parsed(*subscores)]).rank()
+    assert ranked.tier == tier
+
+
+def test_rank_orders_by_score_with_incomplete_last():
+    portfolio = OUSPortfolio([
+        _parsed(5, 5, 5, "low"),
+        _parsed(math.nan, 9, 9, "incomplete"),
+        _parsed(9, 9, 9, "high"),
+        _parsed(5, 5, 5, "low tie"),
+    ])
+    ranked = portfolio.rank()
+    assert [account.account for account in ranked] == ["high", "low", "low tie", "incomplete"]
+    assert [account.rank for account in ranked] == [1, 2, 3, 4]
+    assert ranked[-1].missing == ("outcome",)
+
+
+def test_rank_accounts_from_records():
+    records = [
+        {"account": "Contoso Bank", "response": NUMBERED_HEADINGS},
+        {"company_name": "Northwind", "response": TEMPLATE_FILLED},
+        {"account": "Blank Co", "response": _unfilled()},
+    ]
+    ranked = rank_accounts(records)
+    assert [(account.account, account.tier) for account in ranked] == [
+        ("Northwind", STANDARD),
+        ("Contoso Bank", STANDARD),
+        ("Blank Co", INCOMPLETE),
+    ]
+    assert [account.overall for account in ranked[:2]] == [7.38, 7.05]
+    assert ranked[-1].to_dict()["overall"] is None
+
+
+def test_cli_writes_the_ranking_and_warns_about_incomplete_accounts(tmp_path, capsys):
+    source = tmp_path / "responses.jsonl"
+    source.write_text(
+        "\n".join(json.dumps(record) for record in [
+            {"account": "Dash Co", "response": DASHES},
+            {"account": "Blank Co", "response": _unfilled()},
+        ]),
+        encoding="utf-8",
+    )
+    output = tmp_path / "ranked.csv"
+    assert main([str(source), "--output", str(output)]) == 0
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("rank,account,overall,tier")
+    assert lines[1].startswith("1,Dash Co,7.2,standard")
+    err = capsys.readouterr().err
+    assert "warning: Blank Co (row 1): no outcome, understanding pain, selection process subscore found" in err
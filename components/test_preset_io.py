@@ -0,0 +1,68 @@
+import gzip
+import json
+
+import pytest
+
+from components.preset_io import ImportReport, iter_presets_jsonl, main, validate_preset_record, write_presets_jsonl
+from components.preset_store import PresetStore
+from components.presets import ProspectPreset
+
+PRESETS = [
+    ProspectPreset(
+        company_name=f"Company {i}",
+        company_url=f"https://example.com/{i}",
+        practice_area="M&A (Buyer)",
+        buyer_persona="General Counsel",
+        notes="Café – São Paulo office",
+    )
+    for i in range(3)
+]
+
+
+@pytest.mark.parametrize("name", ["presets.jsonl", "presets.jsonl.gz"])
+def test_write_and_read_round_trip(tmp_path, name):
+    path = tmp_path / name
+    assert write_presets_jsonl(PRESETS, path) == 3
+    assert list(iter_presets_jsonl(path)) == PRESETS
+    if name.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            assert json.loads(handle.readline())["notes"] == "Café – São Paulo office"
+
+
+def test_bad_lines_are_skipped_and_reported(tmp_path):
+    path = tmp_path / "mixed.jsonl"
+    good = json.dumps({"company_name": "Good Co", "company_url": "", "practice_area": "", "buyer_persona": ""})
+    path.write_text(
+        "\n".join([good, "{oops", '{"company_name": "No Url"}', "", "[1]", good.replace("Good", "Also Good")]) + "\n",
+        encoding="utf-8",
+    )
+    report = ImportReport()
+    presets = list(iter_presets_jsonl(path, report))
+    assert [preset.company_name for preset in presets] == ["Good Co", "Also Good Co"]
+    assert (report.read, report.imported, report.skipped) == (5, 2, 3)
+    assert [line for line, _ in report.errors] == [2, 3, 5]
+    assert "missing field(s): company_url, practice_area, buyer_persona" in report.errors[1][1]
+
+
+@pytest.mark.parametrize(
+    ("record", "message"),
+    [
+        ({"company_name": " ", "company_url": "", "practice_area": "", "buyer_persona": ""}, "company_name is empty"),
+        ({"company_name": "A", "company_url": 1, "practice_area": "", "buyer_persona": ""}, "must be a string"),
+    ],
+)
+def test_validate_preset_record(record, message):
+    with pytest.raises(ValueError, match=message):
+        validate_preset_record(record)
+
+
+def test_cli_import_then_export(tmp_path):
+    source = tmp_path / "in.jsonl"
+    write_presets_jsonl(PRESETS, source)
+    db = str(tmp_path / "presets.db")
+    assert main(["import", str(source), "--db", db]) == 0
+    with PresetStore(db) as store:
+        assert store.count() == 3
+    exported = tmp_path / "out.jsonl.gz"
+    assert main(["export", str(exported), "--db", db]) == 0
+    assert list(iter_presets_jsonl(exported)) == PRESETS
@@ -0,0 +1,78 @@
+import json
+import sqlite3
+
+from components.preset_store import PresetStore
+from components.presets import ProspectPreset
+
+
+def _preset(name: str = "ABC Corporation", **fields) -> ProspectPreset:
+    values = dict(company_url="https://abc.example", practice_area="M&A (Buyer)", buyer_persona="General Counsel")
+    values.update(fields)
+    return ProspectPreset(company_name=name, **values)
+
+
+def test_upsert_and_get_round_trip_every_field(tmp_path):
+    preset = _preset(
+        industry="Financial Services",
+        notes="Expanding into EMEA",
+        legal_entity_type="Private Company",
+        revenue_size="$10M - $50M",
+        geographic_scope="North America, Europe",
+        product_interest="Lexis+ AI",
+    )
+    with PresetStore(tmp_path / "presets.db") as store:
+        store.upsert(preset)
+        assert store.get("abc corporation") == preset
+
+
+def test_upsert_replaces_by_company_name(tmp_path):
+    with PresetStore(tmp_path / "presets.db") as store:
+        store.upsert(_preset(notes="first"))
+        store.upsert(_preset("abc CORPORATION", notes="second"))
+        assert store.count() == 1
+        assert store.get("ABC Corporation").notes == "second"
+
+
+def test_search_by_prefix_and_notes(tmp_path):
+    with PresetStore(tmp_path / "presets.db") as store:
+        store.upsert_many([_preset("Acme Ltd", notes="cross-border merger"), _preset("Beta plc", notes="litigation")])
+        assert [p.company_name for p in store.search_companies("ac")] == ["Acme Ltd"]
+        assert [p.company_name for p in store.search_notes("merg")] == ["Acme Ltd"]
+        assert store.search_companies("%") == []
+
+
+def test_list_presets_pages_by_company_name(tmp_path):
+    with PresetStore(tmp_path / "presets.db") as store:
+        store.upsert_many(_preset(f"Company {i:02d}") for i in range(5))
+        first = store.list_presets(limit=2)
+        second = store.list_presets(limit=2, after=first[-1].company_name)
+        assert [p.company_name for p in first + second] == [f"Company {i:02d}" for i in range(4)]
+
+
+def test_older_library_gets_the_new_columns(tmp_path):
+    path = tmp_path / "presets.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE presets (id INTEGER PRIMARY KEY, company_name TEXT NOT NULL COLLATE NOCASE UNIQUE, "
+            "company_url TEXT NOT NULL DEFAULT '', practice_area TEXT NOT NULL DEFAULT '', "
+            "buyer_persona TEXT NOT NULL DEFAULT '', industry TEXT NOT NULL DEFAULT '', "
+            "notes TEXT NOT NULL DEFAULT '', version TEXT NOT NULL DEFAULT '1.0', tool TEXT NOT NULL DEFAULT '', "
+            "updated_at TEXT NOT NULL DEFAULT (datetime('now')))"
+        )
+        conn.execute("INSERT INTO presets (company_name, practice_area) VALUES ('Old Co', 'Litigation')")
+    conn.close()
+    with PresetStore(path) as store:
+        old = store.get("Old Co")
+        assert old.practice_area == "Litigation" and old.revenue_size == ""
+        store.upsert(_preset("New Co", revenue_size="< $10M"))
+        assert store.get("New Co").revenue_size == "< $10M"
+
+
+def test_from_json_ignores_unknown_fields():
+    data = {**_preset().__dict__, "unknown": "x", "revenue_size": "< $10M"}
+    assert ProspectPreset.from_json(data) == _preset(revenue_size="< $10M")
+
+
+def test_json_bytes_round_trip():
+    preset = _preset(notes="Café", geographic_scope="Europe, Asia-Pacific")
+    assert ProspectPreset.from_json(json.loads(preset.to_json_bytes())) == preset
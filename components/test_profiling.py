@@ -0,0 +1,75 @@
+import threading
+import tracemalloc
+
+import pytest
+
+from components.profiling import RerunProfiler
+
+
+def _work():
+    return [str(i) * 10 for i in range(20000)]
+
+
+def test_profile_has_functions_and_allocations(tmp_path):
+    with RerunProfiler(output_dir=tmp_path) as profiler:
+        kept = _work()
+    profile = profiler.profile
+    assert any("_work" in stat.function for stat in profile.functions)
+    assert profile.allocated_bytes > 0 and profile.allocations
+    assert profile.pstats_path.exists()
+    assert len(kept) == 20000
+
+
+def test_memory_tracing_stops_after_the_profiled_rerun():
+    assert not tracemalloc.is_tracing()
+    with RerunProfiler(output_dir=None):
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+
+def test_concurrent_profilers_profile_one_rerun_at_a_time():
+    inside, done = threading.Event(), threading.Event()
+    first = RerunProfiler(output_dir=None)
+
+    def session():
+        with first:
+            inside.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=session)
+    thread.start()
+    assert inside.wait(5)
+    try:
+        second = RerunProfiler(output_dir=None)
+        with second:
+            _work()
+        assert tracemalloc.is_tracing()  # still on for the first session
+    finally:
+        done.set()
+        thread.join()
+    assert second.skipped and second.profile is None
+    assert not first.skipped and first.profile is not None
+    assert not tracemalloc.is_tracing()
+
+    with RerunProfiler(output_dir=None) as third:  # the next rerun is profiled again
+        pass
+    assert third.profile is not None
+
+
+def test_tracing_started_elsewhere_is_left_running():
+    tracemalloc.start()
+    try:
+        with RerunProfiler(output_dir=None):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_profile_is_built_when_the_block_raises():
+    profiler = RerunProfiler(output_dir=None)
+    with pytest.raises(RuntimeError):
+        with profiler:
+            raise RuntimeError("st.rerun")
+    assert profiler.profile is not None and profiler.profile.pstats_path is None
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,108 @@
+import pickle
+
+import pytest
+
+from components.recipes import (
+    PHASE_REGISTRY,
+    PromptRecipeManager,
+    PromptTemplate,
+    ProspectBatch,
+    ProspectContext,
+    _render_header,
+)
+
+CONTEXT = ProspectContext(
+    company_name="ACME Holdings",
+    industry_sector="Technology/Software",
+    deal_context="Cross-border acquisition.",
+)
+
+
+def test_registry_is_in_workflow_order():
+    assert list(PHASE_REGISTRY) == list(PromptRecipeManager.get_phase_names())
+
+
+def test_render_builds_one_phase():
+    prompt = PromptRecipeManager.render("phase25", CONTEXT)
+    assert prompt.startswith(CONTEXT.to_prompt_header())
+    assert "**Phase 2.5: Pain Point Hypothesis & Solution Mapping**" in prompt
+    with pytest.raises(KeyError):
+        PromptRecipeManager.render("phase99", CONTEXT)
+
+
+def test_iter_workflow_matches_the_full_workflow():
+    phases = PromptRecipeManager.iter_workflow(CONTEXT)
+    assert next(phases) == ("phase1", PromptRecipeManager.render("phase1", CONTEXT))
+    workflow = PromptRecipeManager.generate_full_workflow(CONTEXT)
+    assert dict([("phase1", workflow["phase1"]), *phases]) == workflow
+    assert all(workflow[phase_id] == PromptRecipeManager.render(phase_id, CONTEXT) for phase_id in workflow)
+
+
+def test_get_individual_prompt():
+    assert PromptRecipeManager.get_individual_prompt("phase6", CONTEXT) == PromptRecipeManager.render("phase6", CONTEXT)
+    assert PromptRecipeManager.get_individual_prompt("phase99", CONTEXT) == ""
+
+
+def test_template_render_and_splice():
+    template = PromptTemplate("{header}Body {{literal}} text")
+    assert template.slots == ("header",)
+    assert template.splice("H\n") == "H\nBody {literal} text"
+    assert template.render(header="H\n") == template.splice("H\n")
+
+
+def test_template_with_several_slots():
+    template = PromptTemplate("Dear {name}, about {topic}. Regards, {name}")
+    assert template.slots == ("name", "topic")
+    assert template.render(name="Ann", topic="fees") == "Dear Ann, about fees. Regards, Ann"
+    with pytest.raises(ValueError):
+        template.splice("Ann")
+
+
+def test_header_is_cached_per_field_values():
+    _render_header.cache_clear()
+    header = CONTEXT.to_prompt_header()
+    same = ProspectContext(
+        company_name="ACME Holdings",
+        industry_sector="Technology/Software",
+        deal_context="Cross-border acquisition.",
+    )
+    assert same.to_prompt_header() is header
+    assert _render_header.cache_info().hits == 1
+    assert ProspectContext().to_prompt_header() == "**General Sales Prospecting Context**\n\n---\n\n"
+
+
+def test_context_is_immutable_and_hashable():
+    with pytest.raises(AttributeError):
+        CONTEXT.company_name = "Other"
+    with pytest.raises(AttributeError):
+        del CONTEXT.deal_context
+    copy = ProspectContext.from_dict(CONTEXT.to_dict())
+    assert copy == CONTEXT and hash(copy) == hash(CONTEXT)
+    assert {CONTEXT: 1}[copy] == 1
+    changed = CONTEXT.replace(company_name="Other")
+    assert changed.company_name == "Other" and CONTEXT.company_name == "ACME Holdings"
+    assert pickle.loads(pickle.dumps(CONTEXT)) == CONTEXT
+
+
+def test_categorical_values_share_one_string():
+    value = "".join(["Technology/", "Software"])
+    assert ProspectContext(industry_sector=value).industry_sector is CONTEXT.industry_sector
+
+
+def test_batch_round_trips_contexts():
+    contexts = [
+        CONTEXT,
+        ProspectContext(company_name="Northwind LLP", industry_sector="Healthcare/Life Sciences"),
+        CONTEXT.replace(company_name="ACME Two", additional_notes="Follow up in May."),
+    ]
+    batch = ProspectBatch(contexts)
+    assert len(batch) == 3
+    assert list(batch) == contexts
+    assert batch[-1] == contexts[-1]
+    assert batch.column("industry_sector") == [context.industry_sector for context in contexts]
+    assert batch.column("company_name") == [context.company_name for context in contexts]
+
+
+def test_batch_from_records():
+    batch = ProspectBatch.from_records([{"company_name": "ACME Holdings", "industry_sector": None}])
+    assert list(batch) == [ProspectContext(company_name="ACME Holdings")]
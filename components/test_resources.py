@@ -0,0 +1,21 @@
+from components.language_packs import available_locales, clear_language_packs, get_language_pack
+from components.recipes import PHASE_REGISTRY
+from components.resources import WarmUp, warm_up
+from components.tokens import _body_tokens
+
+
+def test_warm_up_builds_every_shared_engine():
+    clear_language_packs()
+    _body_tokens.cache_clear()
+    report = warm_up()
+    assert list(report.steps) == ["language packs", "prompt templates", "token estimates", "writing checker"]
+    assert report.total_ms == sum(report.steps.values())
+    assert get_language_pack.cache_info().currsize == len(available_locales())
+    assert _body_tokens.cache_info().currsize == len(PHASE_REGISTRY) * len(available_locales())
+
+
+def test_warm_up_in_a_thread():
+    warm = WarmUp(["en"])
+    report = warm.wait(timeout=30)
+    assert report is not None and warm.report is report
+    assert report.steps["language packs"] >= 0
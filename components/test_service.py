@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import pytest
+
+from components.recipes import PromptRecipeManager, ProspectContext
+from components.service import HTTPError, PromptService
+
+
+async def _exchange(service: PromptService, request: bytes) -> tuple[int, dict]:
+    server = await service.start("127.0.0.1", 0)
+    try:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        status = int(head.split()[1])
+        length = next(
+            int(line.split(b":")[1]) for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")
+        )
+        body = json.loads(await reader.readexactly(length))
+        writer.close()
+        await writer.wait_closed()
+        return status, body
+    finally:
+        await service.close()
+
+
+def _request(body: bytes, length: int | None = None, path: str = "/v1/workflow") -> bytes:
+    length = len(body) if length is None else length
+    return f"POST {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\n\r\n".encode() + body
+
+
+def test_negative_content_length_is_a_bad_request():
+    status, body = asyncio.run(_exchange(PromptService(workers=0), _request(b"", -5)))
+    assert status == 400
+    assert body == {"error": "invalid Content-Length"}
+
+
+def test_workflow_over_http():
+    payload = json.dumps({"company_name": "ABC Corporation"}).encode()
+    status, body = asyncio.run(_exchange(PromptService(workers=0), _request(payload)))
+    assert status == 200
+    expected = PromptRecipeManager.generate_full_workflow(ProspectContext(company_name="ABC Corporation"))
+    assert body == {"company_name": "ABC Corporation", "locale": "en", "prompts": expected}
+
+
+def test_dispatch_batches_in_order():
+    service = PromptService(workers=0)
+    body = json.dumps([{"text": "We will utilize it."}, {"text": "Plain words."}]).encode()
+    results = asyncio.run(service.dispatch("POST", "/v1/check", body))
+    assert len(results) == 2
+    assert results[0]["zombie_words"] and not results[1]["zombie_words"]
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "status"),
+    [("GET", "/nope", 404), ("GET", "/v1/workflow", 405), ("POST", "/v1/phases/phase99", 404)],
+)
+def test_dispatch_errors(method, path, status):
+    with pytest.raises(HTTPError) as error:
+        asyncio.run(PromptService(workers=0).dispatch(method, path, b"{}"))
+    assert error.value.status == status
@@ -0,0 +1,45 @@
+from components.recipes import ProspectContext
+from components.session_store import SessionOutputStore
+
+ACME = ProspectContext(company_name="ACME Holdings")
+NORTHWIND = ProspectContext(company_name="Northwind LLP")
+
+
+def test_outputs_are_kept_per_prospect_and_locale():
+    store = SessionOutputStore()
+    store.put("phase1", ACME, "acme prompt")
+    store.put("phase1", NORTHWIND, "northwind prompt")
+    store.put("phase1", ACME, "acme prompt (de)", locale="de")
+    assert store.get("phase1", ACME).value == "acme prompt"
+    assert not store.get("phase1", ACME).stale
+    assert store.get("phase1", ACME, locale="de").value == "acme prompt (de)"
+    assert store.get("phase2", ACME) is None
+
+
+def test_newest_output_is_returned_stale_after_the_sidebar_changes():
+    store = SessionOutputStore()
+    store.put("workflow", ACME, {"phase1": "acme prompt"})
+    output = store.get("workflow", ACME.replace(deal_context="New deal"))
+    assert output.stale
+    assert output.value == {"phase1": "acme prompt"}
+    assert output.context == ACME
+
+
+def test_size_cap_evicts_the_least_recently_used_output():
+    store = SessionOutputStore(max_entries=2)
+    store.put("phase1", ACME, "a")
+    store.put("phase2", ACME, "b")
+    store.get("phase1", ACME)
+    store.put("phase3", ACME, "c")
+    assert len(store) == 2
+    assert store.get("phase2", ACME) is None
+    assert store.get("phase1", ACME).value == "a"
+
+
+def test_clear():
+    store = SessionOutputStore()
+    store.put("phase1", ACME, "x" * 1000)
+    assert store.bytes > 1000
+    store.clear()
+    assert (len(store), store.bytes) == (0, 0)
+    assert store.get("phase1", NORTHWIND) is None
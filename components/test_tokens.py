@@ -0,0 +1,67 @@
+from components.recipes import PromptRecipeManager, ProspectContext
+from components.tokens import (
+    TRIM_ORDER,
+    estimate_tokens,
+    field_tokens,
+    fit_prompt,
+    fit_workflow,
+    shorten_to_tokens,
+)
+
+LONG_FIELD = " ".join(f"Sentence number {i} talks about the matter." for i in range(400))
+SHORT_SENTENCES = " ".join("Ok." for _ in range(400))
+
+
+def _context(text: str = LONG_FIELD) -> ProspectContext:
+    return ProspectContext(
+        company_name="ACME Holdings",
+        additional_notes=text,
+        deal_context=text,
+        company_products=text,
+    )
+
+
+def test_field_tokens_match_the_whole_field_estimate():
+    for text in (LONG_FIELD, SHORT_SENTENCES):
+        assert abs(field_tokens(text) - estimate_tokens(text)) <= 1
+
+
+def test_shorten_to_tokens_keeps_leading_sentences():
+    shortened = shorten_to_tokens(LONG_FIELD, 100)
+    assert shortened.startswith("Sentence number 0 ")
+    assert shortened.endswith(" […]")
+    assert estimate_tokens(shortened) <= 100
+    assert shorten_to_tokens("Short.", 100) == "Short."
+
+
+def test_fit_prompt_without_budget_is_unchanged():
+    context = _context()
+    fitted = fit_prompt("phase1", context, 0)
+    assert fitted.prompt == PromptRecipeManager.render("phase1", context)
+    assert fitted.trimmed == ()
+    assert fitted.fits
+
+
+def test_fit_prompt_converges_with_long_fields():
+    for text in (LONG_FIELD, SHORT_SENTENCES):
+        for budget in (1200, 1500, 2500):
+            fitted = fit_prompt("phase1", _context(text), budget)
+            if not fitted.trimmed:
+                assert fitted.tokens <= budget
+                continue
+            assert fitted.fits, (budget, fitted.tokens)
+            assert fitted.tokens == estimate_tokens(fitted.prompt)
+            # Only trimmed as much as needed: the budget is nearly used up
+            assert fitted.tokens > budget * 0.95
+
+
+def test_fit_prompt_reports_not_fitting_only_with_every_field_empty():
+    fitted = fit_prompt("phase1", _context(), 50)
+    assert not fitted.fits
+    assert all(not getattr(fitted.context, name) for name in TRIM_ORDER)
+
+
+def test_fit_workflow_fits_every_phase():
+    fitted = fit_workflow(_context(), 3000)
+    assert list(fitted) == list(PromptRecipeManager.generate_full_workflow(_context()))
+    assert all(prompt.fits for prompt in fitted.values())
@@ -0,0 +1,116 @@
+import io
+import re
+
+from components.writing_checker import (
+    ZOMBIE_WORDS,
+    IncrementalAnalyzer,
+    JargonMatcher,
+    check_plain_english,
+    check_plain_english_many,
+    iter_writing_issues,
+)
+
+DRAFT = (
+    "We will utilize our platform going forward. The contract was reviewed by counsel. "
+    "Would a call on Tuesday work? Let's leverage the synergies."
+)
+
+
+def _legacy_find(text: str, terms) -> list[str]:
+    """The per-term regex loop that JargonMatcher replaced."""
+    return [term for term in terms if re.search(r"\b" + re.escape(term) + r"\b", text.lower(), re.IGNORECASE)]
+
+
+def test_matcher_finds_the_same_terms_as_the_per_term_loop():
+    text = (
+        "We will utilize the framework to facilitate the implementation. "
+        "Going forward, the stakeholders want visibility and a deliverable in order to leverage synergies."
+    )
+    matcher = JargonMatcher(ZOMBIE_WORDS)
+    assert matcher.find_terms(text) == _legacy_find(text, ZOMBIE_WORDS)
+
+
+def test_matcher_prefers_the_longest_term_and_respects_word_boundaries():
+    matcher = JargonMatcher({"in order": "to", "in order to": "to", "leverage": "use"})
+    assert [term for term, _, _ in matcher.finditer("In order to leverage it, not leverages.")] == [
+        "in order to",
+        "leverage",
+    ]
+
+
+def test_matcher_offsets_survive_case_folding_that_changes_length():
+    text = "İİ utilize"  # "İ".lower() is two characters
+    [(term, start, end)] = JargonMatcher({"utilize": "use"}).finditer(text)
+    assert (term, text[start:end]) == ("utilize", "utilize")
+
+
+def test_full_pass_reports_every_occurrence():
+    matcher = JargonMatcher({"utilize": "use"})
+    text = "Utilize this. " * 3
+    assert [start for _, start, _ in matcher.finditer(text)] == [0, 14, 28]
+    assert matcher.find_terms(text) == ["utilize"]
+
+
+def test_incremental_analyzer_matches_a_full_check():
+    analyzer = IncrementalAnalyzer()
+    assert analyzer.analyze(DRAFT) == check_plain_english(DRAFT)
+    assert analyzer.last_checked == 4
+
+
+def test_incremental_analyzer_only_rechecks_edited_sentences():
+    analyzer = IncrementalAnalyzer()
+    analyzer.analyze(DRAFT)
+    edited = DRAFT.replace("Tuesday", "Monday")
+    assert analyzer.analyze(edited) == check_plain_english(edited)
+    assert analyzer.last_checked == 1
+    analyzer.reset()
+    analyzer.analyze(edited)
+    assert analyzer.last_checked == 4
+
+
+def test_incremental_analyzer_with_terms_spanning_sentences():
+    matcher = JargonMatcher({"e.g.": "for example", "utilize": "use"})
+    text = "Use plain words, e.g. this one. Then utilize it."
+    assert IncrementalAnalyzer(matcher).analyze(text) == check_plain_english(text, matcher)
+
+
+def test_check_plain_english_many_matches_single_checks():
+    texts = [DRAFT, "", "Plain words only.", "We utilize it. We utilize it again."] * 5
+    expected = [check_plain_english(text) for text in texts]
+    for workers in (1, 2):
+        report = check_plain_english_many(iter(texts), workers=workers, chunk_size=3)
+        assert list(report.scores) == [analysis.score for analysis in expected]
+        assert list(report.zombie_counts) == [len(analysis.zombie_words) for analysis in expected]
+        assert list(report.passive_counts) == [len(analysis.passive_voice) for analysis in expected]
+    assert report.most_common_jargon(1) == [("utilize", 10)]
+    assert sum(report.score_distribution.values()) == len(texts)
+
+
+def test_check_plain_english_many_with_a_custom_matcher():
+    matcher = JargonMatcher({"tuesday": "a day"})
+    report = check_plain_english_many([DRAFT], workers=2, matcher=matcher)
+    assert dict(report.jargon_counts) == {"tuesday": 1}
+
+
+def test_issues_carry_offsets_into_the_text():
+    analysis = check_plain_english(DRAFT)
+    for issue in analysis.zombie_words:
+        assert DRAFT[issue.start:issue.end].lower() == issue.text
+    [passive] = analysis.passive_voice
+    assert DRAFT[passive.start:passive.end] == "The contract was reviewed by counsel"
+
+
+def test_iter_writing_issues_streams_in_order_across_chunks():
+    text = DRAFT * 20
+    issues = list(iter_writing_issues(io.StringIO(text), chunk_size=37))
+    assert issues == list(iter_writing_issues(text, chunk_size=len(text)))
+    assert [issue.start for issue in issues] == sorted(issue.start for issue in issues)
+    zombie = [issue for issue in issues if issue.category == "zombie_word"]
+    assert len(zombie) == 20 * len(check_plain_english(DRAFT).zombie_words)
+    assert all(text[issue.start:issue.end].lower() == issue.text for issue in zombie)
+
+
+def test_iter_writing_issues_splits_overlong_sentences():
+    text = "utilize " * 1000
+    issues = list(iter_writing_issues(text, chunk_size=100, max_sentence_chars=200))
+    assert [issue.start for issue in issues] == list(range(0, len(text), 8))
@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Iterator
+from array import array
+from collections import Counter
+from dataclasses import asdict, dataclass, field, replace
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator, Mapping
+
+from .metrics import timed
 
 
 @dataclass
@@ -12,6 +17,8 @@ class WritingIssue:
     text: str
     suggestion: str
     category: str  # 'zombie_word' or 'passive_voice'
+    start: int | None = None  # character offset of the issue in the checked text
+    end: int | None = None
 
 
 @dataclass
@@ -36,6 +43,15 @@ class WritingAnalysis:
         elif self.score >= 70:
             return "C - Fair", "🟠"
         return "D - Needs Work", "🔴"
+    
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready form with the score, grade label and every issue."""
+        return {
+            "score": self.score,
+            "grade": self.grade_info[0],
+            "zombie_words": [asdict(issue) for issue in self.zombie_words],
+            "passive_voice": [asdict(issue) for issue in self.passive_voice],
+        }
 
 
 # Zombie nouns mapping - extracted for clarity
@@ -88,6 +104,101 @@ PASSIVE_PATTERNS = [
     re.compile(r'\b(will|shall)\s+be\s+\w+ed\b', re.IGNORECASE),
 ]
 
+
+class JargonMatcher:
+    """
+    Finds every term of a jargon dictionary in a single pass over the text.
+    
+    The terms are folded into a trie and compiled into one regex, so the work
+    per character depends on the trie's branching, not on how many terms
+    the dictionary holds. Matches are case-insensitive, respect word
+    boundaries, and prefer the longest term at each position.
+    """
+    
+    def __init__(self, terms: Mapping[str, str]):
+        self.suggestions: dict[str, str] = {}
+        self._canonical: dict[str, str] = {}
+        self._rank: dict[str, int] = {}
+        for term, suggestion in terms.items():
+            key = term.lower()
+            if not key or key in self._canonical:
+                continue
+            self._canonical[key] = term
+            self._rank[term] = len(self._rank)
+            self.suggestions[term] = suggestion
+        
+        trie: dict = {}
+        for key in self._canonical:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        body = _trie_to_regex(trie) if trie else r"(?!)"
+        # Scanning lowercased text without IGNORECASE is roughly twice as fast;
+        # the case-insensitive variant is only needed when lowercasing would
+        # change the text length (and therefore the match offsets).
+        self.pattern = re.compile(r"(?<!\w)" + body + r"(?!\w)")
+        self._pattern_ci: re.Pattern[str] | None = None
+    
+    def __len__(self) -> int:
+        return len(self._rank)
+    
+    def finditer(self, text: str, pos: int = 0, endpos: int | None = None) -> Iterator[tuple[str, int, int]]:
+        """Yield (term, start, end) for every occurrence, left to right."""
+        if endpos is None:
+            endpos = len(text)
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            pattern = self.pattern
+        else:
+            if self._pattern_ci is None:
+                self._pattern_ci = re.compile(self.pattern.pattern, re.IGNORECASE)
+            pattern = self._pattern_ci
+            lowered = text
+        canonical = self._canonical
+        for match in pattern.finditer(lowered, pos, endpos):
+            term = canonical.get(match.group().lower())
+            if term is not None:
+                yield term, match.start(), match.end()
+    
+    def first_occurrences(self, text: str) -> dict[str, tuple[int, int]]:
+        """Map each term present in ``text`` to the (start, end) of its first occurrence."""
+        first: dict[str, tuple[int, int]] = {}
+        total = len(self._rank)
+        for term, start, end in self.finditer(text):
+            if term not in first:
+                first[term] = (start, end)
+                if len(first) == total:
+                    break
+        return first
+    
+    def find_terms(self, text: str) -> list[str]:
+        """Return the distinct terms present in ``text``, in dictionary order."""
+        return sorted(self.first_occurrences(text), key=self._rank.__getitem__)
+    
+    def rank(self, term: str) -> int:
+        """Position of ``term`` in the dictionary, used for stable ordering."""
+        return self._rank[term]
+
+
+def _trie_to_regex(node: dict) -> str:
+    """Render a character trie as a regex that prefers the longest path."""
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in node.items()
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if "" in node else group
+
+
+ZOMBIE_MATCHER = JargonMatcher(ZOMBIE_WORDS)
+
+
 # Scoring constants
 ZOMBIE_WORD_PENALTY = 5
 PASSIVE_VOICE_PENALTY = 3
@@ -95,43 +206,84 @@ MAX_SCORE = 100
 MIN_SCORE = 0
 
 
-def _find_zombie_words(text: str) -> Iterator[WritingIssue]:
-    """Find zombie words and jargon in text."""
-    text_lower = text.lower()
-    
-    for zombie, replacement in ZOMBIE_WORDS.items():
-        pattern = re.compile(r'\b' + re.escape(zombie) + r'\b', re.IGNORECASE)
-        if pattern.search(text_lower):
-            yield WritingIssue(
-                text=zombie,
-                suggestion=replacement,
-                category='zombie_word'
+def _find_zombie_words(text: str, matcher: JargonMatcher = ZOMBIE_MATCHER) -> Iterator[WritingIssue]:
+    """Find zombie words and jargon in text (first occurrence of each term)."""
+    first = matcher.first_occurrences(text)
+    for term in sorted(first, key=matcher.rank):
+        start, end = first[term]
+        yield WritingIssue(
+            text=term,
+            suggestion=matcher.suggestions[term],
+            category='zombie_word',
+            start=start,
+            end=end
+        )
+
+
+# Sentences are the runs of text between terminal punctuation
+SENTENCE_PATTERN = re.compile(r'[^.!?]+')
+
+
+def _iter_sentences(text: str) -> Iterator[tuple[str, int, int]]:
+    """Yield (sentence, start, end) for each non-blank sentence, stripped."""
+    for match in SENTENCE_PATTERN.finditer(text):
+        raw = match.group()
+        sentence = raw.strip()
+        if sentence:
+            start = match.start() + len(raw) - len(raw.lstrip())
+            yield sentence, start, start + len(sentence)
+
+
+def _check_passive_sentence(sentence: str, start: int | None = None) -> WritingIssue | None:
+    """Return a passive voice issue for one sentence starting at ``start``, or None."""
+    for pattern in PASSIVE_PATTERNS:
+        match = pattern.search(sentence)
+        if match:
+            passive_phrase = match.group(0)
+            return WritingIssue(
+                text=sentence,
+                suggestion=f"Passive voice detected: '{passive_phrase}'. Try active voice instead.",
+                category='passive_voice',
+                start=start,
+                end=None if start is None else start + len(sentence)
             )
+    return None
 
 
 def _find_passive_voice(text: str) -> Iterator[WritingIssue]:
-    """Find passive voice constructions in text."""
-    sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-    
-    for sentence in sentences:
-        for pattern in PASSIVE_PATTERNS:
-            match = pattern.search(sentence)
-            if match:
-                passive_phrase = match.group(0)
-                yield WritingIssue(
-                    text=sentence,
-                    suggestion=f"Passive voice detected: '{passive_phrase}'. Try active voice instead.",
-                    category='passive_voice'
-                )
-                break  # Only report once per sentence
-
-
-def check_plain_english(text: str) -> WritingAnalysis:
+    """Find passive voice constructions in text (at most one per sentence)."""
+    for sentence, start, _ in _iter_sentences(text):
+        issue = _check_passive_sentence(sentence, start)
+        if issue is not None:
+            yield issue
+
+
+@timed("writing_check_pass_seconds", "Plain English check passes over a whole text", check="jargon")
+def _jargon_pass(text: str, matcher: JargonMatcher) -> list[WritingIssue]:
+    return list(_find_zombie_words(text, matcher))
+
+
+@timed("writing_check_pass_seconds", check="passive_voice")
+def _passive_pass(text: str) -> list[WritingIssue]:
+    return list(_find_passive_voice(text))
+
+
+def _calculate_score(zombie_count: int, passive_count: int) -> int:
+    """Apply the per-issue penalties to the maximum score."""
+    score = MAX_SCORE
+    score -= zombie_count * ZOMBIE_WORD_PENALTY
+    score -= passive_count * PASSIVE_VOICE_PENALTY
+    return max(MIN_SCORE, score)
+
+
+@timed("writing_check_seconds", "Plain English checks of a whole text")
+def check_plain_english(text: str, matcher: JargonMatcher | None = None) -> WritingAnalysis:
     """
     Analyze text for zombie nouns, jargon, and passive voice.
     
     Args:
         text: The text to analyze
+        matcher: Jargon dictionary to check against (defaults to ZOMBIE_WORDS)
         
     Returns:
         WritingAnalysis object with findings and score
@@ -143,14 +295,10 @@ def check_plain_english(text: str) -> WritingAnalysis:
             score=MAX_SCORE
         )
     
-    zombie_words = list(_find_zombie_words(text))
-    passive_voice = list(_find_passive_voice(text))
+    zombie_words = _jargon_pass(text, matcher or ZOMBIE_MATCHER)
+    passive_voice = _passive_pass(text)
     
-    # Calculate score
-    score = MAX_SCORE
-    score -= len(zombie_words) * ZOMBIE_WORD_PENALTY
-    score -= len(passive_voice) * PASSIVE_VOICE_PENALTY
-    score = max(MIN_SCORE, score)
+    score = _calculate_score(len(zombie_words), len(passive_voice))
     
     return WritingAnalysis(
         zombie_words=zombie_words,
@@ -159,6 +307,279 @@ def check_plain_english(text: str) -> WritingAnalysis:
     )
 
 
+class IncrementalAnalyzer:
+    """
+    Plain English checker for a draft that is edited and re-checked repeatedly.
+    
+    Results are kept per sentence, keyed by the sentence text. Each call to
+    analyze() only runs the jargon and passive voice checks on sentences it
+    has not seen in the previous version, then rebuilds the WritingAnalysis
+    from the cached pieces. The result matches check_plain_english().
+    """
+    
+    def __init__(self, matcher: JargonMatcher | None = None):
+        self.matcher = matcher or ZOMBIE_MATCHER
+        # Terms containing sentence punctuation (e.g. "e.g.") can span the
+        # sentence split, so those dictionaries are matched on the full text.
+        self._sentence_local = not any(
+            char in term for term in self.matcher.suggestions for char in ".!?"
+        )
+        # sentence -> (first jargon spans relative to the sentence, passive issue)
+        self._sentences: dict[str, tuple[dict[str, tuple[int, int]], WritingIssue | None]] = {}
+        self.last_checked = 0  # sentences re-checked by the latest analyze()
+    
+    def analyze(self, text: str) -> WritingAnalysis:
+        """Analyze ``text``, re-checking only sentences that changed."""
+        text = text or ""
+        previous = self._sentences
+        current: dict[str, tuple[dict[str, tuple[int, int]], WritingIssue | None]] = {}
+        first: dict[str, tuple[int, int]] = {}
+        passive_voice: list[WritingIssue] = []
+        checked = 0
+        
+        for sentence, start, end in _iter_sentences(text):
+            result = current.get(sentence) or previous.get(sentence)
+            if result is None:
+                spans = self.matcher.first_occurrences(sentence) if self._sentence_local else {}
+                result = (spans, _check_passive_sentence(sentence, 0))
+                checked += 1
+            current[sentence] = result
+            for term, (term_start, term_end) in result[0].items():
+                if term not in first:
+                    first[term] = (start + term_start, start + term_end)
+            if result[1] is not None:
+                passive_voice.append(replace(result[1], start=start, end=end))
+        
+        # Drop sentences that are no longer in the draft
+        self._sentences = current
+        self.last_checked = checked
+        
+        if not self._sentence_local:
+            first = self.matcher.first_occurrences(text)
+        zombie_words = [
+            WritingIssue(
+                text=term,
+                suggestion=self.matcher.suggestions[term],
+                category='zombie_word',
+                start=first[term][0],
+                end=first[term][1]
+            )
+            for term in sorted(first, key=self.matcher.rank)
+        ]
+        return WritingAnalysis(
+            zombie_words=zombie_words,
+            passive_voice=passive_voice,
+            score=_calculate_score(len(zombie_words), len(passive_voice))
+        )
+    
+    def reset(self) -> None:
+        """Forget all cached sentence results."""
+        self._sentences = {}
+
+
+def _last_sentence_boundary(buffer: str) -> int:
+    """
+    Offset just past the last complete sentence terminator in ``buffer``, or 0.
+    
+    A terminator run touching the end of the buffer may continue in the next
+    chunk, so it does not count as complete.
+    """
+    i = len(buffer)
+    while i and buffer[i - 1] in ".!?":
+        i -= 1
+    return max(buffer.rfind(".", 0, i), buffer.rfind("!", 0, i), buffer.rfind("?", 0, i)) + 1
+
+
+def _scan_region(region: str, base: int, matcher: JargonMatcher) -> list[WritingIssue]:
+    """All issues in a run of complete sentences, ordered by offset."""
+    issues = [
+        WritingIssue(
+            text=term,
+            suggestion=matcher.suggestions[term],
+            category='zombie_word',
+            start=base + start,
+            end=base + end
+        )
+        for term, start, end in matcher.finditer(region)
+    ]
+    for sentence, start, _ in _iter_sentences(region):
+        issue = _check_passive_sentence(sentence, base + start)
+        if issue is not None:
+            issues.append(issue)
+    issues.sort(key=lambda issue: issue.start)
+    return issues
+
+
+def iter_writing_issues(
+    source: str | IO[str],
+    matcher: JargonMatcher | None = None,
+    chunk_size: int = 64 * 1024,
+    max_sentence_chars: int = 64 * 1024,
+) -> Iterator[WritingIssue]:
+    """
+    Stream issues from a string or text file without loading it all at once.
+    
+    Unlike check_plain_english, every jargon occurrence is reported. Issues
+    carry start/end offsets into the whole input and are yielded in order as
+    each run of complete sentences is read; text after the last terminator
+    is carried over to the next chunk. Memory stays bounded by chunk_size
+    plus max_sentence_chars: a "sentence" longer than that is split at the
+    last whitespace, which may split a passive construction in two.
+    
+    Args:
+        source: Text, or a file-like object opened in text mode
+        matcher: Jargon dictionary (defaults to ZOMBIE_WORDS)
+        chunk_size: Characters read per step
+        max_sentence_chars: Longest carry-over kept while waiting for a terminator
+    """
+    matcher = matcher or ZOMBIE_MATCHER
+    if isinstance(source, str):
+        chunks: Iterable[str] = (
+            source[i:i + chunk_size] for i in range(0, len(source), chunk_size)
+        )
+    else:
+        chunks = iter(lambda: source.read(chunk_size), "")
+    
+    buffer = ""
+    base = 0  # offset of buffer[0] in the whole input
+    for chunk in chunks:
+        buffer += chunk
+        cut = _last_sentence_boundary(buffer)
+        if not cut and len(buffer) > max_sentence_chars:
+            cut = max(buffer.rfind(" ", 0, len(buffer) - 1), buffer.rfind("\n", 0, len(buffer) - 1)) + 1
+            cut = cut or len(buffer)
+        if cut:
+            yield from _scan_region(buffer[:cut], base, matcher)
+            base += cut
+            buffer = buffer[cut:]
+    if buffer:
+        yield from _scan_region(buffer, base, matcher)
+
+
+@dataclass
+class BatchWritingReport:
+    """Columnar results of checking many documents; row i is the i-th input text."""
+    scores: array = field(default_factory=lambda: array('B'))
+    zombie_counts: array = field(default_factory=lambda: array('I'))
+    passive_counts: array = field(default_factory=lambda: array('I'))
+    jargon_counts: Counter = field(default_factory=Counter)  # documents containing each term
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    @property
+    def mean_score(self) -> float:
+        """Average score across all documents."""
+        return sum(self.scores) / len(self.scores) if self.scores else float(MAX_SCORE)
+    
+    @property
+    def score_distribution(self) -> dict[str, int]:
+        """Number of documents per grade band, best first."""
+        bands = {"A": 0, "B": 0, "C": 0, "D": 0}
+        for score, count in Counter(self.scores).items():
+            if score >= 90:
+                bands["A"] += count
+            elif score >= 80:
+                bands["B"] += count
+            elif score >= 70:
+                bands["C"] += count
+            else:
+                bands["D"] += count
+        return bands
+    
+    def most_common_jargon(self, n: int = 10) -> list[tuple[str, int]]:
+        """The ``n`` terms found in the most documents."""
+        return self.jargon_counts.most_common(n)
+    
+    def extend(self, other: BatchWritingReport) -> None:
+        """Append another report's rows and merge its term counts."""
+        self.scores.extend(other.scores)
+        self.zombie_counts.extend(other.zombie_counts)
+        self.passive_counts.extend(other.passive_counts)
+        self.jargon_counts.update(other.jargon_counts)
+
+
+def _count_passive_voice(text: str) -> int:
+    """Number of sentences with a passive construction, without building issues."""
+    return sum(
+        1 for sentence, _, _ in _iter_sentences(text)
+        if any(pattern.search(sentence) for pattern in PASSIVE_PATTERNS)
+    )
+
+
+def _check_chunk(texts: list[str], matcher: JargonMatcher) -> BatchWritingReport:
+    report = BatchWritingReport()
+    for text in texts:
+        if not text or not text.strip():
+            terms: list[str] = []
+            passive_count = 0
+        else:
+            terms = matcher.find_terms(text)
+            passive_count = _count_passive_voice(text)
+        report.scores.append(_calculate_score(len(terms), passive_count))
+        report.zombie_counts.append(len(terms))
+        report.passive_counts.append(passive_count)
+        report.jargon_counts.update(terms)
+    return report
+
+
+# Each pool worker compiles its matcher once, in the initializer
+_worker_matcher: JargonMatcher = ZOMBIE_MATCHER
+
+
+def _init_worker(terms: Mapping[str, str] | None) -> None:
+    global _worker_matcher
+    _worker_matcher = JargonMatcher(terms) if terms is not None else ZOMBIE_MATCHER
+
+
+def _check_chunk_in_worker(texts: list[str]) -> BatchWritingReport:
+    return _check_chunk(texts, _worker_matcher)
+
+
+def _chunked(texts: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def check_plain_english_many(
+    texts: Iterable[str],
+    workers: int = 1,
+    matcher: JargonMatcher | None = None,
+    chunk_size: int = 256,
+) -> BatchWritingReport:
+    """
+    Score many documents and return columnar results plus aggregate stats.
+    
+    Args:
+        texts: Documents to check; any iterable, consumed in chunks
+        workers: Worker processes; 1 checks in the calling process
+        matcher: Jargon dictionary (defaults to ZOMBIE_WORDS); each worker
+            compiles it once
+        chunk_size: Documents sent to a worker at a time
+        
+    Returns:
+        BatchWritingReport whose row order matches ``texts``. Scores equal
+        check_plain_english(text).score for each document.
+    """
+    matcher = matcher or ZOMBIE_MATCHER
+    report = BatchWritingReport()
+    chunks = _chunked(texts, chunk_size)
+    
+    if workers <= 1:
+        for chunk in chunks:
+            report.extend(_check_chunk(chunk, matcher))
+        return report
+    
+    import multiprocessing  # only batch runs with workers need it
+    
+    terms = None if matcher is ZOMBIE_MATCHER else matcher.suggestions
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(terms,)) as pool:
+        for chunk_report in pool.imap(_check_chunk_in_worker, chunks):
+            report.extend(chunk_report)
+    return report
+
+
 def get_writing_tips() -> str:
     """Return markdown-formatted guide on writing better outreach emails."""
     return """
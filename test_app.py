@@ -0,0 +1,119 @@
+import tracemalloc
+from pathlib import Path
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from components.options import GEOGRAPHIC_OPTIONS, REVENUE_SIZE_OPTIONS, TRANSACTION_TYPE_OPTIONS
+
+APP_PATH = Path(__file__).with_name("app.py")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # A fresh preset library in an empty directory, and no background warm-up
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("APP_WARM_UP", "0")
+    st.cache_resource.clear()
+    app = AppTest.from_file(str(APP_PATH), default_timeout=60)
+    yield app.run()
+    st.cache_resource.clear()
+
+
+def _widget(app, kind: str, label: str):
+    return next(widget for widget in getattr(app, kind) if widget.label.startswith(label))
+
+
+def _button(app, label: str):
+    return _widget(app, "button", label)
+
+
+def test_preset_save_and_load_restores_the_sidebar(app):
+    _widget(app, "text_input", "Company Name").set_value("ABC Corporation").run()
+    _widget(app, "selectbox", "Transaction Type").set_value(TRANSACTION_TYPE_OPTIONS[1]).run()
+    _widget(app, "selectbox", "Company Size").set_value(REVENUE_SIZE_OPTIONS[2]).run()
+    _widget(app, "multiselect", "Geographic Scope").set_value(list(GEOGRAPHIC_OPTIONS[:2])).run()
+    _widget(app, "text_area", "Extra Context").set_value("Known trigger: new CFO").run()
+    _button(app, "💾 Save Current Prospect").click().run()
+    assert not app.exception
+
+    _button(app, "🔄 Reset All Fields").click().run()
+    assert _widget(app, "selectbox", "Transaction Type").value == ""
+    assert app.session_state.company_name == ""
+
+    _widget(app, "selectbox", "Preset").set_value("ABC Corporation").run()
+    _button(app, "📂 Load Preset").click().run()
+    assert not app.exception
+    assert _widget(app, "text_input", "Company Name").value == "ABC Corporation"
+    assert _widget(app, "selectbox", "Transaction Type").value == TRANSACTION_TYPE_OPTIONS[1]
+    assert _widget(app, "selectbox", "Company Size").value == REVENUE_SIZE_OPTIONS[2]
+    assert _widget(app, "multiselect", "Geographic Scope").value == list(GEOGRAPHIC_OPTIONS[:2])
+    assert _widget(app, "text_area", "Extra Context").value == "Known trigger: new CFO"
+
+
+def test_debug_mode_from_query_param(app):
+    assert not any("Metrics" in expander.label for expander in app.expander)
+    app.query_params["debug"] = "1"
+    app.run()
+    assert not app.exception
+    assert any("Metrics" in expander.label for expander in app.expander)
+
+
+def test_fit_report_names_phases_by_their_number(app):
+    _widget(app, "text_input", "Company Name").set_value("ABC Corporation").run()
+    _widget(app, "text_area", "Extra Context").set_value(" ".join(["A long note about the prospect."] * 200)).run()
+    _widget(app, "number_input", "Token budget").set_value(100).run()
+    _button(app, "✨ Generate Full Workflow").click().run()
+    assert not app.exception
+    shortened = next(info.value for info in app.info if "shortened to fit" in info.value)
+    assert "Phase 2.5" in shortened and "Phase 6" in shortened and "Phase 7" not in shortened
+    over = next(warning.value for warning in app.warning if "Still over the token budget" in warning.value)
+    assert "Phase 3, " in over and "Phase 2.5" in over
+
+
+def test_profile_query_param_needs_the_server_flag(app, monkeypatch):
+    monkeypatch.delenv("APP_PROFILE", raising=False)
+    monkeypatch.delenv("APP_PROFILE_ALLOW", raising=False)
+    app.query_params["profile"] = "1"
+    app.run()
+    assert not any("Profiler" in expander.label for expander in app.expander)
+
+    monkeypatch.setenv("APP_PROFILE_ALLOW", "1")
+    app.run()
+    assert not app.exception
+    assert any("Profiler" in expander.label for expander in app.expander)
+    assert not tracemalloc.is_tracing()
+
+
+def test_rerun_is_not_profiled_while_another_session_is(app, monkeypatch):
+    from components import profiling
+
+    monkeypatch.setenv("APP_PROFILE", "1")
+    with profiling._profiler_lock:  # another session's rerun in progress
+        app.run()
+    assert not app.exception
+    assert any("was not profiled" in info.value for info in app.info)
+    assert "rerun_profiles" in app.session_state and not app.session_state["rerun_profiles"]
+
+
+def test_dossier_is_built_only_on_download(app):
+    from components.dossier import DOSSIER_CACHE
+
+    _widget(app, "text_input", "Company Name").set_value("Dossier Test Co").run()
+    before = DOSSIER_CACHE.stats()
+    _button(app, "✨ Generate Full Workflow").click().run()
+    assert not app.exception
+    assert DOSSIER_CACHE.stats().misses == before.misses
+
+
+def test_full_workflow_shows_each_prompt_once(app):
+    from components.recipes import PHASE_REGISTRY, PromptRecipeManager, ProspectContext
+
+    _widget(app, "text_input", "Company Name").set_value("Once Co").run()
+    _button(app, "✨ Generate Full Workflow").click().run()
+    assert not app.exception
+    shown = [code.value for code in app.code]
+    expected = PromptRecipeManager.generate_full_workflow(ProspectContext(company_name="Once Co"))
+    assert len(shown) == len(PHASE_REGISTRY)
+    assert shown == list(expected.values())